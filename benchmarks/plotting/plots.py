@@ -0,0 +1,285 @@
+"""
+Benchmarks for the plotting methods.
+
+Every plot is split into two phases: The compute phase covers everything until the plot backend is called (e.g.
+computing histograms or correlations), and the render phase covers the backend call itself. Both phases are measured
+separately for tables of different sizes and cardinalities.
+
+Results are compared against a baseline, and the script exits with status 1 if any measurement got worse by more than
+the tolerance. Run it from the root of the repository:
+
+    python -m benchmarks.plotting.plots                    # Compare against the baseline
+    python -m benchmarks.plotting.plots --update-baseline  # Store the current results as new baseline
+
+Timings depend on the machine, so the baseline should be updated whenever the machine changes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+
+from benchmarks.table.utils import create_synthetic_table
+from safeds._config import _get_plot_backend, _set_plot_backend
+from safeds._utils import _figure_to_image
+from safeds.data.tabular.containers import Table
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+REPETITIONS = 3
+NUMBERS_OF_ROWS = [1_000, 100_000]
+NUMBERS_OF_COLUMNS = [1, 10]
+CARDINALITIES = [10, 1_000]
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+# Differences below these limits are noise, no matter how large they are relative to the baseline
+MINIMUM_TIME_DIFFERENCE = 0.005  # seconds
+MINIMUM_MEMORY_DIFFERENCE = 1024 * 1024  # bytes
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Measurement
+# ----------------------------------------------------------------------------------------------------------------------
+
+
+class _PhaseRecorder:
+    """
+    Wrap a plot backend and record the time and peak memory that is spent inside and outside its methods.
+
+    Memory is measured with tracemalloc, so it includes Python objects and numpy arrays, but not memory that polars or
+    torch allocate natively. The peak memory of a phase is relative to the memory in use when the phase began, so memory
+    that an earlier phase left allocated does not count.
+    """
+
+    def __init__(self, backend: Any) -> None:
+        self._backend = backend
+        self._phase_start_memory = 0
+        self.render_time = 0.0
+        self.compute_memory = 0
+        self.render_memory = 0
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self._backend, name)
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            self._record_compute_memory()
+
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.render_time += time.perf_counter() - start
+                if tracemalloc.is_tracing():
+                    self.render_memory = max(self.render_memory, self._end_phase())
+
+        return wrapper
+
+    def _start_tracing(self) -> None:
+        tracemalloc.start()
+        self._end_phase()
+
+    def _record_compute_memory(self) -> None:
+        if tracemalloc.is_tracing():
+            self.compute_memory = max(self.compute_memory, self._end_phase())
+
+    def _end_phase(self) -> int:
+        # Return the peak of the phase that ends now, and start the next one
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        peak_of_phase = peak - self._phase_start_memory
+        self._phase_start_memory = current
+        return peak_of_phase
+
+
+def _measure(plot: Callable[[], Any], backend: Any) -> dict[str, float]:
+    """Measure the fastest of several runs, and the peak memory of one more run with tracemalloc."""
+    try:
+        compute_times = []
+        render_times = []
+        for _ in range(REPETITIONS):
+            recorder = _PhaseRecorder(backend)
+            _set_plot_backend(recorder)
+            start = time.perf_counter()
+            plot()
+            total_time = time.perf_counter() - start
+            compute_times.append(total_time - recorder.render_time)
+            render_times.append(recorder.render_time)
+
+        # Tracing slows down Python code a lot, so memory is measured in a separate run
+        recorder = _PhaseRecorder(backend)
+        _set_plot_backend(recorder)
+        recorder._start_tracing()
+        try:
+            plot()
+            recorder._record_compute_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        _set_plot_backend(None)
+
+    return {
+        "compute_time": min(compute_times),
+        "render_time": min(render_times),
+        "compute_memory": recorder.compute_memory,
+        "render_memory": recorder.render_memory,
+    }
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Cases
+# ----------------------------------------------------------------------------------------------------------------------
+
+
+def _create_cases() -> dict[str, tuple[Callable[[], Any], Any]]:
+    """Create the plots to measure by name, each with the backend whose calls make up the render phase."""
+    backend = _get_plot_backend()
+    cases: dict[str, tuple[Callable[[], Any], Any]] = {}
+
+    for number_of_rows, number_of_columns, cardinality in itertools.product(
+        NUMBERS_OF_ROWS,
+        NUMBERS_OF_COLUMNS,
+        CARDINALITIES,
+    ):
+        table = create_synthetic_table(number_of_rows, number_of_columns, max_value=cardinality)
+        # Collect once, so reading the data is not part of the measurements
+        table = Table._from_polars_data_frame(table._data_frame)
+        x_name = table.column_names[0]
+        y_name = table.column_names[-1]
+
+        suffix = f"[rows={number_of_rows},columns={number_of_columns},cardinality={cardinality}]"
+        cases[f"histograms{suffix}"] = (table.plot.histograms, backend)
+        cases[f"box_plots{suffix}"] = (table.plot.box_plots, backend)
+        cases[f"correlation_heatmap{suffix}"] = (table.plot.correlation_heatmap, backend)
+        cases[f"scatter_plot{suffix}"] = (_bind(table.plot.scatter_plot, x_name, y_name), backend)
+        cases[f"line_plot{suffix}"] = (_bind(table.plot.line_plot, x_name, y_name), backend)
+        cases[f"lag_plot{suffix}"] = (_bind(table.get_column(x_name).plot.lag_plot, 1), backend)
+
+    for number_of_rows in NUMBERS_OF_ROWS:
+        cases[f"figure_to_image[rows={number_of_rows}]"] = (_bind(_plot_figure, number_of_rows), _FigureConverter())
+
+    return cases
+
+
+def _bind(function: Callable[..., Any], *args: Any) -> Callable[[], Any]:
+    return lambda: function(*args)
+
+
+def _plot_figure(number_of_points: int) -> None:
+    # Creating the figure counts as compute phase, converting it as render phase
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    values = np.random.default_rng(42).normal(size=number_of_points)
+    fig, ax = plt.subplots()
+    ax.plot(values)
+    _get_plot_backend()._figure_to_image(fig)
+
+
+class _FigureConverter:
+    # Stands in for the plot backend, so `_PhaseRecorder` measures `_figure_to_image` as render phase
+    @staticmethod
+    def _figure_to_image(fig: Any) -> Any:
+        return _figure_to_image(fig)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Baseline
+# ----------------------------------------------------------------------------------------------------------------------
+
+
+def _find_regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    regressions = []
+    for case, measurements in results.items():
+        if case not in baseline:
+            continue
+
+        for metric, value in measurements.items():
+            expected = baseline[case].get(metric)
+            if expected is None:
+                continue
+
+            minimum_difference = MINIMUM_TIME_DIFFERENCE if metric.endswith("time") else MINIMUM_MEMORY_DIFFERENCE
+            if value > expected * (1 + tolerance) and value - expected > minimum_difference:
+                regressions.append(f"{case} {metric}: {value:.4g} (baseline {expected:.4g})")
+
+    return regressions
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Main
+# ----------------------------------------------------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    import matplotlib as mpl
+
+    mpl.use("agg")
+
+    parser = argparse.ArgumentParser(description="Benchmark the plotting methods.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="The JSON file with the baseline.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as new baseline.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="The allowed relative increase of each measurement compared to the baseline.",
+    )
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this string.")
+    arguments = parser.parse_args()
+
+    # Run the benchmarks
+    results: dict[str, dict[str, float]] = {}
+    for case, (plot, backend) in _create_cases().items():
+        if arguments.filter in case:
+            results[case] = _measure(plot, backend)
+
+    # Print the results
+    with pl.Config(
+        tbl_rows=-1,
+        tbl_width_chars=200,
+        fmt_str_lengths=100,
+    ):
+        print(
+            Table(
+                {
+                    "case": list(results.keys()),
+                    "compute_time": [result["compute_time"] for result in results.values()],
+                    "render_time": [result["render_time"] for result in results.values()],
+                    "compute_memory_mib": [result["compute_memory"] / 2**20 for result in results.values()],
+                    "render_memory_mib": [result["render_memory"] / 2**20 for result in results.values()],
+                },
+            ),
+        )
+
+    # Compare against the baseline
+    if arguments.update_baseline:
+        baseline = json.loads(arguments.baseline.read_text()) if arguments.baseline.is_file() else {}
+        baseline.update(results)
+        arguments.baseline.write_text(json.dumps(baseline, indent=4, sort_keys=True) + "\n")
+        print(f"Stored baseline in {arguments.baseline}.")
+    elif not arguments.baseline.is_file():
+        print(f"No baseline found at {arguments.baseline}. Run with --update-baseline to create one.")
+    else:
+        regressions = _find_regressions(results, json.loads(arguments.baseline.read_text()), arguments.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} REGRESSION(S) compared to {arguments.baseline}:", file=sys.stderr)
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            sys.exit(1)
+
+        print(f"\nNo regressions compared to {arguments.baseline}.")
@@ -5,19 +5,28 @@ from typing import TYPE_CHECKING
 import apipkg
 
 if TYPE_CHECKING:
+    from ._plotting import _get_plot_backend, _get_plot_cache, _set_plot_backend, _set_plot_cache
     from ._torch import _get_device, _init_default_device, _set_default_device
 
 apipkg.initpkg(
     __name__,
     {
         "_get_device": "._torch:_get_device",
+        "_get_plot_backend": "._plotting:_get_plot_backend",
+        "_get_plot_cache": "._plotting:_get_plot_cache",
         "_init_default_device": "._torch:_init_default_device",
         "_set_default_device": "._torch:_set_default_device",
+        "_set_plot_backend": "._plotting:_set_plot_backend",
+        "_set_plot_cache": "._plotting:_set_plot_cache",
     },
 )
 
 __all__ = [
     "_get_device",
+    "_get_plot_backend",
+    "_get_plot_cache",
     "_init_default_device",
     "_set_default_device",
+    "_set_plot_backend",
+    "_set_plot_cache",
 ]
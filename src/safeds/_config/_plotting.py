@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from safeds.data.tabular.plotting._plot_backend import _PlotBackend
+    from safeds.data.tabular.plotting._plot_cache import _PlotCache
+
+
+_plot_backend: _PlotBackend | None = None
+_plot_cache: _PlotCache | None = None
+
+
+def _get_plot_backend() -> _PlotBackend:
+    from safeds.data.tabular.plotting._matplotlib_plot_backend import _MatplotlibPlotBackend
+
+    global _plot_backend  # noqa: PLW0603
+
+    if _plot_backend is None:
+        _plot_backend = _MatplotlibPlotBackend()
+
+    return _plot_backend
+
+
+def _set_plot_backend(backend: _PlotBackend | None) -> None:
+    # This changes all future plots. Passing None restores the default backend.
+    global _plot_backend  # noqa: PLW0603
+
+    _plot_backend = backend
+
+
+def _get_plot_cache() -> _PlotCache | None:
+    # Plots are only cached if a cache was set explicitly
+    return _plot_cache
+
+
+def _set_plot_cache(cache: _PlotCache | None) -> None:
+    # This changes all future plots. Passing None disables caching.
+    global _plot_cache  # noqa: PLW0603
+
+    _plot_cache = cache
@@ -5,13 +5,14 @@ from typing import TYPE_CHECKING
 import apipkg
 
 if TYPE_CHECKING:
-    from ._hashing import _structural_hash
+    from ._hashing import _content_hash, _structural_hash
     from ._plotting import _figure_to_image
     from ._random import _get_random_seed
 
 apipkg.initpkg(
     __name__,
     {
+        "_content_hash": "._hashing:_content_hash",
         "_structural_hash": "._hashing:_structural_hash",
         "_figure_to_image": "._plotting:_figure_to_image",
         "_get_random_seed": "._random:_get_random_seed",
@@ -19,6 +20,7 @@ apipkg.initpkg(
 )
 
 __all__ = [
+    "_content_hash",
     "_structural_hash",
     "_figure_to_image",
     "_get_random_seed",
@@ -1,7 +1,15 @@
+from __future__ import annotations
+
 import functools
 import operator
 import struct
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import polars as pl
+
+# Fixed seeds keep the value hashes of polars the same across processes
+_VALUE_HASH_SEEDS = (0x5AFE, 0xD5, 0xDA7A, 0x7AB1E)
 
 
 def _structural_hash(*values: Any) -> int:
@@ -23,6 +31,54 @@ def _structural_hash(*values: Any) -> int:
     return xxhash.xxh3_64(_value_to_bytes(values)).intdigest()
 
 
+def _content_hash(data_frame: pl.DataFrame) -> int:
+    """
+    Calculate a deterministic hash value of the names, types, and values of all columns of a data frame.
+
+    Unlike `_structural_hash` of the schema and row count, this changes whenever any value changes. First, polars hashes
+    the values of all columns in parallel. The Arrow buffers of these value hashes are then fed chunk by chunk into a
+    single xxhash. Since the value hashes do not depend on the memory layout, data frames that are equal according to
+    `DataFrame.equals` and have the same schema get the same hash value, even if one of them is a slice of a larger one
+    or consists of several chunks.
+
+    Parameters
+    ----------
+    data_frame:
+        The data frame to hash.
+
+    Returns
+    -------
+    hash:
+        Deterministic 128-bit hash value
+    """
+    import polars as pl
+    import xxhash
+
+    value_hashes = data_frame.select(
+        _to_hashable(pl.col(name), dtype).hash(*_VALUE_HASH_SEEDS) for name, dtype in data_frame.schema.items()
+    )
+
+    hasher = xxhash.xxh3_128()
+    hasher.update(_value_to_bytes(data_frame.columns))
+    hasher.update(_value_to_bytes([str(dtype) for dtype in data_frame.dtypes]))
+    hasher.update(_value_to_bytes(data_frame.height))
+    for column in value_hashes.to_arrow().columns:
+        for chunk in column.chunks:
+            # The value hashes have no missing values, so this is a view of exactly the values of the chunk
+            hasher.update(chunk.to_numpy(zero_copy_only=True))
+
+    return hasher.intdigest()
+
+
+def _to_hashable(column: pl.Expr, dtype: pl.DataType) -> pl.Expr:
+    import polars as pl
+
+    # Equal categorical columns can use different physical values, so we hash the strings instead
+    if dtype == pl.Categorical or isinstance(dtype, pl.Enum):
+        return column.cast(pl.String)
+    return column
+
+
 def _value_to_bytes(value: Any) -> bytes:
     """
     Convert any value to a deterministically hashable representation.
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import io
 from typing import TYPE_CHECKING
 
+from safeds._config import _get_device, _init_default_device
 from safeds.data.image.containers import Image
 
 if TYPE_CHECKING:
@@ -13,6 +13,9 @@ def _figure_to_image(figure: plt.Figure) -> Image:
     """
     Store the figure as an image and closes it.
 
+    The figure is rendered with Agg and the resulting RGBA buffer is used as pixel data directly. No PNG is encoded or
+    decoded here; the image only encodes itself if it is displayed or saved.
+
     Parameters
     ----------
     figure:
@@ -24,9 +27,15 @@ def _figure_to_image(figure: plt.Figure) -> Image:
         The figure as an image.
     """
     import matplotlib.pyplot as plt
+    import numpy as np
+    import torch
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    _init_default_device()
 
-    buffer = io.BytesIO()
-    figure.savefig(buffer, format="png")
+    canvas = figure.canvas if isinstance(figure.canvas, FigureCanvasAgg) else FigureCanvasAgg(figure)
+    canvas.draw()
+    pixels = np.asarray(canvas.buffer_rgba())  # Shape (height, width, 4), shares memory with the renderer
     plt.close(figure)  # Prevents the figure from being displayed directly
-    buffer.seek(0)
-    return Image.from_bytes(buffer.read())
+
+    return Image(image_tensor=torch.from_numpy(pixels).permute(2, 0, 1).to(_get_device()))
@@ -8,6 +8,7 @@ if TYPE_CHECKING:
     from ._check_bounds import _check_bounds, _ClosedBound, _OpenBound
     from ._check_columns_exist import _check_columns_exist
     from ._normalize_and_check_file_path import _normalize_and_check_file_path
+    from ._normalize_and_check_file_paths import _normalize_and_check_file_paths
 
 apipkg.initpkg(
     __name__,
@@ -17,6 +18,7 @@ apipkg.initpkg(
         "_OpenBound": "._check_bounds:_OpenBound",
         "_check_columns_exist": "._check_columns_exist:_check_columns_exist",
         "_normalize_and_check_file_path": "._normalize_and_check_file_path:_normalize_and_check_file_path",
+        "_normalize_and_check_file_paths": "._normalize_and_check_file_paths:_normalize_and_check_file_paths",
     },
 )
 
@@ -26,4 +28,5 @@ __all__ = [
     "_OpenBound",
     "_check_columns_exist",
     "_normalize_and_check_file_path",
+    "_normalize_and_check_file_paths",
 ]
@@ -37,10 +37,10 @@ def _check_columns_exist(table_or_schema: Table | Schema, requested_names: str |
     if len(requested_names) > 1:
         # Create a set for faster containment checks
         known_names: Container = set(table_or_schema.column_names)
+        unknown_names = [name for name in requested_names if name not in known_names]
     else:
-        known_names = table_or_schema.column_names
-
-    unknown_names = [name for name in requested_names if name not in known_names]
+        # Avoid listing all column names, since this is called for every column by `Schema.get_column_type`
+        unknown_names = [name for name in requested_names if not table_or_schema.has_column(name)]
     if unknown_names:
         message = _build_error_message(table_or_schema, unknown_names)
         raise ColumnNotFoundError(message)
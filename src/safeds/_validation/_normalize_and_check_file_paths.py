@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import glob
+from pathlib import Path
+
+from ._normalize_and_check_file_path import _normalize_and_check_file_path
+
+
+def _normalize_and_check_file_paths(
+    paths: str | Path | list[str | Path],
+    canonical_file_extension: str,
+    valid_file_extensions: list[str],
+) -> list[Path]:
+    """
+    Find all files the provided paths point to.
+
+    Each path can point to a file, a directory, or be a glob pattern (e.g. "data/**/*.csv"). Directories are searched
+    recursively. Only files with a valid extension are returned from directories and glob patterns, so other files, like
+    markers written by Spark, are skipped. Paths to files are checked like in `_normalize_and_check_file_path`.
+
+    Parameters
+    ----------
+    paths:
+        Paths to search.
+    canonical_file_extension:
+        If a path to a file has no extension, this extension will be added. Should include the leading dot.
+    valid_file_extensions:
+        The extensions of files that are returned. Should include the leading dots.
+
+    Returns
+    -------
+    normalized_paths:
+        The paths of all found files. The files of each directory and glob pattern are sorted.
+
+    Raises
+    ------
+    ValueError
+        If a path to a file has an extension that is not in the `valid_file_extensions` list.
+    FileNotFoundError
+        If a path to a file does not exist, or a directory or glob pattern does not contain any valid file.
+    """
+    if isinstance(paths, str | Path):
+        paths = [paths]
+
+    result: list[Path] = []
+    for path in paths:
+        if Path(path).is_dir():
+            candidates = Path(path).rglob("*")
+        elif glob.has_magic(str(path)):
+            # Path.glob does not support absolute patterns
+            candidates = (Path(match) for match in glob.glob(str(path), recursive=True))  # noqa: PTH207
+        else:
+            result.append(
+                _normalize_and_check_file_path(
+                    path,
+                    canonical_file_extension,
+                    valid_file_extensions,
+                    check_if_file_exists=True,
+                ),
+            )
+            continue
+
+        files = sorted(
+            candidate for candidate in candidates if candidate.is_file() and candidate.suffix in valid_file_extensions
+        )
+        if not files:
+            raise FileNotFoundError(f"No files with extension in {valid_file_extensions} found: {path}")
+        result.extend(files)
+
+    if not result:
+        raise FileNotFoundError("No paths were given.")
+
+    return result
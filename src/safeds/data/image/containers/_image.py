@@ -120,6 +120,10 @@ class Image:
     def __init__(self, image_tensor: Tensor) -> None:
         self._image_tensor: Tensor = image_tensor
 
+        # Encoding is expensive, so it only happens when needed and at most once per format (images are immutable)
+        self.__png_cache: bytes | None = None  # Scramble the name to prevent access from outside
+        self.__jpeg_cache: bytes | None = None  # Scramble the name to prevent access from outside
+
     def __eq__(self, other: object) -> bool:
         """
         Compare two images.
@@ -197,21 +201,11 @@ class Image:
         jpeg:
             The image as JPEG.
         """
-        import torch
-        from torchvision.transforms.v2 import functional as func2
-        from torchvision.utils import save_image
-
-        _init_default_device()
-
         if self.channel == 4:
             return None
-        buffer = io.BytesIO()
-        if self.channel == 1:
-            func2.to_pil_image(self._image_tensor, mode="L").save(buffer, format="jpeg")
-        else:
-            save_image(self._image_tensor.to(torch.float32) / 255, buffer, format="jpeg")
-        buffer.seek(0)
-        return buffer.read()
+        if self.__jpeg_cache is None:
+            self.__jpeg_cache = self._encode("jpeg")
+        return self.__jpeg_cache
 
     def _repr_png_(self) -> bytes:
         """
@@ -222,6 +216,11 @@ class Image:
         png:
             The image as PNG.
         """
+        if self.__png_cache is None:
+            self.__png_cache = self._encode("png")
+        return self.__png_cache
+
+    def _encode(self, format_: str) -> bytes:
         import torch
         from torchvision.transforms.v2 import functional as func2
         from torchvision.utils import save_image
@@ -230,9 +229,9 @@ class Image:
 
         buffer = io.BytesIO()
         if self.channel == 1:
-            func2.to_pil_image(self._image_tensor, mode="L").save(buffer, format="png")
+            func2.to_pil_image(self._image_tensor, mode="L").save(buffer, format=format_)
         else:
-            save_image(self._image_tensor.to(torch.float32) / 255, buffer, format="png")
+            save_image(self._image_tensor.to(torch.float32) / 255, buffer, format=format_)
         buffer.seek(0)
         return buffer.read()
 
@@ -301,19 +300,10 @@ class Image:
         path:
             The path to the JPEG file.
         """
-        import torch
-        from torchvision.transforms.v2 import functional as func2
-        from torchvision.utils import save_image
-
-        _init_default_device()
-
         if self.channel == 4:
             raise IllegalFormatError("png")
         Path(path).parent.mkdir(parents=True, exist_ok=True)
-        if self.channel == 1:
-            func2.to_pil_image(self._image_tensor, mode="L").save(path, format="jpeg")
-        else:
-            save_image(self._image_tensor.to(torch.float32) / 255, path, format="jpeg")
+        Path(path).write_bytes(self._repr_jpeg_())  # type: ignore[arg-type]
 
     def to_png_file(self, path: str | Path) -> None:
         """
@@ -324,17 +314,8 @@ class Image:
         path:
             The path to the PNG file.
         """
-        import torch
-        from torchvision.transforms.v2 import functional as func2
-        from torchvision.utils import save_image
-
-        _init_default_device()
-
         Path(path).parent.mkdir(parents=True, exist_ok=True)
-        if self.channel == 1:
-            func2.to_pil_image(self._image_tensor, mode="L").save(path, format="png")
-        else:
-            save_image(self._image_tensor.to(torch.float32) / 255, path, format="png")
+        Path(path).write_bytes(self._repr_png_())
 
     # ------------------------------------------------------------------------------------------------------------------
     # Transformations
@@ -3,7 +3,8 @@ from __future__ import annotations
 from collections.abc import Callable, Iterator, Sequence
 from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
 
-from safeds._utils import _structural_hash
+from safeds._utils import _content_hash, _structural_hash
+from safeds._validation import _check_bounds, _OpenBound
 from safeds.data.tabular.plotting import ColumnPlotter
 from safeds.data.tabular.typing._polars_data_type import _PolarsDataType
 from safeds.exceptions import (
@@ -18,6 +19,7 @@ from ._lazy_cell import _LazyCell
 if TYPE_CHECKING:
     from polars import Series
 
+    from safeds.data.tabular.plotting._quantile_sketch import _QuantileSketch
     from safeds.data.tabular.typing import DataType
 
     from ._cell import Cell
@@ -62,6 +64,8 @@ class Column(Sequence[T_co]):
     def _from_polars_series(data: Series) -> Column:
         result = object.__new__(Column)
         result._series = data
+        result.__fingerprint_cache = None
+        result.__quantile_sketch_cache = {}
         return result
 
     # ------------------------------------------------------------------------------------------------------------------
@@ -75,6 +79,8 @@ class Column(Sequence[T_co]):
             data = []
 
         self._series: pl.Series = pl.Series(name, data)
+        self.__fingerprint_cache: int | None = None
+        self.__quantile_sketch_cache: dict[float, _QuantileSketch] = {}
 
     def __contains__(self, item: Any) -> bool:
         return self._series.__contains__(item)
@@ -84,6 +90,15 @@ class Column(Sequence[T_co]):
             return NotImplemented
         if self is other:
             return True
+        if (
+            self.__fingerprint_cache is not None
+            and other.__fingerprint_cache is not None
+            and self.__fingerprint_cache != other.__fingerprint_cache
+            and self.name == other.name
+            and self._series.dtype == other._series.dtype
+        ):
+            # Columns with the same name and type and different fingerprints cannot be equal
+            return False
         return self._series.equals(other._series)
 
     @overload
@@ -672,50 +687,7 @@ class Column(Sequence[T_co]):
         | stability            | 0.50000 |
         +----------------------+---------+
         """
-        from ._table import Table
-
-        # TODO: turn this around (call table method, implement in table; allows parallelization)
-        if self.is_numeric:
-            values: list[Any] = [
-                self.min(),
-                self.max(),
-                self.mean(),
-                self.median(),
-                self.standard_deviation(),
-                self.distinct_value_count(),
-                self.idness(),
-                self.missing_value_ratio(),
-                self.stability(),
-            ]
-        else:
-            values = [
-                str(self.min() or "-"),
-                str(self.max() or "-"),
-                "-",
-                "-",
-                "-",
-                str(self.distinct_value_count()),
-                str(self.idness()),
-                str(self.missing_value_ratio()),
-                str(self.stability()),
-            ]
-
-        return Table(
-            {
-                "metric": [
-                    "min",
-                    "max",
-                    "mean",
-                    "median",
-                    "standard deviation",
-                    "distinct value count",
-                    "idness",
-                    "missing value ratio",
-                    "stability",
-                ],
-                self.name: values,
-            },
-        )
+        return self.to_table().summarize_statistics()
 
     def correlation_with(self, other: Column) -> float:
         """
@@ -883,13 +855,23 @@ class Column(Sequence[T_co]):
 
         return self._series.mean()
 
-    def median(self) -> T_co:
+    def median(self, *, rank_error: float | None = None) -> T_co:
         """
         Return the median of the values in the column.
 
         The median is the value in the middle of the sorted list of values. If the number of values is even, the median
         is the mean of the two middle values.
 
+        For very large columns, pass a `rank_error` to estimate the median with a quantile sketch instead of sorting all
+        values. The sketch is kept, so later estimates and approximate box plots of the column with the same
+        `rank_error` are almost free.
+
+        Parameters
+        ----------
+        rank_error:
+            If set, the median is estimated, and the estimate lies between the quantiles `0.5 - rank_error` and
+            `0.5 + rank_error`. Must be between 0 and 1 (both exclusive). If None, the median is exact. Default is None.
+
         Returns
         -------
         median:
@@ -899,6 +881,8 @@ class Column(Sequence[T_co]):
         ------
         TypeError
             If the column is not numeric.
+        OutOfBoundsError
+            If `rank_error` is not between 0 and 1.
 
         Examples
         --------
@@ -906,11 +890,16 @@ class Column(Sequence[T_co]):
         >>> column = Column("test", [1, 2, 3])
         >>> column.median()
         2.0
+        >>> column.median(rank_error=0.01)
+        2.0
         """
         if not self.is_numeric:
             raise NonNumericColumnError("")  # TODO: Add column name to error message
 
-        return self._series.median()
+        if rank_error is None:
+            return self._series.median()
+
+        return self._get_quantile_sketch(rank_error).quantile(0.5)
 
     def min(self) -> T_co | None:
         """
@@ -1117,6 +1106,39 @@ class Column(Sequence[T_co]):
 
         return self._series.var()
 
+    # ------------------------------------------------------------------------------------------------------------------
+    # Hashing
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def fingerprint(self) -> int:
+        """
+        Return a hash value of the name, type, and values of the column.
+
+        Unlike `hash(column)`, which only considers the name, the type, and the number of rows, the fingerprint changes
+        whenever any value changes. This makes it suitable as a key for caches. Columns that are equal get the same
+        fingerprint, no matter how their data is laid out in memory. Fingerprints are stable across processes, but may
+        change with the version of Safe-DS or polars.
+
+        The fingerprint is computed once. Later calls return the memoized result.
+
+        Returns
+        -------
+        fingerprint:
+            The 128-bit fingerprint of the column.
+
+        Examples
+        --------
+        >>> from safeds.data.tabular.containers import Column
+        >>> column1 = Column("a", [1, 2, 3])
+        >>> column2 = Column("a", [1, 2, 4])
+        >>> column1.fingerprint() == column2.fingerprint()
+        False
+        """
+        if self.__fingerprint_cache is None:
+            self.__fingerprint_cache = _content_hash(self._series.to_frame())
+
+        return self.__fingerprint_cache
+
     # ------------------------------------------------------------------------------------------------------------------
     # Export
     # ------------------------------------------------------------------------------------------------------------------
@@ -1181,3 +1203,39 @@ class Column(Sequence[T_co]):
             The generated HTML.
         """
         return self._series._repr_html_()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _get_quantile_sketch(self, rank_error: float) -> _QuantileSketch:
+        """
+        Return a quantile sketch of the values in this numeric column.
+
+        Sketches are cached, since the column is immutable.
+
+        Parameters
+        ----------
+        rank_error:
+            The maximum error of estimated quantiles, as a fraction of the number of values.
+
+        Returns
+        -------
+        sketch:
+            The sketch.
+
+        Raises
+        ------
+        OutOfBoundsError
+            If `rank_error` is not between 0 and 1.
+        """
+        from safeds.data.tabular.plotting._quantile_sketch import _QuantileSketch
+
+        _check_bounds("rank_error", rank_error, lower_bound=_OpenBound(0), upper_bound=_OpenBound(1))
+
+        if rank_error not in self.__quantile_sketch_cache:
+            sketch = _QuantileSketch(rank_error)
+            sketch.update(self._series.drop_nulls().to_numpy())
+            self.__quantile_sketch_cache[rank_error] = sketch
+
+        return self.__quantile_sketch_cache[rank_error]
@@ -4,9 +4,15 @@ from typing import TYPE_CHECKING, Any, Literal
 
 from safeds._config import _get_device, _init_default_device
 from safeds._config._polars import _get_polars_config
-from safeds._utils import _structural_hash
+from safeds._utils import _content_hash, _structural_hash
 from safeds._utils._random import _get_random_seed
-from safeds._validation import _check_bounds, _check_columns_exist, _ClosedBound, _normalize_and_check_file_path
+from safeds._validation import (
+    _check_bounds,
+    _check_columns_exist,
+    _ClosedBound,
+    _normalize_and_check_file_path,
+    _normalize_and_check_file_paths,
+)
 from safeds._validation._check_columns_dont_exist import _check_columns_dont_exist
 from safeds.data.labeled.containers import TabularDataset, TimeSeriesDataset
 from safeds.data.tabular.plotting import TablePlotter
@@ -15,6 +21,7 @@ from safeds.data.tabular.typing._polars_schema import _PolarsSchema
 from safeds.exceptions import (
     ColumnLengthMismatchError,
     DuplicateColumnError,
+    SchemaError,
 )
 
 from ._column import Column
@@ -22,14 +29,17 @@ from ._lazy_cell import _LazyCell
 from ._lazy_vectorized_row import _LazyVectorizedRow
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Mapping, Sequence
+    import tempfile
+    from collections.abc import Callable, Iterator, Mapping, Sequence
     from pathlib import Path
 
     import polars as pl
+    import pyarrow as pa
     import torch
     from torch import Tensor
     from torch.utils.data import DataLoader, Dataset
 
+    from safeds.data.tabular.plotting._quantile_sketch import _QuantileSketch
     from safeds.data.tabular.transformation import (
         InvertibleTableTransformer,
         TableTransformer,
@@ -39,6 +49,15 @@ if TYPE_CHECKING:
     from ._cell import Cell
     from ._row import Row
 
+# The number of rows that are converted to JSON at once when writing JSON files in a streaming fashion
+_JSON_BATCH_SIZE = 10_000
+
+# The number of rows in each record batch that is sent via the Arrow PyCapsule interface
+_ARROW_BATCH_SIZE = 65_536
+
+# The directory for tables that are cached on disk, see `Table.cache`
+_spill_directory: tempfile.TemporaryDirectory | None = None
+
 
 class Table:
     """
@@ -74,6 +93,105 @@ class Table:
     # Import
     # ------------------------------------------------------------------------------------------------------------------
 
+    @staticmethod
+    def from_arrow(data: pa.Table | pa.RecordBatch | Any) -> Table:
+        """
+        Create a table from Arrow data.
+
+        Besides pyarrow tables and record batches, any object that implements the Arrow PyCapsule stream interface
+        (`__arrow_c_stream__`) is accepted, e.g. the results of DuckDB queries. The buffers of the data are shared
+        instead of copied wherever possible.
+
+        Parameters
+        ----------
+        data:
+            The Arrow data.
+
+        Returns
+        -------
+        table:
+            The created table.
+
+        Raises
+        ------
+        TypeError
+            If the data cannot be converted to Arrow data.
+
+        Examples
+        --------
+        >>> import pyarrow as pa
+        >>> from safeds.data.tabular.containers import Table
+        >>> Table.from_arrow(pa.table({"a": [1, 2, 3], "b": [4, 5, 6]}))
+        +-----+-----+
+        |   a |   b |
+        | --- | --- |
+        | i64 | i64 |
+        +===========+
+        |   1 |   4 |
+        |   2 |   5 |
+        |   3 |   6 |
+        +-----+-----+
+        """
+        import polars as pl
+        import pyarrow as pa
+
+        if not isinstance(data, pa.Table | pa.RecordBatch):
+            data = pa.table(data)
+
+        # Rechunking would copy the data
+        return Table._from_polars_data_frame(pl.from_arrow(data, rechunk=False))
+
+    @staticmethod
+    def from_arrow_ipc_file(path: str | Path) -> Table:
+        """
+        Create a table from an Arrow IPC file (also known as Feather file).
+
+        The file is memory-mapped instead of read, so the data does not need to be parsed or copied. Opening even very
+        large files is almost instant, and the operating system loads only the pages that are actually used. Several
+        processes that open the same file share these pages. This works best for files that were written by
+        `to_arrow_ipc_file`, since compressed files must be decompressed into memory.
+
+        Parameters
+        ----------
+        path:
+            The path to the Arrow IPC file. If the file extension is omitted, it is assumed to be ".arrow".
+
+        Returns
+        -------
+        table:
+            The created table.
+
+        Raises
+        ------
+        FileNotFoundError
+            If no file exists at the given path.
+        ValueError
+            If the path has an extension that is not ".arrow", ".feather", or ".ipc".
+
+        Examples
+        --------
+        >>> from safeds.data.tabular.containers import Table
+        >>> Table.from_arrow_ipc_file("./src/resources/from_arrow_ipc_file.arrow")
+        +-----+-----+
+        |   a |   b |
+        | --- | --- |
+        | i64 | i64 |
+        +===========+
+        |   1 |   4 |
+        |   2 |   5 |
+        |   3 |   6 |
+        +-----+-----+
+        """
+        import polars as pl
+
+        path = _normalize_and_check_file_path(
+            path,
+            ".arrow",
+            [".arrow", ".feather", ".ipc"],
+            check_if_file_exists=True,
+        )
+        return Table._from_polars_lazy_frame(pl.scan_ipc(path, memory_map=True))
+
     @staticmethod
     def from_columns(columns: Column | list[Column]) -> Table:
         """
@@ -163,6 +281,72 @@ class Table:
 
         return Table._from_polars_lazy_frame(pl.scan_csv(path, separator=separator))
 
+    @staticmethod
+    def from_csv_files(
+        paths: str | Path | list[str | Path],
+        *,
+        separator: str = ",",
+        hive_partitioning: bool = True,
+    ) -> Table:
+        """
+        Create a table from several CSV files with the same columns.
+
+        Each path can point to a file, to a directory, or be a glob pattern like "data/**/*.csv". Directories are
+        searched recursively for files with the extension ".csv". The rows of all files are combined into one table.
+
+        Files are only read once the data is needed, and only the columns that are needed are parsed. Filters, e.g. from
+        `remove_rows_by_column`, are applied while reading.
+
+        Parameters
+        ----------
+        paths:
+            The paths to search for CSV files.
+        separator:
+            The separator between the values in the CSV files.
+        hive_partitioning:
+            Whether to add a column for each directory in the paths of the files that is named like "key=value"
+            (hive-style partitioning). Its name is the key, and its values are the values in the paths. The type of the
+            column is integer or float if all values are numbers, and string otherwise. Filters on these columns are
+            applied after reading the files, so they do not skip any files.
+
+        Returns
+        -------
+        table:
+            The created table.
+
+        Raises
+        ------
+        FileNotFoundError
+            If a file does not exist, or a directory or glob pattern does not contain any CSV file.
+        ValueError
+            If a path to a file has an extension that is not ".csv".
+
+        Examples
+        --------
+        >>> from safeds.data.tabular.containers import Table
+        >>> Table.from_csv_files(["./src/resources/from_csv_file.csv", "./src/resources/from_csv_file.csv"])
+        +-----+-----+-----+
+        |   a |   b |   c |
+        | --- | --- | --- |
+        | i64 | i64 | i64 |
+        +=================+
+        |   1 |   2 |   1 |
+        |   0 |   0 |   7 |
+        |   1 |   2 |   1 |
+        |   0 |   0 |   7 |
+        +-----+-----+-----+
+        """
+        import polars as pl
+
+        files = _normalize_and_check_file_paths(paths, ".csv", [".csv"])
+        return Table._from_polars_lazy_frame(
+            _scan_files(
+                files,
+                lambda partition_files: pl.scan_csv(partition_files, separator=separator),
+                hive_partitioning,
+            ),
+        )
+
     @staticmethod
     def from_dict(data: dict[str, list[Any]]) -> Table:
         """
@@ -287,11 +471,73 @@ class Table:
         path = _normalize_and_check_file_path(path, ".parquet", [".parquet"], check_if_file_exists=True)
         return Table._from_polars_lazy_frame(pl.scan_parquet(path))
 
+    @staticmethod
+    def from_parquet_files(paths: str | Path | list[str | Path], *, hive_partitioning: bool = True) -> Table:
+        """
+        Create a table from several Parquet files with the same columns.
+
+        Each path can point to a file, to a directory, or be a glob pattern like "data/**/*.parquet". Directories are
+        searched recursively for files with the extension ".parquet". The rows of all files are combined into one table.
+
+        Files are only read once the data is needed, and only the columns that are needed are read. Filters on the
+        columns in the files, e.g. from `remove_rows_by_column`, are checked against the statistics of the row groups, so
+        row groups without matching rows are skipped.
+
+        Parameters
+        ----------
+        paths:
+            The paths to search for Parquet files.
+        hive_partitioning:
+            Whether to add a column for each directory in the paths of the files that is named like "key=value"
+            (hive-style partitioning). Its name is the key, and its values are the values in the paths. The type of the
+            column is integer or float if all values are numbers, and string otherwise. Filters on these columns are
+            applied after reading the files, so they do not skip any files.
+
+        Returns
+        -------
+        table:
+            The created table.
+
+        Raises
+        ------
+        FileNotFoundError
+            If a file does not exist, or a directory or glob pattern does not contain any Parquet file.
+        ValueError
+            If a path to a file has an extension that is not ".parquet".
+
+        Examples
+        --------
+        >>> from safeds.data.tabular.containers import Table
+        >>> Table.from_parquet_files(["./src/resources/from_parquet_file.parquet"])
+        +-----+-----+
+        |   a |   b |
+        | --- | --- |
+        | i64 | i64 |
+        +===========+
+        |   1 |   4 |
+        |   2 |   5 |
+        |   3 |   6 |
+        +-----+-----+
+        """
+        import polars as pl
+
+        files = _normalize_and_check_file_paths(paths, ".parquet", [".parquet"])
+        return Table._from_polars_lazy_frame(
+            _scan_files(
+                files,
+                lambda partition_files: pl.scan_parquet(partition_files, hive_partitioning=False),
+                hive_partitioning,
+            ),
+        )
+
     @staticmethod
     def _from_polars_data_frame(data: pl.DataFrame) -> Table:
         result = object.__new__(Table)
         result._lazy_frame = data.lazy()
         result.__data_frame_cache = data
+        result.__number_of_rows_cache = None
+        result.__fingerprint_cache = None
+        result.__quantile_sketch_cache = {}
         return result
 
     @staticmethod
@@ -299,6 +545,9 @@ class Table:
         result = object.__new__(Table)
         result._lazy_frame = data
         result.__data_frame_cache = None
+        result.__number_of_rows_cache = None
+        result.__fingerprint_cache = None
+        result.__quantile_sketch_cache = {}
         return result
 
     # ------------------------------------------------------------------------------------------------------------------
@@ -324,12 +573,23 @@ class Table:
         # Implementation
         self._lazy_frame: pl.LazyFrame = pl.LazyFrame(data)
         self.__data_frame_cache: pl.DataFrame | None = None  # Scramble the name to prevent access from outside
+        self.__number_of_rows_cache: int | None = None
+        self.__fingerprint_cache: int | None = None
+        self.__quantile_sketch_cache: dict[tuple[str, float], _QuantileSketch] = {}
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Table):
             return NotImplemented
         if self is other:
             return True
+        if (
+            self.__fingerprint_cache is not None
+            and other.__fingerprint_cache is not None
+            and self.__fingerprint_cache != other.__fingerprint_cache
+            and self.schema == other.schema
+        ):
+            # Tables with the same schema and different fingerprints cannot be equal, so we can skip comparing values
+            return False
 
         return self._data_frame.equals(other._data_frame)
 
@@ -403,7 +663,9 @@ class Table:
         """
         The number of rows in the table.
 
-        **Note:** This operation must fully load the data into memory, which can be expensive.
+        The rows are counted without loading the data into memory if possible. For tables that were just read from a
+        Parquet file, the count is taken from the metadata of the file. Otherwise, only as much of the query is run as
+        is needed to count the rows. The result is cached.
 
         Examples
         --------
@@ -412,7 +674,23 @@ class Table:
         >>> table.number_of_rows
         3
         """
-        return self._data_frame.height
+        import polars as pl
+
+        if self.__data_frame_cache is not None:
+            return self.__data_frame_cache.height
+        if self.number_of_columns == 0:
+            return 0
+
+        if self.__number_of_rows_cache is None:
+            try:
+                # Projection pushdown removes all columns from the query, and polars answers plain scans of Parquet or
+                # CSV files from their metadata or by counting lines
+                self.__number_of_rows_cache = self._lazy_frame.select(pl.len()).collect().item()
+            except (pl.NoDataError, pl.PolarsPanicError):
+                # Can happen for some operations on empty tables (e.g. https://github.com/pola-rs/polars/issues/16202)
+                return 0
+
+        return self.__number_of_rows_cache
 
     @property
     def plot(self) -> TablePlotter:
@@ -444,7 +722,8 @@ class Table:
         **Notes:**
 
         - The original table is not modified.
-        - This operation must fully load the data into memory, which can be expensive.
+        - The table is not loaded into memory. Only its number of rows is computed, which usually does not need to
+          load the data either.
 
         Parameters
         ----------
@@ -460,7 +739,7 @@ class Table:
         ------
         ValueError
             If a column name already exists.
-        ValueError
+        ColumnLengthMismatchError
             If the columns have incompatible lengths.
 
         Examples
@@ -487,14 +766,17 @@ class Table:
         if len(columns) == 0:
             return self
 
+        _check_columns_dont_exist(self, [column.name for column in columns])
+
         try:
-            return Table._from_polars_data_frame(
-                self._data_frame.hstack([column._series for column in columns]),
-            )
+            new_columns = pl.DataFrame([column._series for column in columns]).lazy()
         except pl.DuplicateError:
-            # polars already validates this, so we don't need to do it again upfront (performance)
-            _check_columns_dont_exist(self, [column.name for column in columns])
-            return Table()  # pragma: no cover
+            names = [column.name for column in columns]
+            raise DuplicateColumnError(next(name for name in names if names.count(name) > 1)) from None
+
+        return Table._from_polars_lazy_frame(
+            _concat_horizontally(self, Table._from_polars_lazy_frame(new_columns)),
+        )
 
     def add_computed_column(
         self,
@@ -1010,6 +1292,45 @@ class Table:
 
     # TODO: Rethink group_rows/group_rows_by_column. They should not return a dict.
 
+    def iter_batches(self, batch_size: int) -> Iterator[Table]:
+        """
+        Iterate over the rows of the table in batches.
+
+        Each batch is a table with `batch_size` rows, except for the last one, which can be smaller. The batches are
+        taken from a memory-mapped file, so only the batches that are currently used occupy memory. This allows
+        processing tables that are larger than the available memory, e.g. tables that were read lazily from a large
+        file. Before the first batch is returned, the table is computed once and written to a temporary file, unless it
+        has already been loaded into memory.
+
+        **Note:** The original table is not modified.
+
+        Parameters
+        ----------
+        batch_size:
+            The maximum number of rows per batch. Must be positive.
+
+        Returns
+        -------
+        batches:
+            An iterator over the batches.
+
+        Raises
+        ------
+        OutOfBoundsError
+            If `batch_size` is less than 1.
+
+        Examples
+        --------
+        >>> from safeds.data.tabular.containers import Table
+        >>> table = Table({"a": [1, 2, 3, 4, 5]})
+        >>> [batch.get_column("a").to_list() for batch in table.iter_batches(2)]
+        [[1, 2], [3, 4], [5]]
+        """
+        _check_bounds("batch_size", batch_size, lower_bound=_ClosedBound(1))
+
+        # Validate the arguments immediately instead of once the iteration starts
+        return self._iter_batches(batch_size)
+
     def remove_duplicate_rows(self) -> Table:
         """
         Return a new table without duplicate rows.
@@ -1185,7 +1506,8 @@ class Table:
         **Notes:**
 
         - The original table is not modified.
-        - This operation must fully load the data into memory, which can be expensive.
+        - The means and standard deviations are computed in the same query that removes the rows, so the data is only
+          read once when it is needed.
 
         Parameters
         ----------
@@ -1223,18 +1545,21 @@ class Table:
         | null |   8 |
         +------+-----+
         """
-        if self.number_of_rows == 0:
-            return self  # polars raises a ComputeError for tables without rows
         if column_names is None:
             column_names = self.column_names
 
         import polars as pl
         import polars.selectors as cs
 
+        # Only the schema is needed to resolve the selector
+        numeric_column_names = self._lazy_frame.select(cs.numeric() & cs.by_name(column_names)).columns
+        if not numeric_column_names:
+            return self
+
+        # Aggregations in a filter are computed over all rows, before any of them are removed
+        columns = pl.col(numeric_column_names)
         non_outlier_mask = pl.all_horizontal(
-            self._data_frame.select(cs.numeric() & cs.by_name(column_names)).select(
-                pl.all().is_null() | (((pl.all() - pl.all().mean()) / pl.all().std()).abs() <= z_score_threshold),
-            ),
+            columns.is_null() | (((columns - columns.mean()) / columns.std()).abs() <= z_score_threshold),
         )
 
         return Table._from_polars_lazy_frame(
@@ -1267,11 +1592,13 @@ class Table:
         |   1 |   4 |
         +-----+-----+
         """
-        return Table._from_polars_data_frame(
-            self._data_frame.sample(
-                fraction=1,
-                shuffle=True,
-                seed=_get_random_seed(),
+        import polars as pl
+
+        # Gathering all columns with the same permutation keeps the rows together, and gives the same order as
+        # `DataFrame.sample` for the same seed
+        return Table._from_polars_lazy_frame(
+            self._lazy_frame.select(
+                pl.all().gather(pl.int_range(0, pl.len()).shuffle(seed=_get_random_seed())),
             ),
         )
 
@@ -1448,6 +1775,7 @@ class Table:
 
         - The original table is not modified.
         - By default, the rows are shuffled before splitting. You can disable this by setting `shuffle` to False.
+        - The data is not loaded into memory. Only the number of rows is computed upfront, which is cheap for files.
 
         Parameters
         ----------
@@ -1500,8 +1828,9 @@ class Table:
             upper_bound=_ClosedBound(1),
         )
 
+        # The original table knows its number of rows more often than the shuffled one
+        number_of_rows_in_first = round(percentage_in_first * self.number_of_rows)
         input_table = self.shuffle_rows() if shuffle else self
-        number_of_rows_in_first = round(percentage_in_first * input_table.number_of_rows)
 
         return (
             input_table.slice_rows(length=number_of_rows_in_first),
@@ -1519,7 +1848,8 @@ class Table:
         **Notes:**
 
         - The original tables are not modified.
-        - This operation must fully load the data into memory, which can be expensive.
+        - The tables are not loaded into memory. Only their numbers of rows are computed, which usually does not need
+          to load the data either.
 
         Parameters
         ----------
@@ -1531,6 +1861,13 @@ class Table:
         new_table:
             The table with the columns added.
 
+        Raises
+        ------
+        DuplicateColumnError
+            If a column name already exists.
+        ColumnLengthMismatchError
+            If the tables have a different number of rows.
+
         Examples
         --------
         >>> from safeds.data.tabular.containers import Table
@@ -1547,10 +1884,10 @@ class Table:
         |   3 |   6 |
         +-----+-----+
         """
-        # TODO: raises?
+        _check_columns_dont_exist(self, other.column_names)
 
-        return Table._from_polars_data_frame(
-            self._data_frame.hstack(other._data_frame),
+        return Table._from_polars_lazy_frame(
+            _concat_horizontally(self, other),
         )
 
     def add_table_as_rows(self, other: Table) -> Table:
@@ -1560,7 +1897,7 @@ class Table:
         **Notes:**
 
         - The original tables are not modified.
-        - This operation must fully load the data into memory, which can be expensive.
+        - The tables are not loaded into memory.
 
         Parameters
         ----------
@@ -1572,6 +1909,11 @@ class Table:
         new_table:
             The table with the rows added.
 
+        Raises
+        ------
+        SchemaError
+            If the tables have different column names, a different order of columns, or different column types.
+
         Examples
         --------
         >>> from safeds.data.tabular.containers import Table
@@ -1591,10 +1933,22 @@ class Table:
         |   6 |
         +-----+
         """
-        # TODO: raises?
+        import polars as pl
 
-        return Table._from_polars_data_frame(
-            self._data_frame.vstack(other._data_frame),
+        # A table without columns has no rows either
+        if self.number_of_columns == 0:
+            return other
+        if other.number_of_columns == 0:
+            return self
+
+        # Comparing the schemas does not need the data. polars would only fail once the data is used.
+        if self.schema != other.schema:
+            raise SchemaError(
+                f"The tables cannot be combined, since their schemas differ:\n{self.schema}\n{other.schema}",
+            )
+
+        return Table._from_polars_lazy_frame(
+            pl.concat([self._lazy_frame, other._lazy_frame], how="vertical"),
         )
 
     def inverse_transform_table(self, fitted_transformer: InvertibleTableTransformer) -> Table:
@@ -1677,6 +2031,135 @@ class Table:
     # Statistics
     # ------------------------------------------------------------------------------------------------------------------
 
+    def compute_correlation_matrix(self, *, maximum_number_of_rows: int | None = None) -> Table:
+        """
+        Return a table with the Pearson correlation between every pair of numeric columns.
+
+        The result has one column per numeric column of this table, and its rows are in the same order, so the value in
+        row i of column "b" is the correlation between the i-th numeric column and "b". Missing values are treated as 0,
+        and columns without variance have a correlation of NaN.
+
+        This is the matrix that is plotted by `table.plot.correlation_heatmap()`. It is computed in a single streaming
+        pass, so this also works for tables that are read from files larger than the memory.
+
+        Parameters
+        ----------
+        maximum_number_of_rows:
+            If the table has more rows, the correlations are estimated from a random sample of about this many rows.
+            Must be greater than or equal to 2. If None, all rows are used. Default is None.
+
+        Returns
+        -------
+        correlation_matrix:
+            The table with the correlations.
+
+        Raises
+        ------
+        OutOfBoundsError
+            If `maximum_number_of_rows` is less than 2.
+
+        Examples
+        --------
+        >>> from safeds.data.tabular.containers import Table
+        >>> table = Table({"a": [1, 2, 3], "b": [2, 4, 7], "c": ["x", "y", "z"]})
+        >>> table.compute_correlation_matrix()
+        +---------+---------+
+        |       a |       b |
+        |     --- |     --- |
+        |     f64 |     f64 |
+        +===================+
+        | 1.00000 | 0.99340 |
+        | 0.99340 | 1.00000 |
+        +---------+---------+
+        """
+        import polars as pl
+
+        from safeds.data.tabular.plotting._correlation import _compute_correlation_matrix
+
+        if maximum_number_of_rows is not None:
+            _check_bounds("maximum_number_of_rows", maximum_number_of_rows, lower_bound=_ClosedBound(2))
+
+        numeric_names = [name for name in self.column_names if self.get_column_type(name).is_numeric]
+        correlation_matrix = _compute_correlation_matrix(self, maximum_number_of_rows=maximum_number_of_rows)
+
+        return Table._from_polars_data_frame(
+            pl.DataFrame(
+                {name: correlation_matrix[:, index] for index, name in enumerate(numeric_names)},
+                schema=dict.fromkeys(numeric_names, pl.Float64),
+            ),
+        )
+
+    def compute_histograms(self, *, maximum_number_of_bins: int = 10) -> Table:
+        """
+        Return a table with the bins and counts of a histogram for every column.
+
+        Numeric columns with more distinct values than `maximum_number_of_bins` are split into equally wide bins, which
+        include their end but not their start. For all other columns, each distinct value gets its own bin, which starts
+        and ends at the value. Only the `maximum_number_of_bins` smallest values are kept in this case. Missing values
+        are ignored.
+
+        The bounds of the bins are floats if all columns are numeric. Otherwise, they are converted to strings.
+
+        These are the same histograms that are plotted by `table.plot.histograms()`. The data is streamed in chunks, so
+        this also works for tables that are read from files larger than the memory.
+
+        Parameters
+        ----------
+        maximum_number_of_bins:
+            The maximum number of bins per column. Must be greater than or equal to 1.
+
+        Returns
+        -------
+        histograms:
+            The table with the columns "column", "bin_start", "bin_end", and "count".
+
+        Raises
+        ------
+        OutOfBoundsError
+            If `maximum_number_of_bins` is less than 1.
+
+        Examples
+        --------
+        >>> from safeds.data.tabular.containers import Table
+        >>> table = Table({"a": [1, 2, 2, 4]})
+        >>> table.compute_histograms()
+        +--------+-----------+---------+-------+
+        | column | bin_start | bin_end | count |
+        | ---    |       --- |     --- |   --- |
+        | str    |       f64 |     f64 |   u32 |
+        +======================================+
+        | a      |   1.00000 | 1.00000 |     1 |
+        | a      |   2.00000 | 2.00000 |     2 |
+        | a      |   4.00000 | 4.00000 |     1 |
+        +--------+-----------+---------+-------+
+        """
+        import polars as pl
+
+        from safeds.data.tabular.plotting._histograms import _compute_histograms
+
+        _check_bounds("maximum_number_of_bins", maximum_number_of_bins, lower_bound=_ClosedBound(1))
+
+        histograms = _compute_histograms(self, maximum_number_of_bins)
+        bound_type = pl.Float64 if all(self.get_column_type(name).is_numeric for name in histograms) else pl.String
+
+        if len(histograms) == 0:
+            return Table._from_polars_data_frame(
+                pl.DataFrame(
+                    schema={"column": pl.String, "bin_start": bound_type, "bin_end": bound_type, "count": pl.UInt32},
+                ),
+            )
+
+        return Table._from_polars_data_frame(
+            pl.concat(
+                histogram.select(
+                    pl.lit(name, dtype=pl.String).alias("column"),
+                    pl.col("bin_start", "bin_end").cast(bound_type),
+                    pl.col("count").cast(pl.UInt32),
+                )
+                for name, histogram in histograms.items()
+            ),
+        )
+
     def summarize_statistics(self) -> Table:
         """
         Return a table with important statistics about this table.
@@ -1707,20 +2190,268 @@ class Table:
         | stability            | 0.50000 |
         +----------------------+---------+
         """
+        import polars as pl
+
         if self.number_of_columns == 0:
             return Table()
 
-        head = self.get_column(self.column_names[0]).summarize_statistics()
-        tail = [self.get_column(name).summarize_statistics().get_column(name)._series for name in self.column_names[1:]]
+        # All metrics of all columns are computed in a single query, so polars can compute them in parallel and must
+        # read the data only once. Expressions are named by the index of their column, since names may contain anything.
+        expressions = [pl.len().alias("len")]
+        for index, (name, dtype) in enumerate(self._lazy_frame.schema.items()):
+            column = pl.col(name)
+            non_missing = column.drop_nulls()
+
+            if dtype in (pl.Null, pl.Object) or dtype.is_nested():
+                # polars cannot compute the minimum and maximum of these types
+                expressions += [pl.lit(None).alias(f"{index}_min"), pl.lit(None).alias(f"{index}_max")]
+            else:
+                expressions += [column.min().alias(f"{index}_min"), column.max().alias(f"{index}_max")]
+
+            if dtype.is_numeric():
+                expressions += [
+                    column.mean().alias(f"{index}_mean"),
+                    column.median().alias(f"{index}_median"),
+                    column.std().alias(f"{index}_standard_deviation"),
+                ]
+
+            expressions += [
+                non_missing.n_unique().alias(f"{index}_distinct_value_count"),
+                column.n_unique().alias(f"{index}_distinct_value_count_with_missing_values"),
+                column.null_count().alias(f"{index}_missing_value_count"),
+                non_missing.unique_counts().max().alias(f"{index}_mode_count"),
+            ]
+
+        row = self._lazy_frame.select(expressions).collect().row(0, named=True)
+
+        columns = [
+            pl.Series(
+                "metric",
+                [
+                    "min",
+                    "max",
+                    "mean",
+                    "median",
+                    "standard deviation",
+                    "distinct value count",
+                    "idness",
+                    "missing value ratio",
+                    "stability",
+                ],
+                dtype=pl.String,
+            ),
+        ]
+        for index, (name, dtype) in enumerate(self._lazy_frame.schema.items()):
+            columns.append(_to_statistics_series(name, dtype, row, index))
 
-        return Table._from_polars_data_frame(
-            head._lazy_frame.collect().hstack(tail, in_place=True),
-        )
+        return Table._from_polars_data_frame(pl.DataFrame(columns))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Materialization
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def cache(self, *, memory_limit: int | None = None) -> Table:
+        """
+        Compute the table once and return a table that reuses the result.
+
+        Operations on tables are lazy: They only extend a query, which is run whenever data is needed. Tables that are
+        derived from the same table each run the shared part of their queries again, e.g. they read the same file
+        again. The returned table, and all tables that are derived from it, start from the computed data instead.
+
+        **Note:** The original table is not changed.
+
+        Parameters
+        ----------
+        memory_limit:
+            The size in bytes up to which the computed data is kept in memory. Larger results are written to a temporary
+            Arrow IPC file instead, which is memory-mapped, so the operating system can remove its pages from memory
+            again. The file is deleted once no table uses its data anymore. If None, the computed data is always kept in
+            memory.
+
+        Returns
+        -------
+        cached_table:
+            A table with the same data that starts from the computed data.
+
+        Raises
+        ------
+        OutOfBoundsError
+            If `memory_limit` is negative.
+
+        Examples
+        --------
+        >>> from safeds.data.tabular.containers import Table
+        >>> table = Table({"a": [1, 2, 3]}).remove_rows_by_column("a", lambda cell: cell > 2).cache()
+        >>> print(table.explain())
+        DF ["a"]; PROJECT */1 COLUMNS; SELECTION: None
+        """
+        import polars as pl
+
+        _check_bounds("memory_limit", memory_limit, lower_bound=_ClosedBound(0))
+
+        data_frame = self.__data_frame_cache
+        if memory_limit is None or self.number_of_columns == 0:
+            return Table._from_polars_data_frame(self._data_frame)
+        if data_frame is not None and data_frame.estimated_size() <= memory_limit:
+            return Table._from_polars_data_frame(data_frame)
+
+        path = _create_spill_file()
+        if data_frame is not None:
+            data_frame.write_ipc(path, compression="uncompressed")
+        else:
+            # Sinking the query keeps large results out of memory, unlike collecting them first
+            self._write(
+                lambda lazy_frame: lazy_frame.sink_ipc(path, compression=None),
+                lambda data_frame: data_frame.write_ipc(path, compression="uncompressed"),
+                streaming=True,
+            )
+
+        # Uncompressed IPC files are about as large as the data in memory
+        if path.stat().st_size <= memory_limit:
+            data_frame = pl.read_ipc(path, memory_map=False)
+            path.unlink()
+            return Table._from_polars_data_frame(data_frame)
+
+        # The buffers of the data frame are views of the mapped file. They are shared with all tables derived from the
+        # result, so the file must exist as long as any of these tables does.
+        result = Table._from_polars_data_frame(pl.read_ipc(path, memory_map=True))
+        try:
+            # The mapping keeps the data of a removed file until polars drops the last buffer, so the file can be
+            # removed right away
+            path.unlink()
+        except PermissionError:  # pragma: no cover
+            import weakref
+
+            # Windows does not allow removing mapped files. We retry once the result is garbage collected. If derived
+            # tables still use the file, it is removed with the spill directory when the process exits.
+            weakref.finalize(result, _remove_spill_file, path)
+
+        return result
+
+    def explain(self) -> str:
+        """
+        Return the query that is run when the data of the table is needed.
+
+        The query is shown after optimization, as a tree where the data flows from the bottom to the top. Leaves show
+        where the data comes from, e.g. a file scan or data that is already in memory ("DF"). Leaves that read the same
+        file appear in the queries of all tables that are derived from it, unless it was cached with `cache`.
+
+        Returns
+        -------
+        query:
+            A description of the query.
+
+        Examples
+        --------
+        >>> from safeds.data.tabular.containers import Table
+        >>> table = Table({"a": [1, 2, 3], "b": [4, 5, 6]})
+        >>> print(table.remove_rows_by_column("a", lambda cell: cell > 1).remove_columns("b").explain())
+        DF ["a", "b"]; PROJECT 1/2 COLUMNS; SELECTION: [(col("a")) <= (1)]
+        """
+        return self._lazy_frame.explain()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Hashing
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def fingerprint(self) -> int:
+        """
+        Return a hash value of the names, types, and values of all columns.
+
+        Unlike `hash(table)`, which only considers the schema and the number of rows, the fingerprint changes whenever
+        any value changes. This makes it suitable as a key for caches. Tables that are equal get the same fingerprint,
+        no matter how their data is laid out in memory. Fingerprints are stable across processes, but may change with
+        the version of Safe-DS or polars.
+
+        The data is loaded into memory and hashed once. Later calls return the memoized result. Equality checks of two
+        tables whose fingerprints are known are then almost free if the tables differ.
+
+        Returns
+        -------
+        fingerprint:
+            The 128-bit fingerprint of the table.
+
+        Examples
+        --------
+        >>> from safeds.data.tabular.containers import Table
+        >>> table1 = Table({"a": [1, 2, 3]})
+        >>> table2 = Table({"a": [1, 2, 4]})
+        >>> table1.fingerprint() == table2.fingerprint()
+        False
+        """
+        if self.__fingerprint_cache is None:
+            self.__fingerprint_cache = _content_hash(self._data_frame)
+
+        return self.__fingerprint_cache
 
     # ------------------------------------------------------------------------------------------------------------------
     # Export
     # ------------------------------------------------------------------------------------------------------------------
 
+    def to_arrow(self) -> pa.Table:
+        """
+        Return the data of the table as a pyarrow table.
+
+        The buffers of numeric and boolean columns are shared with the table instead of copied. To hand the table to a
+        library that supports the Arrow PyCapsule stream interface, like DuckDB, the table can also be passed directly.
+        It is then sent in batches without loading all data into memory first.
+
+        **Note:** This operation must fully load the data into memory, which can be expensive.
+
+        Returns
+        -------
+        arrow_table:
+            The pyarrow table.
+
+        Examples
+        --------
+        >>> from safeds.data.tabular.containers import Table
+        >>> table = Table({"a": [1, 2, 3], "b": [4, 5, 6]})
+        >>> table.to_arrow().num_rows
+        3
+        """
+        return self._data_frame.to_arrow()
+
+    def to_arrow_ipc_file(self, path: str | Path, *, streaming: bool = True) -> None:
+        """
+        Write the table to an Arrow IPC file (also known as Feather file).
+
+        The file is not compressed and uses the same layout as the table in memory, so `from_arrow_ipc_file` can
+        memory-map it without copying any data. This makes it a good format for intermediate results that are loaded
+        repeatedly. However, the file is usually larger than a Parquet file with the same data.
+
+        If the file and/or the parent directories do not exist, they will be created. If the file exists already, it
+        will be overwritten.
+
+        Parameters
+        ----------
+        path:
+            The path to the Arrow IPC file. If the file extension is omitted, it is assumed to be ".arrow".
+        streaming:
+            Whether to write the table as it is computed, so it never has to fit into memory as a whole. If polars
+            cannot stream some operation that created the table, the table is loaded into memory instead. If False,
+            the table is always loaded into memory, which can be faster for small tables.
+
+        Raises
+        ------
+        ValueError
+            If the path has an extension that is not ".arrow", ".feather", or ".ipc".
+
+        Examples
+        --------
+        >>> from safeds.data.tabular.containers import Table
+        >>> table = Table({"a": [1, 2, 3], "b": [4, 5, 6]})
+        >>> table.to_arrow_ipc_file("./src/resources/to_arrow_ipc_file.arrow")
+        """
+        path = _normalize_and_check_file_path(path, ".arrow", [".arrow", ".feather", ".ipc"])
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._write(
+            lambda lazy_frame: lazy_frame.sink_ipc(path, compression=None),
+            lambda data_frame: data_frame.write_ipc(path, compression="uncompressed"),
+            streaming=streaming,
+        )
+
     def to_columns(self) -> list[Column]:
         """
         Return the data of the table as a list of columns.
@@ -1738,7 +2469,7 @@ class Table:
         """
         return [Column._from_polars_series(column) for column in self._data_frame.get_columns()]
 
-    def to_csv_file(self, path: str | Path) -> None:
+    def to_csv_file(self, path: str | Path, *, streaming: bool = True) -> None:
         """
         Write the table to a CSV file.
 
@@ -1749,6 +2480,10 @@ class Table:
         ----------
         path:
             The path to the CSV file. If the file extension is omitted, it is assumed to be ".csv".
+        streaming:
+            Whether to write the table as it is computed, so it never has to fit into memory as a whole. If polars
+            cannot stream some operation that created the table, the table is loaded into memory instead. If False,
+            the table is always loaded into memory, which can be faster for small tables.
 
         Raises
         ------
@@ -1764,7 +2499,11 @@ class Table:
         path = _normalize_and_check_file_path(path, ".csv", [".csv"])
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._lazy_frame.sink_csv(path)
+        self._write(
+            lambda lazy_frame: lazy_frame.sink_csv(path),
+            lambda data_frame: data_frame.write_csv(path),
+            streaming=streaming,
+        )
 
     def to_dict(self) -> dict[str, list[Any]]:
         """
@@ -1789,6 +2528,7 @@ class Table:
         path: str | Path,
         *,
         orientation: Literal["column", "row"] = "column",
+        streaming: bool = False,
     ) -> None:
         """
         Write the table to a JSON file.
@@ -1796,7 +2536,8 @@ class Table:
         If the file and/or the parent directories do not exist, they will be created. If the file exists already, it
         will be overwritten.
 
-        **Note:** This operation must fully load the data into memory, which can be expensive.
+        **Note:** Unless `streaming` is enabled, this operation must fully load the data into memory, which can be
+        expensive.
 
         Parameters
         ----------
@@ -1806,11 +2547,16 @@ class Table:
             The orientation of the JSON file. If "column", the JSON file will be structured as a list of columns. If
             "row", the JSON file will be structured as a list of rows. Row orientation is more human-readable, but
             slower and less memory-efficient.
+        streaming:
+            Whether to write the table in batches of rows (see `iter_batches`), so it never has to fit into memory as a
+            whole. This requires the "row" orientation.
 
         Raises
         ------
         ValueError
             If the path has an extension that is not ".json".
+        ValueError
+            If `streaming` is enabled for the "column" orientation.
 
         Examples
         --------
@@ -1818,13 +2564,30 @@ class Table:
         >>> table = Table({"a": [1, 2, 3], "b": [4, 5, 6]})
         >>> table.to_json_file("./src/resources/to_json_file_2.json")
         """
+        if streaming and orientation != "row":
+            raise ValueError("Only the row orientation can be written in a streaming fashion.")
+
         path = _normalize_and_check_file_path(path, ".json", [".json"])
         path.parent.mkdir(parents=True, exist_ok=True)
 
         # Write JSON to file
-        self._data_frame.write_json(path, row_oriented=(orientation == "row"))
-
-    def to_parquet_file(self, path: str | Path) -> None:
+        if not streaming:
+            self._data_frame.write_json(path, row_oriented=(orientation == "row"))
+            return
+
+        with path.open("w", encoding="utf-8") as file:
+            file.write("[")
+            is_first_batch = True
+            for batch in self.iter_batches(_JSON_BATCH_SIZE):
+                # Each batch is written as a list of rows, whose brackets we remove to join them into a single list
+                rows = batch._data_frame.write_json(row_oriented=True)[1:-1]
+                if not is_first_batch:
+                    file.write(",")
+                file.write(rows)
+                is_first_batch = False
+            file.write("]")
+
+    def to_parquet_file(self, path: str | Path, *, streaming: bool = True) -> None:
         """
         Write the table to a Parquet file.
 
@@ -1835,6 +2598,10 @@ class Table:
         ----------
         path:
             The path to the Parquet file. If the file extension is omitted, it is assumed to be ".parquet".
+        streaming:
+            Whether to write the table as it is computed, so it never has to fit into memory as a whole. If polars
+            cannot stream some operation that created the table, the table is loaded into memory instead. If False,
+            the table is always loaded into memory, which can be faster for small tables.
 
         Raises
         ------
@@ -1850,7 +2617,11 @@ class Table:
         path = _normalize_and_check_file_path(path, ".parquet", [".parquet"])
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._lazy_frame.sink_parquet(path)
+        self._write(
+            lambda lazy_frame: lazy_frame.sink_parquet(path),
+            lambda data_frame: data_frame.write_parquet(path),
+            streaming=streaming,
+        )
 
     def to_tabular_dataset(self, target_name: str, extra_names: list[str] | None = None) -> TabularDataset:
         """
@@ -1941,6 +2712,44 @@ class Table:
 
         return TimeSeriesDataset(self, target_name, time_name, extra_names)
 
+    # ------------------------------------------------------------------------------------------------------------------
+    # Arrow PyCapsule interface
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def __arrow_c_stream__(self, requested_schema: object | None = None) -> object:
+        """
+        Return a stream of Arrow record batches that conforms to the Arrow PyCapsule interface.
+
+        Generally, there is no reason to call this method directly. The Arrow PyCapsule interface allows libraries like
+        DuckDB or pyarrow to consume tabular data without copies. Unless the data is already in memory, the query of the
+        table is streamed to a temporary memory-mapped file, and batches are sent from there once they are requested.
+
+        The specification of the Arrow PyCapsule interface can be found
+        [here](https://arrow.apache.org/docs/format/CDataInterface/PyCapsuleInterface.html).
+
+        Parameters
+        ----------
+        requested_schema:
+            A PyCapsule with a schema that the consumer would like to receive. The data is cast to it if possible.
+
+        Returns
+        -------
+        stream:
+            A PyCapsule that contains an Arrow C stream.
+        """
+        import polars as pl
+        import pyarrow as pa
+
+        # The schema of an empty frame matches the one of the batches, without running the query
+        schema = pl.DataFrame(schema=self._lazy_frame.schema).to_arrow().schema
+        batches = (
+            record_batch
+            for batch in self._iter_batches(_ARROW_BATCH_SIZE)
+            for record_batch in batch._data_frame.to_arrow().to_batches()
+        )
+
+        return pa.RecordBatchReader.from_batches(schema, batches).__arrow_c_stream__(requested_schema)
+
     # ------------------------------------------------------------------------------------------------------------------
     # Dataframe interchange protocol
     # ------------------------------------------------------------------------------------------------------------------
@@ -2025,6 +2834,275 @@ class Table:
             generator=torch.Generator(device=_get_device()),
         )
 
+    def _iter_batches(self, batch_size: int) -> Iterator[Table]:
+        import tempfile
+        from pathlib import Path
+
+        import polars as pl
+
+        if self.number_of_columns == 0:
+            return
+
+        data_frame = self.__data_frame_cache
+        if data_frame is not None:
+            for batch in data_frame.iter_slices(batch_size):
+                yield Table._from_polars_data_frame(batch)
+            return
+
+        # The batches are views of the memory-mapped file, so it must exist until the iteration is finished
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+            path = Path(directory) / "batches.arrow"
+            try:
+                self._lazy_frame.sink_ipc(path, compression=None)
+                # The operating system can remove mapped pages from memory again, so this does not load the data
+                data_frame = pl.read_ipc(path, memory_map=True)
+            except pl.InvalidOperationError as error:
+                if not _is_unsupported_by_streaming_engine(error):
+                    raise
+                data_frame = self._data_frame
+
+            for batch in data_frame.iter_slices(batch_size):
+                yield Table._from_polars_data_frame(batch)
+
+    def _write(
+        self,
+        sink: Callable[[pl.LazyFrame], None],
+        write: Callable[[pl.DataFrame], None],
+        *,
+        streaming: bool,
+    ) -> None:
+        import polars as pl
+
+        # polars cannot sink a lazy frame without columns
+        if streaming and self.number_of_columns > 0:
+            try:
+                sink(self._lazy_frame)
+            except pl.InvalidOperationError as error:
+                if not _is_unsupported_by_streaming_engine(error):
+                    raise
+            else:
+                return
+
+        write(self._data_frame)
+
+    def _is_in_memory(self) -> bool:
+        """Check whether the data of the table can be loaded without reading any files."""
+        import re
+
+        import polars as pl
+
+        if self.__data_frame_cache is not None or self.__fingerprint_cache is not None:
+            return True
+
+        try:
+            # polars has no API for the sources of a query, but its plan contains a line for every scan of a file or
+            # Python source, like "Parquet SCAN path". Data frames in memory are listed as "DF [names]" instead.
+            plan = self._lazy_frame.explain(optimized=False)
+        except (pl.NoDataError, pl.PolarsPanicError):
+            # Can happen for some operations on empty tables (e.g. https://github.com/pola-rs/polars/issues/16202)
+            return True
+
+        return re.search(r"^\s*\w+ SCAN\b", plan, flags=re.MULTILINE) is None
+
+    def _get_quantile_sketches(self, column_names: list[str], rank_error: float) -> dict[str, _QuantileSketch]:
+        """
+        Return a quantile sketch for each of the given numeric columns.
+
+        Sketches are cached, since the table is immutable. Missing ones are built together in a single streaming pass.
+
+        Parameters
+        ----------
+        column_names:
+            The names of the numeric columns.
+        rank_error:
+            The maximum error of estimated quantiles, as a fraction of the number of values.
+
+        Returns
+        -------
+        sketches:
+            The sketch of each column by name.
+        """
+        from safeds.data.tabular.plotting._quantile_sketch import _compute_quantile_sketches
+
+        missing_names = [name for name in column_names if (name, rank_error) not in self.__quantile_sketch_cache]
+        if missing_names:
+            sketches = _compute_quantile_sketches(self._lazy_frame.select(missing_names), rank_error)
+            for name, sketch in sketches.items():
+                self.__quantile_sketch_cache[(name, rank_error)] = sketch
+
+        return {name: self.__quantile_sketch_cache[(name, rank_error)] for name in column_names}
+
+
+def _to_statistics_series(name: str, dtype: pl.DataType, row: dict[str, Any], index: int) -> pl.Series:
+    import polars as pl
+
+    number_of_rows = row["len"]
+    number_of_non_missing_values = number_of_rows - row[f"{index}_missing_value_count"]
+
+    # These definitions must match the ones of the corresponding methods of `Column`
+    minimum = row[f"{index}_min"]
+    maximum = row[f"{index}_max"]
+    distinct_value_count = row[f"{index}_distinct_value_count"]
+    if number_of_rows == 0:
+        idness = 1.0
+        missing_value_ratio = 1.0
+    else:
+        idness = row[f"{index}_distinct_value_count_with_missing_values"] / number_of_rows
+        missing_value_ratio = row[f"{index}_missing_value_count"] / number_of_rows
+    if number_of_non_missing_values == 0:
+        stability = 1.0
+    else:
+        stability = row[f"{index}_mode_count"] / number_of_non_missing_values
+
+    if dtype.is_numeric():
+        values: list[Any] = [
+            minimum,
+            maximum,
+            row[f"{index}_mean"],
+            row[f"{index}_median"],
+            row[f"{index}_standard_deviation"],
+            distinct_value_count,
+            idness,
+            missing_value_ratio,
+            stability,
+        ]
+        return pl.Series(name, values, dtype=pl.Float64, strict=False)
+    else:
+        values = [
+            str(minimum or "-"),
+            str(maximum or "-"),
+            "-",
+            "-",
+            "-",
+            str(distinct_value_count),
+            str(idness),
+            str(missing_value_ratio),
+            str(stability),
+        ]
+        return pl.Series(name, values, dtype=pl.String)
+
+
+def _scan_files(
+    files: list[Path],
+    scan: Callable[[list[Path]], pl.LazyFrame],
+    hive_partitioning: bool,
+) -> pl.LazyFrame:
+    import polars as pl
+
+    partition_types = _infer_hive_partition_types(files) if hive_partitioning else {}
+    if not partition_types:
+        return scan(files)
+
+    # We add the partition columns ourselves: polars does not support hive partitioning for CSV files, and for Parquet
+    # files it panics when it resolves the schema of a filtered scan. Files of the same partition are scanned together,
+    # which keeps the query plan small for many files. Since the partition columns are literals on top of the scans,
+    # polars cannot push filters on them into the scans, so such filters do not skip any files.
+    files_by_partition: dict[tuple[tuple[str, str], ...], list[Path]] = {}
+    for file in files:
+        files_by_partition.setdefault(_parse_hive_partition(file), []).append(file)
+
+    return pl.concat(
+        [
+            scan(partition_files).with_columns(
+                pl.lit(dict(partition).get(key)).cast(dtype, strict=False).alias(key)
+                for key, dtype in partition_types.items()
+            )
+            for partition, partition_files in files_by_partition.items()
+        ],
+        how="vertical",
+    )
+
+
+def _create_spill_file() -> Path:
+    import os
+    import tempfile
+    from pathlib import Path
+
+    global _spill_directory  # noqa: PLW0603
+
+    # The directory is removed with all remaining files in it when the process exits
+    if _spill_directory is None:
+        _spill_directory = tempfile.TemporaryDirectory(prefix="safeds-", ignore_cleanup_errors=True)
+
+    file_descriptor, path = tempfile.mkstemp(suffix=".arrow", dir=_spill_directory.name)
+    os.close(file_descriptor)
+    return Path(path)
+
+
+def _remove_spill_file(path: Path) -> None:  # pragma: no cover
+    import contextlib
+
+    with contextlib.suppress(OSError):
+        path.unlink(missing_ok=True)
+
+
+def _parse_hive_partition(path: Path) -> tuple[tuple[str, str], ...]:
+    from urllib.parse import unquote
+
+    # Like in polars, every directory named like "key=value" counts, not just the ones below a common root
+    partition = []
+    for directory in path.parent.parts:
+        key, separator, value = directory.partition("=")
+        if separator and key:
+            partition.append((unquote(key), unquote(value)))
+
+    return tuple(partition)
+
+
+def _infer_hive_partition_types(files: list[Path]) -> dict[str, type[pl.DataType]]:
+    import polars as pl
+
+    values_by_key: dict[str, list[str]] = {}
+    for file in files:
+        for key, value in _parse_hive_partition(file):
+            values_by_key.setdefault(key, []).append(value)
+
+    types: dict[str, type[pl.DataType]] = {}
+    for key, values in values_by_key.items():
+        series = pl.Series(values, dtype=pl.String)
+        if series.str.to_integer(strict=False).null_count() == 0:
+            types[key] = pl.Int64
+        elif series.cast(pl.Float64, strict=False).null_count() == 0:
+            types[key] = pl.Float64
+        else:
+            types[key] = pl.String
+
+    return types
+
+
+def _is_unsupported_by_streaming_engine(error: pl.InvalidOperationError) -> bool:
+    """
+    Check whether polars failed to sink a query because its streaming engine does not support some operation in it.
+
+    Some operations, like horizontal concatenation, have no streaming implementation yet, so such queries must be
+    collected instead. Other errors are caused by the data and would occur when collecting the query as well.
+    """
+    return "not yet supported in standard engine" in str(error)
+
+
+def _concat_horizontally(left: Table, right: Table) -> pl.LazyFrame:
+    """
+    Concatenate two tables horizontally without loading them into memory.
+
+    polars pads the shorter frame with missing values. To raise an error instead, the numbers of rows are compared
+    upfront. They are cached by the tables and can usually be computed without loading the data, so the check keeps the
+    query plan free of Python functions and thus streamable.
+    """
+    import polars as pl
+
+    # A table without columns has no rows either
+    if left.number_of_columns == 0:
+        return right._lazy_frame
+    if right.number_of_columns == 0:
+        return left._lazy_frame
+
+    if left.number_of_rows != right.number_of_rows:
+        raise ColumnLengthMismatchError(
+            "\n".join(f"{name}: {table.number_of_rows}" for table in (left, right) for name in table.column_names),
+        )
+
+    return pl.concat([left._lazy_frame, right._lazy_frame], how="horizontal")
+
 
 # TODO
 def _create_dataset(features: Tensor) -> Dataset:
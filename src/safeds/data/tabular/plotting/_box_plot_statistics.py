@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ._streaming import _reduce_chunks
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from safeds.data.tabular.containers import Table
+
+    from ._quantile_sketch import _QuantileSketch
+
+# Outliers beyond this number are not drawn, since they would be indistinguishable anyway. This limit applies to each
+# side of the box separately.
+_MAXIMUM_NUMBER_OF_OUTLIERS = 1000
+
+
+def _compute_box_plot_statistics(
+    table: Table,
+    *,
+    rank_error: float = 0.01,
+    sketches: dict[str, _QuantileSketch] | None = None,
+) -> pl.DataFrame:
+    """
+    Compute the statistics that are shown in a box plot for every numeric column of a table.
+
+    The data is streamed twice: The first pass estimates the quartiles with a quantile sketch per column, the second one
+    finds the whiskers and outliers. The sketches are cached on the table, so later plots of the same columns skip the
+    first pass. Like in matplotlib, whiskers end at the most extreme values that are at most 1.5
+    interquartile ranges away from the box, and all values beyond are outliers. Missing values are ignored.
+
+    Since both passes summarize one chunk at a time, tables that are backed by files larger than the memory can be
+    plotted as well.
+
+    Parameters
+    ----------
+    table:
+        The table to compute the statistics for. Non-numeric columns are ignored.
+    rank_error:
+        The maximum error of the estimated quartiles, as a fraction of the number of values.
+    sketches:
+        Sketches of the numeric columns to use instead of those of the table.
+
+    Returns
+    -------
+    statistics:
+        A data frame with one row per numeric column and the columns "column", "lower_whisker", "first_quartile",
+        "median", "third_quartile", "upper_whisker", and "outliers". All statistics are null for columns without values.
+    """
+    import polars as pl
+
+    schema = {
+        "column": pl.String,
+        "lower_whisker": pl.Float64,
+        "first_quartile": pl.Float64,
+        "median": pl.Float64,
+        "third_quartile": pl.Float64,
+        "upper_whisker": pl.Float64,
+        "outliers": pl.List(pl.Float64),
+    }
+
+    numeric_names = [name for name in table.column_names if table.get_column_type(name).is_numeric]
+    if not numeric_names:
+        return pl.DataFrame(schema=schema)
+
+    lazy_frame = table._lazy_frame.select(pl.col(numeric_names).cast(pl.Float64))
+
+    # Estimate the quartiles
+    if sketches is None:
+        sketches = table._get_quantile_sketches(numeric_names, rank_error)
+    quartiles = {}
+    for name in numeric_names:
+        sketch = sketches[name]
+        quartiles[name] = (sketch.quantile(0.25), sketch.quantile(0.5), sketch.quantile(0.75))
+
+    # Find whiskers and outliers
+    fences = {}
+    for name, (first_quartile, _, third_quartile) in quartiles.items():
+        if first_quartile is None or third_quartile is None:
+            fences[name] = (float("inf"), float("-inf"))
+        else:
+            spread = 1.5 * (third_quartile - first_quartile)
+            fences[name] = (first_quartile - spread, third_quartile + spread)
+
+    extremes = _reduce_chunks(
+        lazy_frame,
+        lambda chunk: _summarize_extremes(chunk, fences),
+        lambda left, right: _summarize_extremes(pl.concat([left, right]), fences, merge=True),
+    )
+    if extremes is None:
+        extremes = _summarize_extremes(lazy_frame.clear().collect(), fences)
+
+    rows = []
+    for name in numeric_names:
+        column_extremes = extremes.get_column(name)[0]
+        first_quartile, median, third_quartile = quartiles[name]
+        rows.append(
+            {
+                "column": name,
+                "lower_whisker": column_extremes["lower_whisker"],
+                "first_quartile": first_quartile,
+                "median": median,
+                "third_quartile": third_quartile,
+                "upper_whisker": column_extremes["upper_whisker"],
+                "outliers": column_extremes["low_outliers"] + column_extremes["high_outliers"],
+            },
+        )
+
+    return pl.DataFrame(rows, schema=schema)
+
+
+def _summarize_extremes(
+    data: pl.DataFrame,
+    fences: dict[str, tuple[float, float]],
+    *,
+    merge: bool = False,
+) -> pl.DataFrame:
+    """
+    Summarize the whiskers and the most extreme outliers of every column in a single row.
+
+    With `merge`, the data consists of previous summaries instead of raw values.
+    """
+    import polars as pl
+
+    def summarize(name: str) -> pl.Expr:
+        lower_fence, upper_fence = fences[name]
+        if merge:
+            lower_whisker = pl.col(name).struct.field("lower_whisker")
+            upper_whisker = pl.col(name).struct.field("upper_whisker")
+            low_outliers = pl.col(name).struct.field("low_outliers").explode()
+            high_outliers = pl.col(name).struct.field("high_outliers").explode()
+        else:
+            values = pl.col(name).drop_nulls().drop_nans()
+            lower_whisker = values.filter(values >= lower_fence)
+            upper_whisker = values.filter(values <= upper_fence)
+            low_outliers = values.filter(values < lower_fence)
+            high_outliers = values.filter(values > upper_fence)
+
+        return pl.struct(
+            lower_whisker=lower_whisker.min(),
+            upper_whisker=upper_whisker.max(),
+            low_outliers=low_outliers.drop_nulls().unique().sort().head(_MAXIMUM_NUMBER_OF_OUTLIERS).implode(),
+            high_outliers=high_outliers.drop_nulls().unique().sort().tail(_MAXIMUM_NUMBER_OF_OUTLIERS).implode(),
+        ).alias(name)
+
+    return data.select(summarize(name) for name in data.columns)
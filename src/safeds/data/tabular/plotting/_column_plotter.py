@@ -2,9 +2,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from safeds._utils import _figure_to_image
+from safeds._config import _get_plot_backend
+from safeds._validation import _check_bounds, _ClosedBound
 from safeds.exceptions import NonNumericColumnError
 
+from ._box_plot_statistics import _compute_box_plot_statistics
+from ._plot_cache import _cached_plot
+from ._point_density import _DEFAULT_MAXIMUM_NUMBER_OF_POINTS, _compute_point_density
+
 if TYPE_CHECKING:
     from safeds.data.image.containers import Image
     from safeds.data.tabular.containers import Column
@@ -29,10 +34,20 @@ class ColumnPlotter:
     def __init__(self, column: Column):
         self._column: Column = column
 
-    def box_plot(self) -> Image:
+    @_cached_plot
+    def box_plot(self, *, rank_error: float | None = None) -> Image:
         """
         Create a box plot for the values in the column. This is only possible for numeric columns.
 
+        Parameters
+        ----------
+        rank_error:
+            If set, the quartiles are estimated with a quantile sketch instead of sorting all values, which is much
+            faster for very large columns. Each estimate lies within `rank_error` of the exact quantile, e.g. the
+            estimated median lies between the 49th and the 51st percentile for 0.01. The sketch is kept with the
+            column and shared with `column.median(rank_error=...)`. Must be between 0 and 1 (both exclusive). If None,
+            the quartiles are exact. Default is None.
+
         Returns
         -------
         box_plot:
@@ -42,6 +57,8 @@ class ColumnPlotter:
         ------
         TypeError
             If the column is not numeric.
+        OutOfBoundsError
+            If `rank_error` is not between 0 and 1.
 
         Examples
         --------
@@ -53,20 +70,14 @@ class ColumnPlotter:
             # TODO better error message
             raise NonNumericColumnError(f"{self._column.name} is of type {self._column.type}.")
 
-        import matplotlib.pyplot as plt
+        if rank_error is None or not self._column.is_numeric:
+            return _get_plot_backend().box_plot(self._column._series.drop_nulls())
 
-        fig, ax = plt.subplots()
-        ax.boxplot(
-            self._column._series.drop_nulls(),
-            patch_artist=True,
+        statistics = _compute_box_plot_statistics(
+            self._column.to_table(),
+            sketches={self._column.name: self._column._get_quantile_sketch(rank_error)},
         )
-
-        ax.set(title=self._column.name)
-        ax.set_xticks([])
-        ax.yaxis.grid(visible=True)
-        fig.tight_layout()
-
-        return _figure_to_image(fig)
+        return _get_plot_backend().box_plot_from_statistics(statistics)
 
     def histogram(self, *, maximum_number_of_bins: int = 10) -> Image:
         """
@@ -90,14 +101,21 @@ class ColumnPlotter:
         """
         return self._column.to_table().plot.histograms(maximum_number_of_bins=maximum_number_of_bins)
 
-    def lag_plot(self, lag: int) -> Image:
+    @_cached_plot
+    def lag_plot(self, lag: int, *, maximum_number_of_points: int = _DEFAULT_MAXIMUM_NUMBER_OF_POINTS) -> Image:
         """
         Create a lag plot for the values in the column.
 
+        If there are more points than `maximum_number_of_points`, the plot shows the number of points per cell of a fine
+        grid instead of single markers, like `table.plot.scatter_plot`.
+
         Parameters
         ----------
         lag:
             The amount of lag.
+        maximum_number_of_points:
+            The maximum number of points that are drawn individually. Must be greater than or equal to 0. Default is
+            100000.
 
         Returns
         -------
@@ -108,6 +126,8 @@ class ColumnPlotter:
         ------
         TypeError
             If the column is not numeric.
+        OutOfBoundsError
+            If `maximum_number_of_points` is less than 0.
 
         Examples
         --------
@@ -118,19 +138,17 @@ class ColumnPlotter:
         if self._column.number_of_rows > 0 and not self._column.is_numeric:
             # TODO better error message
             raise NonNumericColumnError("This time series target contains non-numerical columns.")
+        _check_bounds("maximum_number_of_points", maximum_number_of_points, lower_bound=_ClosedBound(0))
 
-        import matplotlib.pyplot as plt
-
-        fig, ax = plt.subplots()
         series = self._column._series
-        ax.scatter(
-            x=series.slice(0, max(len(self._column) - lag, 0)),
-            y=series.slice(lag),
-        )
-        ax.set(
-            xlabel="y(t)",
-            ylabel=f"y(t + {lag})",
-        )
-        fig.tight_layout()
+        x = series.slice(0, max(len(self._column) - lag, 0))
+        y = series.slice(lag)
+
+        if len(x) > maximum_number_of_points:
+            return _get_plot_backend().density_plot(*_compute_point_density(x, y), "y(t)", f"y(t + {lag})")
+
+        return _get_plot_backend().lag_plot(x, y, lag)
 
-        return _figure_to_image(fig)
+    def _compute_fingerprint(self) -> int | None:
+        # Used as part of the key in the plot cache
+        return self._column.fingerprint()
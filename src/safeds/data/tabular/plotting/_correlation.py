@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ._streaming import _reduce_chunks
+
+if TYPE_CHECKING:
+    import polars as pl
+    from numpy import ndarray
+
+    from safeds.data.tabular.containers import Table
+
+# Chunks are multiplied in blocks of this many rows, so the temporary matrix stays small even for wide tables
+_BLOCK_SIZE = 16_384
+
+
+def _compute_correlation_matrix(table: Table, *, maximum_number_of_rows: int | None = None) -> ndarray:
+    """
+    Compute the Pearson correlation between every pair of numeric columns of a table.
+
+    Like in the correlation heatmap, missing values are treated as 0. Columns without variance have a correlation of
+    NaN with every column.
+
+    The data is streamed once. For every block of rows, the sums of the columns and the sums of all pairwise products
+    are added up with a single matrix multiplication, so neither the whole table nor a copy of it is ever materialized.
+    Columns are shifted by their first value beforehand, which avoids cancellation if their mean is large compared to
+    their spread.
+
+    Parameters
+    ----------
+    table:
+        The table to compute the correlations for. Non-numeric columns are ignored.
+    maximum_number_of_rows:
+        If the table has more rows, only a random sample of about this many rows is used.
+
+    Returns
+    -------
+    correlation_matrix:
+        The correlations with the shape (k, k), where k is the number of numeric columns, in the order of the columns.
+    """
+    import numpy as np
+    import polars as pl
+
+    numeric_names = [name for name in table.column_names if table.get_column_type(name).is_numeric]
+    number_of_columns = len(numeric_names)
+
+    lazy_frame = table._lazy_frame.select(pl.col(numeric_names).cast(pl.Float64).fill_null(0))
+
+    # Any row gives a suitable shift, so we take the first one of the full frame, which does not need the sample
+    first_row = lazy_frame.head(1).collect()
+    shift = first_row.to_numpy()[0] if first_row.height > 0 else np.zeros(number_of_columns)
+
+    if maximum_number_of_rows is not None and number_of_columns > 0 and table.number_of_rows > maximum_number_of_rows:
+        lazy_frame = lazy_frame.filter(_sample_rows(maximum_number_of_rows / table.number_of_rows))
+
+    summary = _reduce_chunks(
+        lazy_frame,
+        lambda chunk: _summarize_products(chunk, shift),
+        lambda left, right: (left[0] + right[0], left[1] + right[1], left[2] + right[2]),
+    )
+    if summary is None:
+        return np.full((number_of_columns, number_of_columns), np.nan)
+
+    count, sums, products = summary
+    with np.errstate(divide="ignore", invalid="ignore"):
+        covariance = (products - np.outer(sums, sums) / count) / (count - 1)
+        standard_deviation = np.sqrt(np.diag(covariance))
+        correlation = covariance / np.outer(standard_deviation, standard_deviation)
+
+    return np.clip(correlation, -1, 1)
+
+
+def _sample_rows(fraction: float) -> pl.Expr:
+    """
+    Return a predicate that keeps a random fraction of the rows.
+
+    Each row is kept if a seeded hash of its values is small enough. Unlike a permutation of the row indices, this only
+    depends on the row itself, so polars can evaluate it on the streaming engine. Equal rows are kept or dropped
+    together, which does not matter for estimating correlations.
+    """
+    import polars as pl
+
+    from safeds._utils._random import _get_random_seed
+
+    threshold = min(int(fraction * 2**64), 2**64 - 1)
+    return pl.struct(pl.all()).hash(seed=_get_random_seed()) < pl.lit(threshold, dtype=pl.UInt64)
+
+
+def _summarize_products(chunk: pl.DataFrame, shift: ndarray) -> tuple[int, ndarray, ndarray]:
+    import numpy as np
+
+    sums = np.zeros(chunk.width)
+    products = np.zeros((chunk.width, chunk.width))
+    for block in chunk.iter_slices(_BLOCK_SIZE):
+        values = block.to_numpy() - shift
+        sums += values.sum(axis=0)
+        products += values.T @ values
+
+    return chunk.height, sums, products
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING, Any
+
+from ._streaming import _reduce_chunks
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from safeds.data.tabular.containers import Table
+
+
+def _compute_histograms(table: Table, maximum_number_of_bins: int) -> dict[str, pl.DataFrame]:
+    """
+    Compute the bins and counts of a histogram for every column of a table.
+
+    Numeric columns with more distinct values than `maximum_number_of_bins` are split into equally wide bins. For all
+    other columns, each distinct value gets its own bin, but only the `maximum_number_of_bins` smallest values are kept.
+    Missing values are ignored.
+
+    The data is streamed twice, no matter how many columns there are: The first pass computes the statistics needed to
+    pick the bins, the second one counts the values in each bin. Both passes summarize one chunk at a time and merge the
+    summaries, so tables that are backed by files larger than the memory can be plotted as well.
+
+    Parameters
+    ----------
+    table:
+        The table to compute the histograms for.
+    maximum_number_of_bins:
+        The maximum number of bins per column.
+
+    Returns
+    -------
+    histograms:
+        A mapping from column names to data frames with the columns "bin_start", "bin_end", "count", and "label". The
+        label is the text that is shown below the bar of a bin.
+    """
+    import polars as pl
+
+    column_names = table.column_names
+    if len(column_names) == 0:
+        return {}
+
+    # Collect the statistics that decide how the numeric columns are binned
+    numeric_names = [name for name in column_names if table.get_column_type(name).is_numeric]
+    statistics: dict[str, Any] = {}
+    if numeric_names:
+        ranges = _reduce_chunks(
+            table._lazy_frame.select(numeric_names),
+            lambda chunk: _summarize_ranges(chunk, maximum_number_of_bins),
+            lambda left, right: _summarize_ranges(pl.concat([left, right]), maximum_number_of_bins, merge=True),
+        )
+        if ranges is not None:
+            statistics = ranges.row(0, named=True)
+
+    # Count the values of all columns at once
+    bin_edges: dict[str, list[float]] = {}
+    for name in numeric_names:
+        column_statistics = statistics.get(name)
+        if column_statistics is not None and len(column_statistics["distinct_values"]) > maximum_number_of_bins:
+            min_value = (column_statistics["min"] or 0) - 1e-6  # Otherwise the minimum is not included in the first bin
+            max_value = column_statistics["max"] or 0
+            bin_edges[name] = [
+                *(
+                    pl.Series(range(maximum_number_of_bins + 1)) / maximum_number_of_bins * (max_value - min_value)
+                    + min_value
+                ),
+            ]
+
+    counts = _reduce_chunks(
+        table._lazy_frame.select(column_names),
+        lambda chunk: _count_values(chunk, bin_edges, maximum_number_of_bins),
+        lambda left, right: _merge_counts(left, right, maximum_number_of_bins),
+    )
+    if counts is None:
+        # Only happens if the source has no chunks at all, in which case all counts are zero
+        counts = _count_values(
+            table._lazy_frame.select(column_names).clear().collect(),
+            bin_edges,
+            maximum_number_of_bins,
+        )
+
+    # Bring the result into a uniform shape
+    result = {}
+    for name in column_names:
+        if name in bin_edges:
+            edges = bin_edges[name]
+            result[name] = pl.DataFrame(
+                {
+                    "bin_start": edges[:-1],
+                    "bin_end": edges[1:],
+                    "count": counts[name].get_column("count"),
+                    "label": [f"{round((start + end) / 2, 2)}" for start, end in itertools.pairwise(edges)],
+                },
+            )
+        else:
+            values = counts[name].get_column("value")
+            result[name] = pl.DataFrame(
+                {
+                    "bin_start": values,
+                    "bin_end": values,
+                    "count": counts[name].get_column("count"),
+                    "label": values.cast(pl.String),
+                },
+            )
+
+    return result
+
+
+def _summarize_ranges(data: pl.DataFrame, maximum_number_of_bins: int, *, merge: bool = False) -> pl.DataFrame:
+    """
+    Summarize the minimum, maximum, and some distinct values of every column in a single row.
+
+    Only up to `maximum_number_of_bins + 1` distinct values are kept, which is enough to decide whether a column must be
+    binned. With `merge`, the data consists of previous summaries instead of raw values.
+    """
+    import polars as pl
+
+    def summarize(name: str) -> pl.Expr:
+        if merge:
+            min_value = pl.col(name).struct.field("min")
+            max_value = pl.col(name).struct.field("max")
+            values = pl.col(name).struct.field("distinct_values").explode()
+        else:
+            min_value = max_value = values = pl.col(name)
+
+        return pl.struct(
+            min=min_value.min(),
+            max=max_value.max(),
+            distinct_values=values.drop_nulls().unique().head(maximum_number_of_bins + 1).implode(),
+        ).alias(name)
+
+    return data.select(summarize(name) for name in data.columns)
+
+
+def _count_values(
+    data: pl.DataFrame,
+    bin_edges: dict[str, list[float]],
+    maximum_number_of_bins: int,
+) -> dict[str, pl.DataFrame]:
+    """
+    Count the values in every bin of every column of a chunk.
+
+    For columns with bin edges, the result has a single column "count" with one row per bin. For all other columns, it
+    has the columns "value" and "count" for the `maximum_number_of_bins` smallest values.
+    """
+    import polars as pl
+
+    expressions = []
+    for name in data.columns:
+        if name in bin_edges:
+            # The first bin of polars contains all values less than or equal to the first edge, so we skip it
+            expression = pl.col(name).hist(bins=bin_edges[name]).slice(1, maximum_number_of_bins).alias("count")
+        else:
+            expression = pl.col(name).drop_nulls().alias("value").value_counts().sort().head(maximum_number_of_bins)
+
+        expressions.append(expression.implode().alias(name))
+
+    counts = data.select(expressions)
+
+    result = {}
+    for name in data.columns:
+        if name in bin_edges:
+            result[name] = counts.select(pl.col(name).explode().cast(pl.Int64).alias("count"))
+        else:
+            result[name] = (
+                counts.get_column(name)
+                .explode()
+                .struct.unnest()
+                .drop_nulls()
+                .with_columns(pl.col("count").cast(pl.Int64))
+            )
+
+    return result
+
+
+def _merge_counts(
+    left: dict[str, pl.DataFrame],
+    right: dict[str, pl.DataFrame],
+    maximum_number_of_bins: int,
+) -> dict[str, pl.DataFrame]:
+    import polars as pl
+
+    result = {}
+    for name, left_counts in left.items():
+        right_counts = right[name]
+        if "value" in left_counts.columns:
+            # A value that is among the smallest ones overall is also among the smallest ones of every chunk
+            result[name] = (
+                pl.concat([left_counts, right_counts])
+                .group_by("value")
+                .agg(pl.col("count").sum())
+                .sort("value")
+                .head(maximum_number_of_bins)
+            )
+        else:
+            result[name] = left_counts + right_counts
+
+    return result
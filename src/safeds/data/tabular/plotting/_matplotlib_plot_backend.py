@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import warnings
+from typing import TYPE_CHECKING, Any
+
+from safeds._utils import _figure_to_image
+
+from ._plot_backend import _PlotBackend
+
+if TYPE_CHECKING:
+    import polars as pl
+    from numpy import ndarray
+
+    from safeds.data.image.containers import Image
+
+
+class _MatplotlibPlotBackend(_PlotBackend):
+    """The default backend, which draws plots with matplotlib and seaborn."""
+
+    def box_plot(self, values: pl.Series) -> Image:
+        import matplotlib.pyplot as plt
+
+        fig, ax = plt.subplots()
+        ax.boxplot(
+            values,
+            patch_artist=True,
+        )
+
+        ax.set(title=values.name)
+        ax.set_xticks([])
+        ax.yaxis.grid(visible=True)
+        fig.tight_layout()
+
+        return _figure_to_image(fig)
+
+    def box_plot_from_statistics(self, statistics: pl.DataFrame) -> Image:
+        import matplotlib.pyplot as plt
+
+        row = statistics.row(0, named=True)
+
+        fig, ax = plt.subplots()
+        if row["median"] is not None:
+            ax.bxp([_to_bxp_statistics(row)], patch_artist=True)
+
+        ax.set(title=row["column"])
+        ax.set_xticks([])
+        ax.yaxis.grid(visible=True)
+        fig.tight_layout()
+
+        return _figure_to_image(fig)
+
+    def box_plots(self, data: pl.DataFrame) -> Image:
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        col_wrap = min(data.width, 3)
+
+        melted = data.melt(value_vars=data.columns)
+        grid = sns.FacetGrid(melted, col="variable", col_wrap=col_wrap, sharex=False, sharey=False)
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore",
+                message="Using the boxplot function without specifying `order` is likely to produce an incorrect plot.",
+            )
+            grid.map(sns.boxplot, "variable", "value")
+        grid.set_xlabels("")
+        grid.set_ylabels("")
+        grid.set_titles("{col_name}")
+        for axes in grid.axes.flat:
+            axes.set_xticks([])
+        plt.tight_layout()
+        fig = grid.fig
+
+        return _figure_to_image(fig)
+
+    def box_plots_from_statistics(self, statistics: pl.DataFrame) -> Image:
+        import matplotlib.pyplot as plt
+
+        # Use the same layout as the facet grid of `box_plots`
+        n_cols = min(3, statistics.height)
+        n_rows = 1 + (statistics.height - 1) // n_cols
+
+        fig, axs = plt.subplots(n_rows, n_cols, figsize=(n_cols * 3, n_rows * 3), squeeze=False)
+        for row, ax in zip(statistics.iter_rows(named=True), axs.flatten(), strict=False):
+            if row["median"] is not None:
+                ax.bxp([_to_bxp_statistics(row)], patch_artist=True)
+
+            ax.set_title(row["column"])
+            ax.set_xticks([])
+
+        for i in range(statistics.height, n_rows * n_cols):
+            fig.delaxes(axs.flatten()[i])  # Remove empty subplots
+        fig.tight_layout()
+
+        return _figure_to_image(fig)
+
+    def correlation_heatmap(self, column_names: list[str], correlation_matrix: ndarray) -> Image:
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore",
+                message=(
+                    "Attempting to set identical low and high (xlims|ylims) makes transformation singular;"
+                    " automatically expanding."
+                ),
+            )
+            fig = plt.figure()
+            sns.heatmap(
+                data=correlation_matrix,
+                vmin=-1,
+                vmax=1,
+                xticklabels=column_names,
+                yticklabels=column_names,
+                cmap="vlag",
+            )
+            plt.tight_layout()
+
+        return _figure_to_image(fig)
+
+    def density_plot(
+        self,
+        counts: ndarray,
+        x_limits: tuple[float, float],
+        y_limits: tuple[float, float],
+        x_name: str,
+        y_name: str,
+    ) -> Image:
+        import matplotlib.pyplot as plt
+        import numpy as np
+        from matplotlib.colors import LogNorm
+
+        fig, ax = plt.subplots()
+        # A single image instead of one marker per point. Empty cells stay white, and the logarithmic color scale keeps
+        # sparse regions visible next to dense ones.
+        image = ax.imshow(
+            np.ma.masked_equal(counts, 0),
+            origin="lower",
+            extent=(*x_limits, *y_limits),
+            aspect="auto",
+            interpolation="nearest",
+            norm=LogNorm(vmin=1, vmax=max(int(counts.max()), 1)),
+        )
+        fig.colorbar(image, ax=ax, label="count")
+        ax.set(
+            xlabel=x_name,
+            ylabel=y_name,
+        )
+        fig.tight_layout()
+
+        return _figure_to_image(fig)
+
+    def forecast_plot(self, forecasted: ndarray, actual: ndarray) -> Image:
+        import matplotlib.pyplot as plt
+
+        fig = plt.figure()
+        plt.plot(
+            forecasted,
+        )
+        plt.legend(["forecasted"])
+        plt.plot(actual)
+        plt.tight_layout()
+
+        return _figure_to_image(fig)
+
+    def histograms(self, histograms: dict[str, pl.DataFrame]) -> Image:
+        import matplotlib.pyplot as plt
+
+        n_cols = min(3, len(histograms))
+        n_rows = 1 + (len(histograms) - 1) // n_cols
+
+        if n_cols == 1 and n_rows == 1:
+            fig, axs = plt.subplots(1, 1, tight_layout=True)
+            one_col = True
+        else:
+            fig, axs = plt.subplots(n_rows, n_cols, tight_layout=True, figsize=(n_cols * 3, n_rows * 3))
+            one_col = False
+
+        for (col_name, histogram), ax in zip(histograms.items(), axs.flatten() if not one_col else [axs], strict=False):
+            labels = histogram.get_column("label").to_list()
+            counts = histogram.get_column("count").to_numpy()
+
+            ax.set_title(col_name)
+            ax.set_xlabel("")
+            ax.set_ylabel("")
+
+            ax.bar(labels, counts, edgecolor="black")
+            ax.set_xticks(range(len(labels)), labels, rotation=45, horizontalalignment="right")
+
+        for i in range(len(histograms), n_rows * n_cols):
+            fig.delaxes(axs.flatten()[i])  # Remove empty subplots
+
+        return _figure_to_image(fig)
+
+    def lag_plot(self, x: pl.Series, y: pl.Series, lag: int) -> Image:
+        import matplotlib.pyplot as plt
+
+        fig, ax = plt.subplots()
+        ax.scatter(
+            x=x,
+            y=y,
+        )
+        ax.set(
+            xlabel="y(t)",
+            ylabel=f"y(t + {lag})",
+        )
+        fig.tight_layout()
+
+        return _figure_to_image(fig)
+
+    def line_plot(
+        self,
+        x: pl.Series,
+        y: pl.Series,
+        confidence_interval: pl.Series,
+        x_name: str,
+        y_name: str,
+    ) -> Image:
+        import matplotlib.pyplot as plt
+
+        fig, ax = plt.subplots()
+        ax.plot(
+            x,
+            y,
+        )
+        ax.fill_between(
+            x,
+            y - confidence_interval,
+            y + confidence_interval,
+            color="lightblue",
+            alpha=0.15,
+        )
+        ax.set(
+            xlabel=x_name,
+            ylabel=y_name,
+        )
+        ax.set_xticks(ax.get_xticks())
+        ax.set_xticklabels(
+            ax.get_xticklabels(),
+            rotation=45,
+            horizontalalignment="right",
+        )  # rotate the labels of the x Axis to prevent the chance of overlapping of the labels
+        fig.tight_layout()
+
+        return _figure_to_image(fig)
+
+    def scatter_plot(self, x: pl.Series, y: pl.Series, x_name: str, y_name: str) -> Image:
+        import matplotlib.pyplot as plt
+
+        fig, ax = plt.subplots()
+        ax.scatter(
+            x=x,
+            y=y,
+        )
+        ax.set(
+            xlabel=x_name,
+            ylabel=y_name,
+        )
+        ax.set_xticks(ax.get_xticks())
+        ax.set_xticklabels(
+            ax.get_xticklabels(),
+            rotation=45,
+            horizontalalignment="right",
+        )  # rotate the labels of the x Axis to prevent the chance of overlapping of the labels
+        fig.tight_layout()
+
+        return _figure_to_image(fig)
+
+
+def _to_bxp_statistics(row: dict[str, Any]) -> dict[str, Any]:
+    """Convert a row of box plot statistics to the format that `Axes.bxp` expects."""
+    return {
+        "whislo": row["lower_whisker"],
+        "q1": row["first_quartile"],
+        "med": row["median"],
+        "q3": row["third_quartile"],
+        "whishi": row["upper_whisker"],
+        "fliers": row["outliers"],
+    }
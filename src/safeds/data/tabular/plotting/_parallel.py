@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from safeds._config import _get_device, _init_default_device
+from safeds.data.image.containers import Image
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+
+    from numpy import ndarray
+
+    from ._plot_backend import _PlotBackend
+
+_T = TypeVar("_T")
+
+# Plots in the grid of `TablePlotter.histograms` and `TablePlotter.box_plots` are arranged in rows of this many columns
+_GRID_WIDTH = 3
+
+
+def _plot_many(
+    backend: _PlotBackend,
+    method_name: str,
+    arguments: Iterable[tuple[Any, ...]],
+    number_of_workers: int,
+) -> Iterator[Image]:
+    """
+    Call a method of the backend once per tuple of arguments and yield the resulting images in order.
+
+    With more than one worker, plots are rendered in a pool of processes, each of which has its own Agg canvas. At most
+    two tasks per worker are pending at any time, so arguments are only created shortly before a worker needs them.
+
+    Parameters
+    ----------
+    backend:
+        The backend that draws the plots.
+    method_name:
+        The name of the method of the backend to call.
+    arguments:
+        The positional arguments of each call.
+    number_of_workers:
+        The number of processes to use.
+
+    Returns
+    -------
+    images:
+        The plots.
+    """
+    if number_of_workers == 1:
+        for argument_tuple in arguments:
+            yield getattr(backend, method_name)(*argument_tuple)
+        return
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    import torch
+
+    _init_default_device()
+
+    # Forking a process that uses polars can deadlock, so we start fresh interpreters instead
+    with ProcessPoolExecutor(
+        max_workers=number_of_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_initialize_worker,
+    ) as executor:
+        pending: deque[Future[ndarray]] = deque()
+        for argument_tuple in arguments:
+            if len(pending) >= 2 * number_of_workers:
+                yield Image(image_tensor=torch.from_numpy(pending.popleft().result()).to(_get_device()))
+            pending.append(executor.submit(_plot_in_worker, backend, method_name, argument_tuple))
+
+        while pending:
+            yield Image(image_tensor=torch.from_numpy(pending.popleft().result()).to(_get_device()))
+
+
+def _initialize_worker() -> None:
+    import matplotlib as mpl
+
+    mpl.use("agg")
+
+
+def _plot_in_worker(backend: _PlotBackend, method_name: str, arguments: tuple[Any, ...]) -> ndarray:
+    # Only send back raw pixels, so the parent process decides on which device the image is stored
+    image = getattr(backend, method_name)(*arguments)
+    return image._image_tensor.cpu().numpy()
+
+
+def _split_into_tiles(items: list[_T], tile_size: int) -> list[list[_T]]:
+    """Split the items into consecutive tiles with at most `tile_size` items each."""
+    return [items[start : start + tile_size] for start in range(0, len(items), tile_size)]
+
+
+def _split_into_grid_rows(items: list[_T]) -> list[list[_T]]:
+    """
+    Split the items into rows of the grid, so stacking the plots of the rows gives the same layout as a single plot.
+
+    A single item in the last row would be plotted on its own at a different size, so it is merged into the row before.
+    """
+    rows = _split_into_tiles(items, _GRID_WIDTH)
+    if len(rows) > 1 and len(rows[-1]) == 1:
+        rows[-2].extend(rows.pop())
+    return rows
+
+
+def _stack_vertically(images: Iterable[Image]) -> Image:
+    """Stack images from top to bottom and align them on the left. Narrower images are padded with white."""
+    import torch
+
+    _init_default_device()
+
+    tensors = [image.change_channel(4)._image_tensor for image in images]
+    width = max(tensor.size(2) for tensor in tensors)
+    height = sum(tensor.size(1) for tensor in tensors)
+
+    result = torch.full((4, height, width), 255, dtype=torch.uint8, device=_get_device())
+    top = 0
+    for tensor in tensors:
+        result[:, top : top + tensor.size(1), : tensor.size(2)] = tensor
+        top += tensor.size(1)
+
+    return Image(image_tensor=result)
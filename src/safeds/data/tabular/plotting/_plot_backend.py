@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import polars as pl
+    from numpy import ndarray
+
+    from safeds.data.image.containers import Image
+
+
+class _PlotBackend(ABC):
+    """
+    Turn the data of a plot into an image.
+
+    The plotters compute everything that should be shown with polars and then hand the result to the active backend,
+    which only has to draw it. Use `_set_plot_backend` to change the active backend.
+    """
+
+    @abstractmethod
+    def box_plot(self, values: pl.Series) -> Image:
+        """
+        Draw a box plot of a single column.
+
+        Parameters
+        ----------
+        values:
+            The non-missing values of the column. The name of the series is used as title.
+        """
+
+    @abstractmethod
+    def box_plot_from_statistics(self, statistics: pl.DataFrame) -> Image:
+        """
+        Draw a box plot of a single column from precomputed statistics.
+
+        Parameters
+        ----------
+        statistics:
+            A data frame with a single row, in the format of `box_plots_from_statistics`. The column name is used as
+            title.
+        """
+
+    @abstractmethod
+    def box_plots(self, data: pl.DataFrame) -> Image:
+        """
+        Draw a box plot for every column of a data frame.
+
+        Parameters
+        ----------
+        data:
+            The numeric columns to plot.
+        """
+
+    @abstractmethod
+    def box_plots_from_statistics(self, statistics: pl.DataFrame) -> Image:
+        """
+        Draw a box plot for every row of precomputed statistics.
+
+        Parameters
+        ----------
+        statistics:
+            A data frame with the columns "column", "lower_whisker", "first_quartile", "median", "third_quartile",
+            "upper_whisker", and "outliers", as returned by `_compute_box_plot_statistics`. Rows with null statistics
+            belong to columns without values.
+        """
+
+    @abstractmethod
+    def correlation_heatmap(self, column_names: list[str], correlation_matrix: ndarray) -> Image:
+        """
+        Draw a heatmap of a correlation matrix.
+
+        Parameters
+        ----------
+        column_names:
+            The names of the correlated columns, in the order of the rows and columns of the matrix.
+        correlation_matrix:
+            The correlation coefficients, which are between -1 and 1 or NaN.
+        """
+
+    @abstractmethod
+    def density_plot(
+        self,
+        counts: ndarray,
+        x_limits: tuple[float, float],
+        y_limits: tuple[float, float],
+        x_name: str,
+        y_name: str,
+    ) -> Image:
+        """
+        Draw the density of the points of a scatter plot, which is used instead of the points if there are many.
+
+        Parameters
+        ----------
+        counts:
+            The number of points per cell of a regular grid, as returned by `_compute_point_density`. The first row
+            holds the smallest y-coordinates.
+        x_limits:
+            The range of x-coordinates that is covered by the grid.
+        y_limits:
+            The range of y-coordinates that is covered by the grid.
+        x_name:
+            The label of the x-axis.
+        y_name:
+            The label of the y-axis.
+        """
+
+    @abstractmethod
+    def forecast_plot(self, forecasted: ndarray, actual: ndarray) -> Image:
+        """
+        Draw the forecasted values of a time series next to the actual values.
+
+        Parameters
+        ----------
+        forecasted:
+            The forecasted values.
+        actual:
+            The actual values.
+        """
+
+    @abstractmethod
+    def histograms(self, histograms: dict[str, pl.DataFrame]) -> Image:
+        """
+        Draw a bar chart for every histogram.
+
+        Parameters
+        ----------
+        histograms:
+            A mapping from column names to data frames with the columns "label" and "count", as returned by
+            `_compute_histograms`.
+        """
+
+    @abstractmethod
+    def lag_plot(self, x: pl.Series, y: pl.Series, lag: int) -> Image:
+        """
+        Draw a lag plot.
+
+        Parameters
+        ----------
+        x:
+            The values at time t.
+        y:
+            The values at time t + lag.
+        lag:
+            The amount of lag.
+        """
+
+    @abstractmethod
+    def line_plot(
+        self,
+        x: pl.Series,
+        y: pl.Series,
+        confidence_interval: pl.Series,
+        x_name: str,
+        y_name: str,
+    ) -> Image:
+        """
+        Draw a line plot with a band around the line.
+
+        Parameters
+        ----------
+        x:
+            The x-coordinates of the points on the line.
+        y:
+            The y-coordinates of the points on the line.
+        confidence_interval:
+            The distance of the band from the line at every point.
+        x_name:
+            The label of the x-axis.
+        y_name:
+            The label of the y-axis.
+        """
+
+    @abstractmethod
+    def scatter_plot(self, x: pl.Series, y: pl.Series, x_name: str, y_name: str) -> Image:
+        """
+        Draw a scatter plot.
+
+        Parameters
+        ----------
+        x:
+            The x-coordinates of the points.
+        y:
+            The y-coordinates of the points.
+        x_name:
+            The label of the x-axis.
+        y_name:
+            The label of the y-axis.
+        """
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import functools
+import inspect
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from safeds._config import _get_plot_backend, _get_plot_cache
+from safeds.data.image.containers import Image
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Arguments that only change how a plot is computed, but not the image. They are not part of the key.
+_EXECUTION_ARGUMENTS = frozenset({"number_of_workers"})
+
+
+class _PlotCache:
+    """
+    A cache for plots, which stores the most recently used images in memory and optionally all of them on disk.
+
+    Entries are looked up by a key that identifies the plotted data, the plot method, its arguments, the plot backend,
+    the random seed, and the versions of Safe-DS and polars. Cached images are returned without rendering anything.
+    Plots of tables that are read from files are not cached, since hashing them would load all their data into memory.
+
+    Parameters
+    ----------
+    maximum_number_of_images:
+        The number of images to keep in memory. If more are added, the least recently used ones are evicted.
+    directory:
+        A directory to store all images in as PNG files. This allows sharing plots between processes and sessions. If
+        None, images are only kept in memory.
+    """
+
+    def __init__(self, maximum_number_of_images: int = 128, directory: str | Path | None = None) -> None:
+        self._maximum_number_of_images: int = maximum_number_of_images
+        self._directory: Path | None = Path(directory) if directory is not None else None
+        self._images: OrderedDict[str, Image] = OrderedDict()
+
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Image | None:
+        """Return the image that is stored for the key, or None if there is none."""
+        if key in self._images:
+            self._images.move_to_end(key)
+            return self._images[key]
+
+        if self._directory is not None:
+            path = self._directory / f"{key}.png"
+            if path.is_file():
+                image = Image.from_bytes(path.read_bytes())
+                self._remember(key, image)
+                return image
+
+        return None
+
+    def put(self, key: str, image: Image) -> None:
+        """Store the image for the key."""
+        self._remember(key, image)
+
+        if self._directory is not None:
+            # Write to a temporary file first, so other processes never read a partial image
+            path = self._directory / f"{key}.png"
+            temporary_path = path.with_suffix(f".{id(image)}.tmp")
+            temporary_path.write_bytes(image._repr_png_())
+            temporary_path.replace(path)
+
+    def clear(self) -> None:
+        """Remove all images from memory and from the directory."""
+        self._images.clear()
+
+        if self._directory is not None:
+            for path in self._directory.glob("*.png"):
+                path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, image: Image) -> None:
+        self._images[key] = image
+        self._images.move_to_end(key)
+        while len(self._images) > self._maximum_number_of_images:
+            self._images.popitem(last=False)
+
+
+def _cached_plot(method: Callable[..., Image]) -> Callable[..., Image]:
+    """
+    Look up the result of a plot method in the plot cache before calling it, and store it there afterward.
+
+    The plotter must have a method `_compute_fingerprint` that returns the fingerprint of the plotted data, or None if the
+    data cannot be hashed cheaply. In that case, or if no cache is configured, the method is called directly.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(plotter: Any, *args: Any, **kwargs: Any) -> Image:
+        cache = _get_plot_cache()
+        if cache is None:
+            return method(plotter, *args, **kwargs)
+
+        # Calls that only differ in how arguments are passed should share their entry
+        arguments = signature.bind(plotter, *args, **kwargs)
+        arguments.apply_defaults()
+        del arguments.arguments["self"]
+
+        fingerprint = plotter._compute_fingerprint()
+        if fingerprint is None:
+            return method(plotter, *args, **kwargs)
+
+        key = _create_key(fingerprint, method.__qualname__, arguments.arguments)
+        image = cache.get(key)
+        if image is None:
+            image = method(plotter, *args, **kwargs)
+            cache.put(key, image)
+
+        return image
+
+    return wrapper
+
+
+def _create_key(fingerprint: int, method_name: str, arguments: dict[str, Any]) -> str:
+    import importlib.metadata
+
+    import polars as pl
+    import xxhash
+
+    from safeds._utils._random import _get_random_seed
+
+    backend = type(_get_plot_backend())
+    parts = [
+        importlib.metadata.version("safe-ds"),
+        pl.__version__,
+        f"{backend.__module__}.{backend.__qualname__}",
+        # Plots of samples of the data depend on the seed
+        str(_get_random_seed()),
+        method_name,
+        str(fingerprint),
+        repr({name: value for name, value in arguments.items() if name not in _EXECUTION_ARGUMENTS}),
+    ]
+    return xxhash.xxh3_128_hexdigest("\0".join(parts))
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import polars as pl
+    from numpy import ndarray
+
+# Scatter plots with more points than this are drawn as a density grid by default
+_DEFAULT_MAXIMUM_NUMBER_OF_POINTS = 100_000
+
+# The number of cells of the density grid along each axis. Cells are a few pixels wide, so single points stay visible.
+_DENSITY_GRID_WIDTH = 200
+_DENSITY_GRID_HEIGHT = 150
+
+
+def _compute_point_density(
+    x: pl.Series,
+    y: pl.Series,
+) -> tuple[ndarray, tuple[float, float], tuple[float, float]]:
+    """
+    Count the points of a scatter plot in the cells of a regular grid.
+
+    The cells of all points are computed in a single vectorized query, so this is fast even for millions of points. Points with a
+    missing or infinite coordinate are ignored.
+
+    Parameters
+    ----------
+    x:
+        The x-coordinates of the points.
+    y:
+        The y-coordinates of the points.
+
+    Returns
+    -------
+    counts:
+        The number of points per cell with the shape (rows, columns). The first row holds the smallest y-coordinates.
+    x_limits:
+        The smallest and largest x-coordinate that is covered by the grid.
+    y_limits:
+        The smallest and largest y-coordinate that is covered by the grid.
+    """
+    import numpy as np
+    import polars as pl
+
+    points = pl.DataFrame([x.cast(pl.Float64).alias("x"), y.cast(pl.Float64).alias("y")]).filter(
+        pl.col("x").is_finite() & pl.col("y").is_finite(),
+    )
+    bounds = points.select(
+        x_min=pl.col("x").min(),
+        x_max=pl.col("x").max(),
+        y_min=pl.col("y").min(),
+        y_max=pl.col("y").max(),
+    ).row(0, named=True)
+
+    x_limits = _expand_limits(bounds["x_min"], bounds["x_max"])
+    y_limits = _expand_limits(bounds["y_min"], bounds["y_max"])
+
+    # Number the cells row by row, so a single counting pass over one integer column suffices
+    cell_indices = points.select(
+        _to_cell_index(pl.col("y"), y_limits, _DENSITY_GRID_HEIGHT) * _DENSITY_GRID_WIDTH
+        + _to_cell_index(pl.col("x"), x_limits, _DENSITY_GRID_WIDTH),
+    ).to_series()
+    counts = np.bincount(cell_indices.to_numpy(), minlength=_DENSITY_GRID_HEIGHT * _DENSITY_GRID_WIDTH)
+
+    return counts.reshape(_DENSITY_GRID_HEIGHT, _DENSITY_GRID_WIDTH), x_limits, y_limits
+
+
+def _expand_limits(minimum: float | None, maximum: float | None) -> tuple[float, float]:
+    # Like matplotlib, show a range of width 1 around a single value
+    if minimum is None or maximum is None:
+        return 0.0, 1.0
+    if minimum == maximum:
+        return minimum - 0.5, maximum + 0.5
+    return minimum, maximum
+
+
+def _to_cell_index(coordinate: pl.Expr, limits: tuple[float, float], number_of_cells: int) -> pl.Expr:
+    # The largest coordinate would get its own cell otherwise
+    scaled = (coordinate - limits[0]) / (limits[1] - limits[0]) * number_of_cells
+    return scaled.floor().clip(0, number_of_cells - 1).cast(int)
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import polars as pl
+    from numpy import ndarray
+
+
+# Values are added in blocks of this size, so there is never a sorted copy of all values
+_BLOCK_SIZE = 1 << 20
+
+
+class _QuantileSketch:
+    """
+    A compact summary of many numbers that estimates their quantiles and can be merged with other summaries.
+
+    This is a KLL sketch: Items are stored on levels, where an item on level `h` stands for `2**h` original values. If a
+    level holds more than `capacity` items, they are sorted and every other one is promoted to the next level, starting
+    at a random offset. This keeps the memory usage logarithmic in the number of values, while ranks stay unbiased.
+
+    Parameters
+    ----------
+    rank_error:
+        The maximum error of estimated quantiles, as a fraction of the number of values. For example, with 0.01 the
+        estimated median lies between the 49th and the 51st percentile. Smaller values need more memory.
+    """
+
+    def __init__(self, rank_error: float = 0.01) -> None:
+        import math
+
+        import numpy as np
+
+        # Empirically, the error stays well below the bound with this capacity
+        self._rank_error: float = rank_error
+        self._capacity: int = math.ceil(4 / rank_error)
+        self._levels: list[ndarray] = []
+        self._count: int = 0
+        self._min: float = np.inf
+        self._max: float = -np.inf
+
+    @property
+    def rank_error(self) -> float:
+        """The maximum error of estimated quantiles, as a fraction of the number of values."""
+        return self._rank_error
+
+    @property
+    def count(self) -> int:
+        """The number of values that were added to the sketch."""
+        return self._count
+
+    def update(self, values: ndarray) -> None:
+        """
+        Add values to the sketch. NaN values are ignored.
+
+        Parameters
+        ----------
+        values:
+            The values to add.
+        """
+        import numpy as np
+
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+
+        self._count += len(values)
+        self._min = min(self._min, float(values.min()))
+        self._max = max(self._max, float(values.max()))
+
+        random_generator = np.random.default_rng(self._count)
+        for start in range(0, len(values), _BLOCK_SIZE):
+            # A sorted block stays sorted when every other item is taken, so it has to be sorted only once
+            block = np.sort(values[start : start + _BLOCK_SIZE])
+            level = 0
+            while len(block) > self._capacity:
+                remainder = len(block) % 2
+                self._add_to_level(level, block[:remainder])
+                block = block[remainder + int(random_generator.integers(2)) :: 2]
+                level += 1
+            self._add_to_level(level, block)
+            self._compact()
+
+    def merge(self, other: _QuantileSketch) -> None:
+        """
+        Add all values that were added to another sketch to this one. Both sketches should have the same rank error.
+
+        Parameters
+        ----------
+        other:
+            The sketch to merge into this one.
+        """
+        self._count += other._count
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        for level, items in enumerate(other._levels):
+            self._add_to_level(level, items)
+        self._compact()
+
+    def quantile(self, quantile: float) -> float | None:
+        """
+        Estimate a quantile of the values.
+
+        Like the default of numpy and polars, this interpolates linearly between the two closest ranks, so the result is
+        exact as long as no items had to be promoted.
+
+        Parameters
+        ----------
+        quantile:
+            The quantile to estimate, between 0 and 1.
+
+        Returns
+        -------
+        value:
+            The estimate, or None if the sketch is empty.
+        """
+        import numpy as np
+
+        if self._count == 0:
+            return None
+        if quantile <= 0:
+            return self._min
+        if quantile >= 1:
+            return self._max
+
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(items), 2**level) for level, items in enumerate(self._levels)])
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        weights = weights[order]
+
+        # An item of weight w stands for the w values that precede its cumulative weight, so its rank (counting from 0)
+        # is the mean of theirs
+        ranks = np.cumsum(weights) - (weights + 1) / 2
+        return float(np.interp(quantile * (self._count - 1), ranks, items))
+
+    def _add_to_level(self, level: int, items: ndarray) -> None:
+        import numpy as np
+
+        while len(self._levels) <= level:
+            self._levels.append(np.empty(0, dtype=np.float64))
+        self._levels[level] = np.concatenate([self._levels[level], items])
+
+    def _compact(self) -> None:
+        import numpy as np
+
+        random_generator = np.random.default_rng(self._count)
+
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity:
+                items = np.sort(items)
+
+                # If the number of items is odd, one of them stays, so the total weight does not change
+                remainder = len(items) % 2
+                offset = int(random_generator.integers(2))
+                self._levels[level] = items[:remainder]
+                self._add_to_level(level + 1, items[remainder + offset :: 2])
+            level += 1
+
+
+def _compute_quantile_sketches(lazy_frame: pl.LazyFrame, rank_error: float) -> dict[str, _QuantileSketch]:
+    """
+    Build a quantile sketch for every column of a lazy frame in a single streaming pass.
+
+    Parameters
+    ----------
+    lazy_frame:
+        The numeric columns to summarize.
+    rank_error:
+        The maximum error of estimated quantiles, as a fraction of the number of values.
+
+    Returns
+    -------
+    sketches:
+        The sketch of each column by name.
+    """
+    import polars as pl
+
+    from ._streaming import _reduce_chunks
+
+    lazy_frame = lazy_frame.select(pl.all().cast(pl.Float64))
+    sketches = _reduce_chunks(
+        lazy_frame,
+        lambda chunk: _sketch_chunk(chunk, rank_error),
+        _merge_sketches,
+    )
+    if sketches is None:
+        return {name: _QuantileSketch(rank_error) for name in lazy_frame.columns}
+    return sketches
+
+
+def _sketch_chunk(chunk: pl.DataFrame, rank_error: float) -> dict[str, _QuantileSketch]:
+    result = {}
+    for series in chunk.get_columns():
+        sketch = _QuantileSketch(rank_error)
+        sketch.update(series.drop_nulls().to_numpy())
+        result[series.name] = sketch
+    return result
+
+
+def _merge_sketches(left: dict[str, _QuantileSketch], right: dict[str, _QuantileSketch]) -> dict[str, _QuantileSketch]:
+    for name, sketch in right.items():
+        left[name].merge(sketch)
+    return left
@@ -0,0 +1,575 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from safeds._config import _get_device, _init_default_device
+from safeds.data.image.containers import Image
+
+from ._plot_backend import _PlotBackend
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import polars as pl
+    from numpy import ndarray
+    from torch import Tensor
+
+# Colors of the default matplotlib style, so plots look similar in both backends
+_BLACK = (0, 0, 0)
+_BLUE = (31, 119, 180)
+_LIGHT_BLUE = (173, 216, 230)
+_ORANGE = (255, 127, 14)
+
+# Colors of the diverging "vlag" colormap of seaborn at -1, 0, and 1
+_HEATMAP_LOW = (35, 105, 189)
+_HEATMAP_MIDDLE = (242, 242, 242)
+_HEATMAP_HIGH = (169, 55, 59)
+
+# Sizes in pixels, which match the default figure sizes of matplotlib (at 100 DPI)
+_SINGLE_PLOT_WIDTH = 640
+_SINGLE_PLOT_HEIGHT = 480
+_GRID_CELL_SIZE = 300
+
+
+class _RasterPlotBackend(_PlotBackend):
+    """
+    A lightweight backend, which draws plots directly into the pixel tensor of an image.
+
+    No matplotlib figure is created and no PNG is encoded or decoded, which makes this backend much faster if many small
+    plots are created. In exchange, plots contain no text, i.e. no titles, axis labels, or tick labels.
+    """
+
+    def box_plot(self, values: pl.Series) -> Image:
+        canvas = _RasterCanvas(_SINGLE_PLOT_WIDTH, _SINGLE_PLOT_HEIGHT)
+        _draw_box_plot(canvas, _cell_of_single_plot(), _compute_box_plot_statistics_of_series(values))
+        return canvas.to_image()
+
+    def box_plot_from_statistics(self, statistics: pl.DataFrame) -> Image:
+        canvas = _RasterCanvas(_SINGLE_PLOT_WIDTH, _SINGLE_PLOT_HEIGHT)
+        _draw_box_plot(canvas, _cell_of_single_plot(), statistics.row(0, named=True))
+        return canvas.to_image()
+
+    def box_plots(self, data: pl.DataFrame) -> Image:
+        canvas, cells = _create_grid(data.width)
+        for series, cell in zip(data.get_columns(), cells, strict=False):
+            _draw_box_plot(canvas, cell, _compute_box_plot_statistics_of_series(series))
+        return canvas.to_image()
+
+    def box_plots_from_statistics(self, statistics: pl.DataFrame) -> Image:
+        canvas, cells = _create_grid(statistics.height)
+        for row, cell in zip(statistics.iter_rows(named=True), cells, strict=False):
+            _draw_box_plot(canvas, cell, row)
+        return canvas.to_image()
+
+    def correlation_heatmap(self, column_names: list[str], correlation_matrix: ndarray) -> Image:  # noqa: ARG002
+        import torch
+
+        canvas = _RasterCanvas(_SINGLE_PLOT_WIDTH, _SINGLE_PLOT_HEIGHT)
+        panel = canvas.add_panel(*_cell_of_single_plot(), x_limits=(0, 1), y_limits=(0, 1))
+
+        values = _to_tensor(correlation_matrix).clamp(-1, 1)
+        if values.numel() > 0:
+            low = torch.tensor(_HEATMAP_LOW, dtype=torch.float64)[:, None, None]
+            middle = torch.tensor(_HEATMAP_MIDDLE, dtype=torch.float64)[:, None, None]
+            high = torch.tensor(_HEATMAP_HIGH, dtype=torch.float64)[:, None, None]
+
+            negative = (-values).clamp(min=0)
+            positive = values.clamp(min=0)
+            colors = middle + negative * (low - middle) + positive * (high - middle)
+            colors = torch.where(values.isnan(), 255, colors)  # Like seaborn, leave cells with NaN empty
+
+            panel.draw_matrix(colors)
+
+        panel.draw_frame()
+        return canvas.to_image()
+
+    def density_plot(
+        self,
+        counts: ndarray,
+        x_limits: tuple[float, float],
+        y_limits: tuple[float, float],
+        x_name: str,  # noqa: ARG002
+        y_name: str,  # noqa: ARG002
+    ) -> Image:
+        import torch
+
+        canvas = _RasterCanvas(_SINGLE_PLOT_WIDTH, _SINGLE_PLOT_HEIGHT)
+        panel = canvas.add_panel(*_cell_of_single_plot(), x_limits=x_limits, y_limits=y_limits)
+
+        # Logarithmic scale from light blue for single points to blue for the densest cell. Empty cells stay white.
+        values = _to_tensor(counts).flip(0)  # The first row of the matrix is drawn at the top
+        shares = values.log() / values.max().log().clamp(min=1e-12)
+        light_blue = torch.tensor(_LIGHT_BLUE, dtype=torch.float64)[:, None, None]
+        blue = torch.tensor(_BLUE, dtype=torch.float64)[:, None, None]
+        colors = torch.where(values > 0, light_blue + shares.clamp(min=0) * (blue - light_blue), 255)
+
+        panel.draw_matrix(colors)
+        panel.draw_frame()
+        return canvas.to_image()
+
+    def forecast_plot(self, forecasted: ndarray, actual: ndarray) -> Image:
+        import torch
+
+        forecasted_values = _to_tensor(forecasted)
+        actual_values = _to_tensor(actual)
+        forecasted_positions = torch.arange(len(forecasted_values), dtype=torch.float64)
+        actual_positions = torch.arange(len(actual_values), dtype=torch.float64)
+
+        canvas = _RasterCanvas(_SINGLE_PLOT_WIDTH, _SINGLE_PLOT_HEIGHT)
+        panel = canvas.add_panel(
+            *_cell_of_single_plot(),
+            x_limits=_padded_limits(forecasted_positions, actual_positions),
+            y_limits=_padded_limits(forecasted_values, actual_values),
+        )
+        panel.draw_lines(forecasted_positions, forecasted_values, _BLUE)
+        panel.draw_lines(actual_positions, actual_values, _ORANGE)
+        panel.draw_frame()
+
+        return canvas.to_image()
+
+    def histograms(self, histograms: dict[str, pl.DataFrame]) -> Image:
+        import torch
+
+        canvas, cells = _create_grid(len(histograms))
+        for histogram, cell in zip(histograms.values(), cells, strict=False):
+            counts = _to_tensor(histogram.get_column("count"))
+            positions = torch.arange(len(counts), dtype=torch.float64)
+
+            panel = canvas.add_panel(
+                *cell,
+                x_limits=_padded_limits(positions - 0.4, positions + 0.4),
+                y_limits=(0, max(counts.max().item() if len(counts) > 0 else 1, 1) * 1.05),
+            )
+            panel.fill_rectangles(positions - 0.4, positions + 0.4, torch.zeros_like(counts), counts, _BLUE)
+            panel.draw_rectangles(positions - 0.4, positions + 0.4, torch.zeros_like(counts), counts, _BLACK)
+            panel.draw_frame()
+
+        return canvas.to_image()
+
+    def lag_plot(self, x: pl.Series, y: pl.Series, lag: int) -> Image:  # noqa: ARG002
+        return _draw_scatter_plot(x, y)
+
+    def line_plot(
+        self,
+        x: pl.Series,
+        y: pl.Series,
+        confidence_interval: pl.Series,
+        x_name: str,  # noqa: ARG002
+        y_name: str,  # noqa: ARG002
+    ) -> Image:
+        x_values = _to_tensor(x)
+        y_values = _to_tensor(y)
+        lower = y_values - _to_tensor(confidence_interval)
+        upper = y_values + _to_tensor(confidence_interval)
+
+        canvas = _RasterCanvas(_SINGLE_PLOT_WIDTH, _SINGLE_PLOT_HEIGHT)
+        panel = canvas.add_panel(
+            *_cell_of_single_plot(),
+            x_limits=_padded_limits(x_values),
+            y_limits=_padded_limits(y_values, lower, upper),
+        )
+        panel.fill_between(x_values, lower, upper, _LIGHT_BLUE, alpha=0.15)
+        panel.draw_lines(x_values, y_values, _BLUE)
+        panel.draw_frame()
+
+        return canvas.to_image()
+
+    def scatter_plot(self, x: pl.Series, y: pl.Series, x_name: str, y_name: str) -> Image:  # noqa: ARG002
+        return _draw_scatter_plot(x, y)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Plots
+# ----------------------------------------------------------------------------------------------------------------------
+
+
+def _draw_scatter_plot(x: pl.Series, y: pl.Series) -> Image:
+    x_values = _to_tensor(x)
+    y_values = _to_tensor(y)
+
+    canvas = _RasterCanvas(_SINGLE_PLOT_WIDTH, _SINGLE_PLOT_HEIGHT)
+    panel = canvas.add_panel(
+        *_cell_of_single_plot(),
+        x_limits=_padded_limits(x_values),
+        y_limits=_padded_limits(y_values),
+    )
+    panel.draw_points(x_values, y_values, _BLUE)
+    panel.draw_frame()
+
+    return canvas.to_image()
+
+
+def _compute_box_plot_statistics_of_series(values: pl.Series) -> dict[str, Any]:
+    import polars as pl
+
+    values = values.cast(pl.Float64).drop_nulls().drop_nans()
+    if values.len() == 0:
+        return {"median": None}
+
+    # Tukey's rule, like matplotlib and seaborn: Whiskers end at the most extreme values within 1.5 IQR of the box
+    first_quartile = values.quantile(0.25, interpolation="linear")
+    third_quartile = values.quantile(0.75, interpolation="linear")
+    spread = 1.5 * (third_quartile - first_quartile)
+    is_outlier = (values < first_quartile - spread) | (values > third_quartile + spread)
+    return {
+        "lower_whisker": values.filter(~is_outlier).min(),
+        "first_quartile": first_quartile,
+        "median": values.median(),
+        "third_quartile": third_quartile,
+        "upper_whisker": values.filter(~is_outlier).max(),
+        "outliers": values.filter(is_outlier).to_list(),
+    }
+
+
+def _draw_box_plot(canvas: _RasterCanvas, cell: tuple[int, int, int, int], statistics: dict[str, Any]) -> None:
+    import torch
+
+    if statistics["median"] is None:
+        canvas.add_panel(*cell, x_limits=(-0.5, 0.5), y_limits=(0, 1)).draw_frame()
+        return
+
+    first_quartile = statistics["first_quartile"]
+    median = statistics["median"]
+    third_quartile = statistics["third_quartile"]
+    lower_whisker = statistics["lower_whisker"]
+    upper_whisker = statistics["upper_whisker"]
+    outliers = _to_tensor(statistics["outliers"])
+
+    y_limits = _padded_limits(_to_tensor([lower_whisker, upper_whisker]), outliers)
+    panel = canvas.add_panel(*cell, x_limits=(-0.5, 0.5), y_limits=y_limits)
+
+    def line(x0: float, x1: float, y0: float, y1: float, color: tuple[int, int, int]) -> None:
+        panel.draw_lines(
+            torch.tensor([x0, x1], dtype=torch.float64),
+            torch.tensor([y0, y1], dtype=torch.float64),
+            color,
+        )
+
+    line(0, 0, lower_whisker, first_quartile, _BLACK)
+    line(0, 0, third_quartile, upper_whisker, _BLACK)
+    line(-0.1, 0.1, lower_whisker, lower_whisker, _BLACK)
+    line(-0.1, 0.1, upper_whisker, upper_whisker, _BLACK)
+
+    box = [torch.tensor([bound], dtype=torch.float64) for bound in (-0.2, 0.2, first_quartile, third_quartile)]
+    panel.fill_rectangles(*box, _BLUE)
+    panel.draw_rectangles(*box, _BLACK)
+    line(-0.2, 0.2, median, median, _ORANGE)
+
+    panel.draw_points(torch.zeros_like(outliers), outliers, _BLACK)
+    panel.draw_frame()
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Layout
+# ----------------------------------------------------------------------------------------------------------------------
+
+
+def _cell_of_single_plot() -> tuple[int, int, int, int]:
+    return _inner_box(0, 0, _SINGLE_PLOT_WIDTH, _SINGLE_PLOT_HEIGHT)
+
+
+def _create_grid(number_of_plots: int) -> tuple[_RasterCanvas, Iterator[tuple[int, int, int, int]]]:
+    """Create a canvas for a grid of plots with at most three columns, like the matplotlib backend does."""
+    number_of_columns = min(3, number_of_plots)
+    number_of_rows = 1 + (number_of_plots - 1) // number_of_columns
+
+    if number_of_plots == 1:
+        return _RasterCanvas(_SINGLE_PLOT_WIDTH, _SINGLE_PLOT_HEIGHT), iter([_cell_of_single_plot()])
+
+    canvas = _RasterCanvas(number_of_columns * _GRID_CELL_SIZE, number_of_rows * _GRID_CELL_SIZE)
+    cells = (
+        _inner_box(
+            (index % number_of_columns) * _GRID_CELL_SIZE,
+            (index // number_of_columns) * _GRID_CELL_SIZE,
+            _GRID_CELL_SIZE,
+            _GRID_CELL_SIZE,
+        )
+        for index in range(number_of_plots)
+    )
+    return canvas, cells
+
+
+def _inner_box(left: int, top: int, width: int, height: int) -> tuple[int, int, int, int]:
+    """Leave the same relative margins around a panel as matplotlib does around its axes."""
+    return (
+        left + round(0.125 * width),
+        top + round(0.12 * height),
+        round(0.775 * width),
+        round(0.77 * height),
+    )
+
+
+def _padded_limits(*values: Tensor) -> tuple[float, float]:
+    """Return the range of the finite values, expanded by 5% on both sides like matplotlib does."""
+    import torch
+
+    finite = torch.cat([value[value.isfinite()] for value in values])
+    if finite.numel() == 0:
+        return 0.0, 1.0
+
+    low = finite.min().item()
+    high = finite.max().item()
+    if low == high:
+        return low - 0.5, high + 0.5
+
+    padding = 0.05 * (high - low)
+    return low - padding, high + padding
+
+
+def _to_tensor(values: Any) -> Tensor:
+    """Convert a polars series, a numpy array, or a list to a tensor of doubles. Missing values become NaN."""
+    import numpy as np
+    import polars as pl
+    import torch
+
+    if isinstance(values, pl.Series):
+        values = values.cast(pl.Float64).fill_null(float("nan")).to_numpy()
+
+    return torch.tensor(np.asarray(values, dtype=np.float64), device="cpu")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Drawing
+# ----------------------------------------------------------------------------------------------------------------------
+
+
+class _RasterCanvas:
+    """White RGBA pixels that panels are drawn on."""
+
+    def __init__(self, width: int, height: int) -> None:
+        import torch
+
+        self._pixels: Tensor = torch.full((4, height, width), 255, dtype=torch.uint8, device="cpu")
+
+    def add_panel(
+        self,
+        left: int,
+        top: int,
+        width: int,
+        height: int,
+        *,
+        x_limits: tuple[float, float],
+        y_limits: tuple[float, float],
+    ) -> _RasterPanel:
+        return _RasterPanel(self._pixels, left, top, width, height, x_limits=x_limits, y_limits=y_limits)
+
+    def to_image(self) -> Image:
+        _init_default_device()
+
+        return Image(image_tensor=self._pixels.to(_get_device()))
+
+
+class _RasterPanel:
+    """A rectangular area of a canvas with its own data coordinates. Nothing is drawn outside the area."""
+
+    def __init__(
+        self,
+        pixels: Tensor,
+        left: int,
+        top: int,
+        width: int,
+        height: int,
+        *,
+        x_limits: tuple[float, float],
+        y_limits: tuple[float, float],
+    ) -> None:
+        self._pixels = pixels
+        self._left = left
+        self._top = top
+        self._width = width
+        self._height = height
+        self._x_min, self._x_max = x_limits
+        self._y_min, self._y_max = y_limits
+
+    # Coordinates ------------------------------------------------------------------------------------------------------
+
+    def _to_pixel_columns(self, x: Tensor) -> Tensor:
+        scaled = (x - self._x_min) / (self._x_max - self._x_min) * (self._width - 1)
+        return self._left + scaled.nan_to_num(-1).clamp(-1, self._width).round().long()
+
+    def _to_pixel_rows(self, y: Tensor) -> Tensor:
+        scaled = (y - self._y_min) / (self._y_max - self._y_min) * (self._height - 1)
+        return self._top + self._height - 1 - scaled.nan_to_num(-1).clamp(-1, self._height).round().long()
+
+    def _set_pixels(self, columns: Tensor, rows: Tensor, color: tuple[int, int, int], alpha: float = 1.0) -> None:
+        import torch
+
+        is_inside = (
+            (columns >= self._left)
+            & (columns < self._left + self._width)
+            & (rows >= self._top)
+            & (rows < self._top + self._height)
+        )
+        columns = columns[is_inside]
+        rows = rows[is_inside]
+
+        new_color = torch.tensor(color, dtype=torch.float32)[:, None]
+        if alpha < 1:
+            old_color = self._pixels[:3, rows, columns].float()
+            new_color = old_color * (1 - alpha) + new_color * alpha
+
+        self._pixels[:3, rows, columns] = new_color.round().to(torch.uint8)
+
+    # Shapes -----------------------------------------------------------------------------------------------------------
+
+    def draw_frame(self) -> None:
+        """Draw the black border around the panel."""
+        right = self._left + self._width - 1
+        bottom = self._top + self._height - 1
+
+        self._pixels[:3, self._top, self._left : right + 1] = 0
+        self._pixels[:3, bottom, self._left : right + 1] = 0
+        self._pixels[:3, self._top : bottom + 1, self._left] = 0
+        self._pixels[:3, self._top : bottom + 1, right] = 0
+
+    def draw_lines(self, x: Tensor, y: Tensor, color: tuple[int, int, int]) -> None:
+        """Connect consecutive points with straight lines. Segments with a missing endpoint are skipped."""
+        import torch
+
+        if len(x) < 2:
+            self.draw_points(x, y, color, radius=0)
+            return
+
+        is_valid = (x.isfinite() & y.isfinite())[:-1] & (x.isfinite() & y.isfinite())[1:]
+        start_columns = self._to_pixel_columns(x[:-1])[is_valid]
+        end_columns = self._to_pixel_columns(x[1:])[is_valid]
+        start_rows = self._to_pixel_rows(y[:-1])[is_valid]
+        end_rows = self._to_pixel_rows(y[1:])[is_valid]
+
+        # Sample every segment once per pixel along its longer axis
+        lengths = torch.maximum((end_columns - start_columns).abs(), (end_rows - start_rows).abs()) + 1
+        segments = torch.repeat_interleave(torch.arange(len(lengths)), lengths)
+        steps = torch.arange(int(lengths.sum())) - (torch.cumsum(lengths, 0) - lengths)[segments]
+        fractions = steps / (lengths[segments] - 1).clamp(min=1)
+
+        columns = start_columns[segments] + fractions * (end_columns - start_columns)[segments]
+        rows = start_rows[segments] + fractions * (end_rows - start_rows)[segments]
+        self._set_pixels(columns.round().long(), rows.round().long(), color)
+
+    def draw_points(self, x: Tensor, y: Tensor, color: tuple[int, int, int], *, radius: int = 2) -> None:
+        """Draw a filled disk around every point. Points with missing coordinates are skipped."""
+        import torch
+
+        is_valid = x.isfinite() & y.isfinite()
+        columns = self._to_pixel_columns(x[is_valid])
+        rows = self._to_pixel_rows(y[is_valid])
+
+        offsets = torch.arange(-radius, radius + 1)
+        offset_columns, offset_rows = torch.meshgrid(offsets, offsets, indexing="xy")
+        in_disk = offset_columns**2 + offset_rows**2 <= radius**2 + radius
+        offset_columns = offset_columns[in_disk]
+        offset_rows = offset_rows[in_disk]
+
+        self._set_pixels(
+            (columns[:, None] + offset_columns[None, :]).flatten(),
+            (rows[:, None] + offset_rows[None, :]).flatten(),
+            color,
+        )
+
+    def fill_rectangles(
+        self,
+        x_start: Tensor,
+        x_end: Tensor,
+        y_start: Tensor,
+        y_end: Tensor,
+        color: tuple[int, int, int],
+    ) -> None:
+        """Fill axis-aligned rectangles, which are given by the coordinates of two opposite corners."""
+        import torch
+
+        left, right, top, bottom = self._to_pixel_box(x_start, x_end, y_start, y_end)
+        for i in range(len(left)):
+            if left[i] > right[i] or top[i] > bottom[i]:
+                continue
+            self._pixels[:3, top[i] : bottom[i] + 1, left[i] : right[i] + 1] = torch.tensor(
+                color,
+                dtype=torch.uint8,
+            )[:, None, None]
+
+    def draw_rectangles(
+        self,
+        x_start: Tensor,
+        x_end: Tensor,
+        y_start: Tensor,
+        y_end: Tensor,
+        color: tuple[int, int, int],
+    ) -> None:
+        """Draw the outlines of axis-aligned rectangles, which are given by the coordinates of two opposite corners."""
+        import torch
+
+        left, right, top, bottom = self._to_pixel_box(x_start, x_end, y_start, y_end)
+        for i in range(len(left)):
+            if left[i] > right[i] or top[i] > bottom[i]:
+                continue
+            horizontal = torch.arange(left[i], right[i] + 1)
+            vertical = torch.arange(top[i], bottom[i] + 1)
+            self._set_pixels(horizontal, torch.full_like(horizontal, top[i]), color)
+            self._set_pixels(horizontal, torch.full_like(horizontal, bottom[i]), color)
+            self._set_pixels(torch.full_like(vertical, left[i]), vertical, color)
+            self._set_pixels(torch.full_like(vertical, right[i]), vertical, color)
+
+    def _to_pixel_box(
+        self,
+        x_start: Tensor,
+        x_end: Tensor,
+        y_start: Tensor,
+        y_end: Tensor,
+    ) -> tuple[list[int], list[int], list[int], list[int]]:
+        import torch
+
+        right_edge = self._left + self._width - 1
+        bottom_edge = self._top + self._height - 1
+
+        columns = torch.stack([self._to_pixel_columns(x_start), self._to_pixel_columns(x_end)])
+        rows = torch.stack([self._to_pixel_rows(y_start), self._to_pixel_rows(y_end)])
+        return (
+            columns.min(dim=0).values.clamp(self._left, right_edge).tolist(),
+            columns.max(dim=0).values.clamp(self._left, right_edge).tolist(),
+            rows.min(dim=0).values.clamp(self._top, bottom_edge).tolist(),
+            rows.max(dim=0).values.clamp(self._top, bottom_edge).tolist(),
+        )
+
+    def fill_between(
+        self,
+        x: Tensor,
+        lower: Tensor,
+        upper: Tensor,
+        color: tuple[int, int, int],
+        *,
+        alpha: float = 1.0,
+    ) -> None:
+        """Fill the area between two curves that share their x-coordinates. Missing values leave gaps."""
+        import torch
+
+        order = torch.argsort(x)
+        x, lower, upper = x[order], lower[order], upper[order]
+        is_valid = x.isfinite() & lower.isfinite() & upper.isfinite()
+        x, lower, upper = x[is_valid], lower[is_valid], upper[is_valid]
+        if len(x) < 2:
+            return
+
+        # Interpolate both curves at the center of every pixel column between the first and the last point
+        columns = torch.arange(int(self._to_pixel_columns(x[:1])), int(self._to_pixel_columns(x[-1:])) + 1)
+        column_x = self._x_min + (columns - self._left) / (self._width - 1) * (self._x_max - self._x_min)
+        right = torch.searchsorted(x, column_x).clamp(1, len(x) - 1)
+        left = right - 1
+        fraction = ((column_x - x[left]) / (x[right] - x[left])).nan_to_num(0).clamp(0, 1)
+        top_rows = self._to_pixel_rows(upper[left] + fraction * (upper[right] - upper[left]))
+        bottom_rows = self._to_pixel_rows(lower[left] + fraction * (lower[right] - lower[left]))
+
+        rows = torch.arange(self._top, self._top + self._height)[:, None]
+        is_filled = (rows >= top_rows[None, :]) & (rows <= bottom_rows[None, :])
+        filled_rows, filled_columns = is_filled.nonzero(as_tuple=True)
+        self._set_pixels(columns[filled_columns], rows[filled_rows, 0], color, alpha)
+
+    def draw_matrix(self, colors: Tensor) -> None:
+        """Stretch a matrix of RGB colors with the shape (3, rows, columns) across the whole panel."""
+        import torch
+
+        _, number_of_rows, number_of_columns = colors.shape
+        row_indices = torch.arange(self._height) * number_of_rows // self._height
+        column_indices = torch.arange(self._width) * number_of_columns // self._width
+
+        self._pixels[:3, self._top : self._top + self._height, self._left : self._left + self._width] = (
+            colors[:, row_indices[:, None], column_indices[None, :]].round().to(torch.uint8)
+        )
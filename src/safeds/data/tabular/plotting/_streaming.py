@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import polars as pl
+
+_T = TypeVar("_T")
+
+
+def _reduce_chunks(
+    lazy_frame: pl.LazyFrame,
+    summarize: Callable[[pl.DataFrame], _T],
+    merge: Callable[[_T, _T], _T],
+) -> _T | None:
+    """
+    Summarize every chunk of a lazy frame and merge the summaries, without ever collecting the whole frame.
+
+    The query runs on the streaming engine of polars, which reads sources like CSV or Parquet files in chunks. Each chunk
+    is summarized as soon as it arrives and dropped afterward, so the memory usage only depends on the size of a chunk
+    and of the summaries. If some part of the query cannot be streamed, polars falls back to its in-memory engine and
+    passes larger chunks, which gives the same result.
+
+    Parameters
+    ----------
+    lazy_frame:
+        The frame to summarize. Select only the columns that are needed, so others are not even read.
+    summarize:
+        Compute the summary of a single chunk.
+    merge:
+        Combine two summaries into one. This must be associative and commutative, since chunks may arrive in any
+        order.
+
+    Returns
+    -------
+    summary:
+        The merged summary of all chunks, or None if there are no chunks.
+    """
+    import threading
+
+    lock = threading.Lock()
+    summaries: list[_T] = []
+
+    def process_chunk(chunk: pl.DataFrame) -> pl.DataFrame:
+        summary = summarize(chunk)
+        with lock:
+            summaries[:] = [merge(summaries[0], summary)] if summaries else [summary]
+        return chunk.clear()
+
+    # CSE cannot be combined with streaming and would only cause a warning
+    lazy_frame.map_batches(process_chunk, streamable=True).collect(streaming=True, comm_subplan_elim=False)
+
+    return summaries[0] if summaries else None
@@ -3,12 +3,19 @@ from __future__ import annotations
 import warnings
 from typing import TYPE_CHECKING
 
-from safeds._utils import _figure_to_image
-from safeds._validation import _check_columns_exist
+from safeds._config import _get_plot_backend
+from safeds._validation import _check_bounds, _check_columns_exist, _ClosedBound, _OpenBound
 from safeds.exceptions import NonNumericColumnError
 
+from ._box_plot_statistics import _compute_box_plot_statistics
+from ._correlation import _compute_correlation_matrix
+from ._histograms import _compute_histograms
+from ._parallel import _plot_many, _split_into_grid_rows, _split_into_tiles, _stack_vertically
+from ._plot_cache import _cached_plot
+from ._point_density import _DEFAULT_MAXIMUM_NUMBER_OF_POINTS, _compute_point_density
+
 if TYPE_CHECKING:
-    from safeds.data.image.containers import Image
+    from safeds.data.image.containers import Image, ImageList
     from safeds.data.tabular.containers import Table
 
 
@@ -31,10 +38,27 @@ class TablePlotter:
     def __init__(self, table: Table):
         self._table: Table = table
 
-    def box_plots(self) -> Image:
+    @_cached_plot
+    def box_plots(self, *, number_of_workers: int = 1, streaming: bool = False, rank_error: float = 0.01) -> Image:
         """
         Plot a boxplot for every numerical column.
 
+        Parameters
+        ----------
+        number_of_workers:
+            The number of processes that render the plot. If this is greater than 1, every row of the grid is rendered
+            as a separate figure in a process pool, and the figures are stacked afterward. This is much faster for wide
+            tables. Default is 1.
+        streaming:
+            Whether to compute the statistics of the boxes in two streaming passes over the data instead of loading all
+            values. This allows plotting tables that are backed by files larger than the memory. The quartiles are then
+            estimated with a quantile sketch, and at most 1000 distinct outliers per side are shown. The sketches are
+            kept with the table, so plotting its columns again only needs a single pass. Default is False.
+        rank_error:
+            The maximum error of the estimated quartiles when `streaming` is True, as a fraction of the number of
+            values. For example, with 0.01 the estimated median lies between the 49th and the 51st percentile. Smaller
+            values need more memory. Must be between 0 and 1 (both exclusive). Default is 0.01.
+
         Returns
         -------
         plot:
@@ -44,6 +68,8 @@ class TablePlotter:
         ------
         NonNumericColumnError
             If the table contains only non-numerical columns.
+        OutOfBoundsError
+            If `number_of_workers` is less than 1 or `rank_error` is not between 0 and 1.
 
         Examples
         --------
@@ -51,54 +77,111 @@ class TablePlotter:
         >>> table = Table({"a":[1, 2], "b": [3, 42]})
         >>> image = table.plot.box_plots()
         """
-        # TODO: implement using matplotlib and polars
-        import matplotlib.pyplot as plt
-        import seaborn as sns
+        _check_bounds("number_of_workers", number_of_workers, lower_bound=_ClosedBound(1))
+        _check_bounds("rank_error", rank_error, lower_bound=_OpenBound(0), upper_bound=_OpenBound(1))
 
         numerical_table = self._table.remove_non_numeric_columns()
         if numerical_table.number_of_columns == 0:
             raise NonNumericColumnError("This table contains only non-numerical columns.")
-        col_wrap = min(numerical_table.number_of_columns, 3)
-
-        data = numerical_table._lazy_frame.melt(value_vars=numerical_table.column_names).collect()
-        grid = sns.FacetGrid(data, col="variable", col_wrap=col_wrap, sharex=False, sharey=False)
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                "ignore",
-                message="Using the boxplot function without specifying `order` is likely to produce an incorrect plot.",
-            )
-            grid.map(sns.boxplot, "variable", "value")
-        grid.set_xlabels("")
-        grid.set_ylabels("")
-        grid.set_titles("{col_name}")
-        for axes in grid.axes.flat:
-            axes.set_xticks([])
-        plt.tight_layout()
-        fig = grid.fig
-
-        return _figure_to_image(fig)
-
-    def correlation_heatmap(self) -> Image:
+
+        backend = _get_plot_backend()
+        rows = _split_into_grid_rows(numerical_table.column_names)
+
+        if streaming:
+            import polars as pl
+
+            # Use the original table, since the sketches are cached there
+            statistics = _compute_box_plot_statistics(self._table, rank_error=rank_error)
+            if number_of_workers == 1 or len(rows) == 1:
+                return backend.box_plots_from_statistics(statistics)
+
+            arguments = ((statistics.filter(pl.col("column").is_in(row)),) for row in rows)
+            return _stack_vertically(_plot_many(backend, "box_plots_from_statistics", arguments, number_of_workers))
+
+        if number_of_workers == 1 or len(rows) == 1:
+            return backend.box_plots(numerical_table._data_frame)
+
+        arguments = ((numerical_table._lazy_frame.select(row).collect(),) for row in rows)
+        return _stack_vertically(_plot_many(backend, "box_plots", arguments, number_of_workers))
+
+    def box_plot_list(self, *, columns_per_image: int = 1, number_of_workers: int = 1) -> ImageList:
+        """
+        Plot boxplots for the numerical columns into separate images.
+
+        Parameters
+        ----------
+        columns_per_image:
+            The number of columns that are plotted into each image. Default is 1.
+        number_of_workers:
+            The number of processes that render the images in parallel. Default is 1.
+
+        Returns
+        -------
+        plots:
+            The plots, in the order of the columns.
+
+        Raises
+        ------
+        NonNumericColumnError
+            If the table contains only non-numerical columns.
+        OutOfBoundsError
+            If `columns_per_image` or `number_of_workers` is less than 1.
+
+        Examples
+        --------
+        >>> from safeds.data.tabular.containers import Table
+        >>> table = Table({"a":[1, 2], "b": [3, 42]})
+        >>> images = table.plot.box_plot_list()
+        >>> images.number_of_images
+        2
+        """
+        from safeds.data.image.containers import ImageList
+
+        _check_bounds("columns_per_image", columns_per_image, lower_bound=_ClosedBound(1))
+        _check_bounds("number_of_workers", number_of_workers, lower_bound=_ClosedBound(1))
+
+        numerical_table = self._table.remove_non_numeric_columns()
+        if numerical_table.number_of_columns == 0:
+            raise NonNumericColumnError("This table contains only non-numerical columns.")
+
+        arguments = (
+            (numerical_table._lazy_frame.select(tile).collect(),)
+            for tile in _split_into_tiles(numerical_table.column_names, columns_per_image)
+        )
+        return ImageList.from_images(list(_plot_many(_get_plot_backend(), "box_plots", arguments, number_of_workers)))
+
+    @_cached_plot
+    def correlation_heatmap(self, *, maximum_number_of_rows: int | None = None) -> Image:
         """
         Plot a correlation heatmap for all numerical columns of this `Table`.
 
+        The correlations are computed in a single streaming pass over the data, like in
+        `table.compute_correlation_matrix()`.
+
+        Parameters
+        ----------
+        maximum_number_of_rows:
+            If the table has more rows, the correlations are estimated from a random sample of about this many rows.
+            Must be greater than or equal to 2. If None, all rows are used. Default is None.
+
         Returns
         -------
         plot:
             The plot as an image.
 
+        Raises
+        ------
+        OutOfBoundsError
+            If `maximum_number_of_rows` is less than 2.
+
         Examples
         --------
         >>> from safeds.data.tabular.containers import Table
         >>> table = Table.from_dict({"temperature": [10, 15, 20, 25, 30], "sales": [54, 74, 90, 206, 210]})
         >>> image = table.plot.correlation_heatmap()
         """
-        # TODO: implement using matplotlib and polars
-        #  https://stackoverflow.com/questions/33282368/plotting-a-2d-heatmap
-        import matplotlib.pyplot as plt
-        import seaborn as sns
-
-        only_numerical = self._table.remove_non_numeric_columns()._data_frame.fill_null(0)
+        if maximum_number_of_rows is not None:
+            _check_bounds("maximum_number_of_rows", maximum_number_of_rows, lower_bound=_ClosedBound(2))
 
         if self._table.number_of_rows == 0:
             warnings.warn(
@@ -106,101 +189,102 @@ class TablePlotter:
                 stacklevel=2,
             )
 
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                "ignore",
-                message=(
-                    "Attempting to set identical low and high (xlims|ylims) makes transformation singular;"
-                    " automatically expanding."
-                ),
-            )
-            fig = plt.figure()
-            sns.heatmap(
-                data=only_numerical.corr().to_numpy(),
-                vmin=-1,
-                vmax=1,
-                xticklabels=only_numerical.columns,
-                yticklabels=only_numerical.columns,
-                cmap="vlag",
-            )
-            plt.tight_layout()
-
-        return _figure_to_image(fig)
+        numeric_names = [name for name in self._table.column_names if self._table.get_column_type(name).is_numeric]
+        correlation_matrix = _compute_correlation_matrix(self._table, maximum_number_of_rows=maximum_number_of_rows)
+        return _get_plot_backend().correlation_heatmap(numeric_names, correlation_matrix)
 
-    def histograms(self, *, maximum_number_of_bins: int = 10) -> Image:
+    @_cached_plot
+    def histograms(self, *, maximum_number_of_bins: int = 10, number_of_workers: int = 1) -> Image:
         """
         Plot a histogram for every column.
 
+        The histograms are computed in two streaming passes over the data, so tables that are backed by files larger than
+        the memory can be plotted as well.
+
         Parameters
         ----------
         maximum_number_of_bins:
             The maximum number of bins to use in the histogram. Default is 10.
+        number_of_workers:
+            The number of processes that render the plot. If this is greater than 1, every row of the grid is rendered
+            as a separate figure in a process pool, and the figures are stacked afterward. This is much faster for wide
+            tables. Default is 1.
 
         Returns
         -------
         plot:
             The plot as an image.
 
+        Raises
+        ------
+        OutOfBoundsError
+            If `number_of_workers` is less than 1.
+
         Examples
         --------
         >>> from safeds.data.tabular.containers import Table
         >>> table = Table({"a": [2, 3, 5, 1], "b": [54, 74, 90, 2014]})
         >>> image = table.plot.histograms()
         """
-        import matplotlib.pyplot as plt
-        import polars as pl
+        _check_bounds("number_of_workers", number_of_workers, lower_bound=_ClosedBound(1))
+
+        backend = _get_plot_backend()
+        histograms = _compute_histograms(self._table, maximum_number_of_bins)
+        rows = _split_into_grid_rows(list(histograms.items()))
+        if number_of_workers == 1 or len(rows) <= 1:
+            return backend.histograms(histograms)
+
+        # Histograms are small, so they are computed upfront in one query and only the drawing is distributed
+        arguments = ((dict(row),) for row in rows)
+        return _stack_vertically(_plot_many(backend, "histograms", arguments, number_of_workers))
+
+    def histogram_list(
+        self,
+        *,
+        maximum_number_of_bins: int = 10,
+        columns_per_image: int = 1,
+        number_of_workers: int = 1,
+    ) -> ImageList:
+        """
+        Plot histograms for the columns into separate images.
+
+        Parameters
+        ----------
+        maximum_number_of_bins:
+            The maximum number of bins to use in the histogram. Default is 10.
+        columns_per_image:
+            The number of columns that are plotted into each image. Default is 1.
+        number_of_workers:
+            The number of processes that render the images in parallel. Default is 1.
 
-        n_cols = min(3, self._table.number_of_columns)
-        n_rows = 1 + (self._table.number_of_columns - 1) // n_cols
-
-        if n_cols == 1 and n_rows == 1:
-            fig, axs = plt.subplots(1, 1, tight_layout=True)
-            one_col = True
-        else:
-            fig, axs = plt.subplots(n_rows, n_cols, tight_layout=True, figsize=(n_cols * 3, n_rows * 3))
-            one_col = False
-
-        col_names = self._table.column_names
-        for col_name, ax in zip(col_names, axs.flatten() if not one_col else [axs], strict=False):
-            column = self._table.get_column(col_name)
-            distinct_values = column.get_distinct_values()
-
-            ax.set_title(col_name)
-            ax.set_xlabel("")
-            ax.set_ylabel("")
-
-            if column.is_numeric and len(distinct_values) > maximum_number_of_bins:
-                min_val = (column.min() or 0) - 1e-6  # Otherwise the minimum value is not included in the first bin
-                max_val = column.max() or 0
-                bin_count = min(maximum_number_of_bins, len(distinct_values))
-                bins = [
-                    *(pl.Series(range(bin_count + 1)) / bin_count * (max_val - min_val) + min_val),
-                ]
-
-                bars = [f"{round((bins[i] + bins[i + 1]) / 2, 2)}" for i in range(len(bins) - 1)]
-                hist = (
-                    column._series.hist(bins=bins)
-                    .slice(1, length=maximum_number_of_bins)
-                    .get_column("count")
-                    .to_numpy()
-                )
-
-                ax.bar(bars, hist, edgecolor="black")
-                ax.set_xticks(range(len(hist)), bars, rotation=45, horizontalalignment="right")
-            else:
-                value_counts = (
-                    column._series.drop_nulls().value_counts().sort(column.name).slice(0, length=maximum_number_of_bins)
-                )
-                distinct_values = value_counts.get_column(column.name).cast(pl.String).to_numpy()
-                hist = value_counts.get_column("count").to_numpy()
-                ax.bar(distinct_values, hist, edgecolor="black")
-                ax.set_xticks(range(len(distinct_values)), distinct_values, rotation=45, horizontalalignment="right")
-
-        for i in range(len(col_names), n_rows * n_cols):
-            fig.delaxes(axs.flatten()[i])  # Remove empty subplots
-
-        return _figure_to_image(fig)
+        Returns
+        -------
+        plots:
+            The plots, in the order of the columns.
 
+        Raises
+        ------
+        OutOfBoundsError
+            If `columns_per_image` or `number_of_workers` is less than 1.
+
+        Examples
+        --------
+        >>> from safeds.data.tabular.containers import Table
+        >>> table = Table({"a": [2, 3, 5, 1], "b": [54, 74, 90, 2014]})
+        >>> images = table.plot.histogram_list()
+        >>> images.number_of_images
+        2
+        """
+        from safeds.data.image.containers import ImageList
+
+        _check_bounds("columns_per_image", columns_per_image, lower_bound=_ClosedBound(1))
+        _check_bounds("number_of_workers", number_of_workers, lower_bound=_ClosedBound(1))
+
+        histograms = _compute_histograms(self._table, maximum_number_of_bins)
+        arguments = ((dict(tile),) for tile in _split_into_tiles(list(histograms.items()), columns_per_image))
+        return ImageList.from_images(list(_plot_many(_get_plot_backend(), "histograms", arguments, number_of_workers)))
+
+    @_cached_plot
     def line_plot(self, x_name: str, y_name: str) -> Image:
         """
         Create a line plot for two columns in the table.
@@ -243,7 +327,6 @@ class TablePlotter:
         if not self._table.get_column(y_name).is_numeric:
             raise NonNumericColumnError(y_name)
 
-        import matplotlib.pyplot as plt
         import polars as pl
 
         grouped = (
@@ -260,42 +343,33 @@ class TablePlotter:
         y = grouped.get_column("mean")
         confidence_interval = 1.96 * grouped.get_column("standard_deviation") / grouped.get_column("count").sqrt()
 
-        fig, ax = plt.subplots()
-        ax.plot(
-            x,
-            y,
-        )
-        ax.fill_between(
-            x,
-            y - confidence_interval,
-            y + confidence_interval,
-            color="lightblue",
-            alpha=0.15,
-        )
-        ax.set(
-            xlabel=x_name,
-            ylabel=y_name,
-        )
-        ax.set_xticks(ax.get_xticks())
-        ax.set_xticklabels(
-            ax.get_xticklabels(),
-            rotation=45,
-            horizontalalignment="right",
-        )  # rotate the labels of the x Axis to prevent the chance of overlapping of the labels
-        fig.tight_layout()
-
-        return _figure_to_image(fig)
+        return _get_plot_backend().line_plot(x, y, confidence_interval, x_name, y_name)
 
-    def scatter_plot(self, x_name: str, y_name: str) -> Image:
+    @_cached_plot
+    def scatter_plot(
+        self,
+        x_name: str,
+        y_name: str,
+        *,
+        maximum_number_of_points: int = _DEFAULT_MAXIMUM_NUMBER_OF_POINTS,
+    ) -> Image:
         """
         Create a scatter plot for two columns in the table.
 
+        If the table has more rows than `maximum_number_of_points`, the points are not drawn one by one. Instead, they
+        are counted in the cells of a fine grid, and the plot shows the number of points per cell with a logarithmic
+        color scale. This is much faster for millions of points and shows where they are concentrated, which single
+        markers would hide.
+
         Parameters
         ----------
         x_name:
             The name of the column to be plotted on the x-axis.
         y_name:
             The name of the column to be plotted on the y-axis.
+        maximum_number_of_points:
+            The maximum number of points that are drawn individually. Must be greater than or equal to 0. Default is
+            100000.
 
         Returns
         -------
@@ -308,6 +382,8 @@ class TablePlotter:
             If a column does not exist.
         TypeError
             If a column is not numeric.
+        OutOfBoundsError
+            If `maximum_number_of_points` is less than 0.
 
         Examples
         --------
@@ -321,6 +397,7 @@ class TablePlotter:
         >>> image = table.plot.scatter_plot("a", "b")
         """
         _check_columns_exist(self._table, [x_name, y_name])
+        _check_bounds("maximum_number_of_points", maximum_number_of_points, lower_bound=_ClosedBound(0))
 
         # TODO: pass list of columns names + extract validation
         if not self._table.get_column(x_name).is_numeric:
@@ -328,25 +405,20 @@ class TablePlotter:
         if not self._table.get_column(y_name).is_numeric:
             raise NonNumericColumnError(y_name)
 
-        import matplotlib.pyplot as plt
+        x = self._table.get_column(x_name)._series
+        y = self._table.get_column(y_name)._series
 
-        fig, ax = plt.subplots()
-        ax.scatter(
-            x=self._table.get_column(x_name)._series,
-            y=self._table.get_column(y_name)._series,
-        )
-        ax.set(
-            xlabel=x_name,
-            ylabel=y_name,
-        )
-        ax.set_xticks(ax.get_xticks())
-        ax.set_xticklabels(
-            ax.get_xticklabels(),
-            rotation=45,
-            horizontalalignment="right",
-        )  # rotate the labels of the x Axis to prevent the chance of overlapping of the labels
-        fig.tight_layout()
+        if len(x) > maximum_number_of_points:
+            return _get_plot_backend().density_plot(*_compute_point_density(x, y), x_name, y_name)
 
-        return _figure_to_image(fig)
+        return _get_plot_backend().scatter_plot(x, y, x_name, y_name)
 
     # TODO: equivalent to Column.plot_compare_columns that takes a list of column names (index_plot)?
+
+    def _compute_fingerprint(self) -> int | None:
+        # Used as part of the key in the plot cache. Hashing a table that is read from files would load all its data
+        # into memory, which plots of such tables avoid, so they are not cached.
+        if not self._table._is_in_memory():
+            return None
+
+        return self._table.fingerprint()
@@ -13,6 +13,7 @@ if TYPE_CHECKING:
     from ._simple_imputer import SimpleImputer
     from ._standard_scaler import StandardScaler
     from ._table_transformer import TableTransformer
+    from ._transformer_pipeline import TransformerPipeline
 
 apipkg.initpkg(
     __name__,
@@ -25,6 +26,7 @@ apipkg.initpkg(
         "SimpleImputer": "._simple_imputer:SimpleImputer",
         "StandardScaler": "._standard_scaler:StandardScaler",
         "TableTransformer": "._table_transformer:TableTransformer",
+        "TransformerPipeline": "._transformer_pipeline:TransformerPipeline",
     },
 )
 
@@ -37,4 +39,5 @@ __all__ = [
     "SimpleImputer",
     "StandardScaler",
     "TableTransformer",
+    "TransformerPipeline",
 ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import itertools
+from typing import TYPE_CHECKING, Literal
 
 from safeds._utils import _structural_hash
 from safeds._validation import _check_bounds, _check_columns_exist, _ClosedBound
@@ -13,40 +14,88 @@ from safeds.exceptions import (
 from ._table_transformer import TableTransformer
 
 if TYPE_CHECKING:
-    from sklearn.preprocessing import KBinsDiscretizer as sk_KBinsDiscretizer
+    import polars as pl
+
+# Quantiles that are closer than this are merged, so no bin is (almost) empty
+_MINIMUM_BIN_WIDTH = 1e-8
+
+# Stopping criteria of k-means. Iterations stop once the centers move less than the tolerance times the variance.
+_KMEANS_MAXIMUM_NUMBER_OF_ITERATIONS = 300
+_KMEANS_TOLERANCE = 1e-4
 
 
 class Discretizer(TableTransformer):
     """
     The Discretizer bins continuous data into intervals.
 
+    Values are replaced by the index of their bin, starting at 0. Missing values stay missing. Fitting computes the
+    edges of the bins with polars, and transforming bins the values with a lazy `cut` expression.
+
     Parameters
     ----------
     number_of_bins:
         The number of bins to be created.
+    strategy:
+        How to compute the edges of the bins:
+
+        - "uniform": All bins have the same width.
+        - "quantile": All bins contain roughly the same number of values. Bins that would be empty are merged with
+          their neighbors, so fewer bins may be created.
+        - "kmeans": The values in each bin are closest to the same center of a one-dimensional k-means clustering.
 
     Raises
     ------
     OutOfBoundsError
         If the given number_of_bins is less than 2.
+    ValueError
+        If the given strategy is unknown.
+
+    Examples
+    --------
+    >>> from safeds.data.tabular.containers import Table
+    >>> from safeds.data.tabular.transformation import Discretizer
+    >>> table = Table({"a": [0.0, 1.0, 4.0, 10.0]})
+    >>> Discretizer(2, strategy="uniform").fit_and_transform(table)[1]
+    +---------+
+    |       a |
+    |     --- |
+    |     f64 |
+    +=========+
+    | 0.00000 |
+    | 0.00000 |
+    | 0.00000 |
+    | 1.00000 |
+    +---------+
     """
 
     # ------------------------------------------------------------------------------------------------------------------
     # Dunder methods
     # ------------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, number_of_bins: int = 5) -> None:
+    def __init__(
+        self,
+        number_of_bins: int = 5,
+        *,
+        strategy: Literal["uniform", "quantile", "kmeans"] = "quantile",
+    ) -> None:
         TableTransformer.__init__(self)
 
         _check_bounds("number_of_bins", number_of_bins, lower_bound=_ClosedBound(2))
+        if strategy not in ("uniform", "quantile", "kmeans"):
+            raise ValueError(f"Unknown strategy '{strategy}'. Use 'uniform', 'quantile', or 'kmeans'.")
 
-        self._wrapped_transformer: sk_KBinsDiscretizer | None = None
+        # Parameters
         self._number_of_bins = number_of_bins
+        self._strategy: Literal["uniform", "quantile", "kmeans"] = strategy
+
+        # Internal state
+        self._bin_edges: dict[str, list[float]] | None = None
 
     def __hash__(self) -> int:
         return _structural_hash(
             TableTransformer.__hash__(self),
             self._number_of_bins,
+            self._strategy,
         )
 
     # ------------------------------------------------------------------------------------------------------------------
@@ -57,6 +106,11 @@ class Discretizer(TableTransformer):
     def number_of_bins(self) -> int:
         return self._number_of_bins
 
+    @property
+    def strategy(self) -> Literal["uniform", "quantile", "kmeans"]:
+        """How the edges of the bins are computed."""
+        return self._strategy
+
     # ------------------------------------------------------------------------------------------------------------------
     # Learning and transformation
     # ------------------------------------------------------------------------------------------------------------------
@@ -88,29 +142,27 @@ class Discretizer(TableTransformer):
         ColumnNotFoundError
             If one of the columns, that should be fitted is not in the table.
         """
-        from sklearn.preprocessing import KBinsDiscretizer as sk_KBinsDiscretizer
+        import polars as pl
 
         if table.number_of_rows == 0:
             raise ValueError("The Discretizer cannot be fitted because the table contains 0 rows")
 
-        if column_names is None:
-            column_names = table.column_names
-        else:
-            _check_columns_exist(table, column_names)
+        if self._strategy != "kmeans":
+            return self._fit_with_aggregations(table, column_names)
 
-            for column in column_names:
-                if not table.get_column(column).type.is_numeric:
-                    raise NonNumericColumnError(f"{column} is of type {table.get_column(column).type}.")
+        column_names = self._check_fit_columns(table, column_names)
 
-        wrapped_transformer = sk_KBinsDiscretizer(n_bins=self._number_of_bins, encode="ordinal")
-        wrapped_transformer.set_output(transform="polars")
-        wrapped_transformer.fit(
-            table.remove_columns_except(column_names)._data_frame,
-        )
+        # Collect the values of all columns in a single query
+        values = table._lazy_frame.select(
+            pl.col(name).drop_nulls().cast(pl.Float64).implode() for name in column_names
+        ).collect()
 
-        result = Discretizer(self._number_of_bins)
-        result._wrapped_transformer = wrapped_transformer
+        result = Discretizer(self._number_of_bins, strategy=self._strategy)
         result._column_names = column_names
+        result._bin_edges = {
+            name: _compute_kmeans_bin_edges(values.get_column(name).item(), self._number_of_bins)
+            for name in column_names
+        }
 
         return result
 
@@ -141,8 +193,10 @@ class Discretizer(TableTransformer):
         NonNumericColumnError
             If one of the columns, that should be fitted is non-numeric.
         """
+        import polars as pl
+
         # Transformer has not been fitted yet
-        if self._wrapped_transformer is None or self._column_names is None:
+        if self._bin_edges is None or self._column_names is None:
             raise TransformerNotFittedError
 
         if table.number_of_rows == 0:
@@ -155,9 +209,148 @@ class Discretizer(TableTransformer):
             if not table.get_column(column).type.is_numeric:
                 raise NonNumericColumnError(f"{column} is of type {table.get_column(column).type}.")
 
-        new_data = self._wrapped_transformer.transform(
-            table.remove_columns_except(self._column_names)._data_frame,
-        )
+        columns = []
+        for name in self._column_names:
+            edges = self._bin_edges[name]
+            labels = [str(index) for index in range(len(edges) + 1)]
+
+            # Values on an edge belong to the upper bin. The physical value of an enum is the index of its category,
+            # unlike for a categorical, whose encoding depends on the string cache.
+            columns.append(
+                pl.col(name)
+                .cut(edges, labels=labels, left_closed=True)
+                .cast(pl.Enum(labels))
+                .to_physical()
+                .cast(pl.Float64),
+            )
+
         return Table._from_polars_lazy_frame(
-            table._lazy_frame.update(new_data.lazy()),
+            table._lazy_frame.with_columns(columns),
         )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _prepare_fit(self, table: Table, column_names: list[str] | None) -> tuple[list[str], dict[str, pl.Expr]] | None:
+        import polars as pl
+
+        # k-means needs several passes over the values
+        if self._strategy == "kmeans":
+            return None
+
+        column_names = self._check_fit_columns(table, column_names)
+
+        aggregations = {}
+        for index, name in enumerate(column_names):
+            if self._strategy == "uniform":
+                aggregations[f"min_{index}"] = pl.col(name).min().cast(pl.Float64)
+                aggregations[f"max_{index}"] = pl.col(name).max().cast(pl.Float64)
+            else:
+                for bin_index in range(self._number_of_bins + 1):
+                    aggregations[f"quantile_{index}_{bin_index}"] = pl.col(name).quantile(
+                        bin_index / self._number_of_bins,
+                        interpolation="linear",
+                    )
+
+        return column_names, aggregations
+
+    def _fit_from_aggregations(
+        self,
+        table: Table,  # noqa: ARG002
+        column_names: list[str],
+        aggregations: pl.DataFrame,
+    ) -> Discretizer:
+        bin_edges = {}
+        for index, name in enumerate(column_names):
+            if self._strategy == "uniform":
+                bin_edges[name] = _compute_uniform_bin_edges(
+                    aggregations.item(0, f"min_{index}"),
+                    aggregations.item(0, f"max_{index}"),
+                    self._number_of_bins,
+                )
+            else:
+                bin_edges[name] = _compute_quantile_bin_edges(
+                    [
+                        aggregations.item(0, f"quantile_{index}_{bin_index}")
+                        for bin_index in range(self._number_of_bins + 1)
+                    ],
+                )
+
+        # Create a copy with the learned transformation
+        result = Discretizer(self._number_of_bins, strategy=self._strategy)
+        result._column_names = column_names
+        result._bin_edges = bin_edges
+
+        return result
+
+    @staticmethod
+    def _check_fit_columns(table: Table, column_names: list[str] | None) -> list[str]:
+        if column_names is None:
+            column_names = table.column_names
+        else:
+            _check_columns_exist(table, column_names)
+
+        for column in column_names:
+            if not table.get_column(column).type.is_numeric:
+                raise NonNumericColumnError(f"{column} is of type {table.get_column(column).type}.")
+
+        return column_names
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Bin edges
+# ----------------------------------------------------------------------------------------------------------------------
+
+# The functions below return the inner edges of the bins, i.e. without the minimum and the maximum. Values outside the
+# range of the fitted data are put into the first or last bin. Columns without distinct values get a single bin.
+
+
+def _compute_uniform_bin_edges(minimum: float | None, maximum: float | None, number_of_bins: int) -> list[float]:
+    if minimum is None or maximum is None or minimum == maximum:
+        return []
+
+    return [minimum + (maximum - minimum) * index / number_of_bins for index in range(1, number_of_bins)]
+
+
+def _compute_quantile_bin_edges(quantiles: list[float | None]) -> list[float]:
+    if quantiles[0] is None or quantiles[0] == quantiles[-1]:
+        return []
+
+    edges = [quantiles[0]] + [
+        current for previous, current in itertools.pairwise(quantiles) if current - previous > _MINIMUM_BIN_WIDTH
+    ]
+    return edges[1:-1]
+
+
+def _compute_kmeans_bin_edges(values: pl.Series, number_of_bins: int) -> list[float]:
+    import polars as pl
+
+    minimum = values.min()
+    maximum = values.max()
+    if minimum is None or minimum == maximum:
+        return []
+
+    # Start with the centers of uniform bins
+    centers = [minimum + (maximum - minimum) * (index + 0.5) / number_of_bins for index in range(number_of_bins)]
+
+    data_frame = values.alias("value").to_frame()
+    tolerance = _KMEANS_TOLERANCE * values.var(ddof=0)
+
+    for _ in range(_KMEANS_MAXIMUM_NUMBER_OF_ITERATIONS):
+        # Values halfway between two centers belong to the upper one, like values on the edge of a bin
+        midpoints = pl.Series([(lower + upper) / 2 for lower, upper in itertools.pairwise(centers)], dtype=pl.Float64)
+        clusters = midpoints.search_sorted(values, side="right").alias("cluster")
+
+        # Empty clusters keep their center
+        new_centers = list(centers)
+        for cluster, mean in data_frame.group_by(clusters).agg(pl.col("value").mean()).iter_rows():
+            new_centers[cluster] = mean
+
+        shift = sum((new - old) ** 2 for new, old in zip(new_centers, centers, strict=True))
+        centers = sorted(new_centers)
+
+        if shift <= tolerance:
+            break
+
+    return [(lower + upper) / 2 for lower, upper in itertools.pairwise(centers)]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import warnings
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from safeds._utils import _structural_hash
 from safeds._validation import _check_columns_exist
@@ -10,12 +10,20 @@ from safeds.data.tabular.containers import Table
 from safeds.exceptions import TransformerNotFittedError
 
 from ._invertible_table_transformer import InvertibleTableTransformer
+from ._table_transformer import _get_non_missing_values
+
+if TYPE_CHECKING:
+    import polars as pl
 
 
 class LabelEncoder(InvertibleTableTransformer):
     """
     The LabelEncoder encodes one or more given columns into labels.
 
+    String columns are encoded by casting them to an enum whose categories are the known values in the order of their
+    labels. The physical value of an enum is the index of its category, so it is the label. Other columns are encoded
+    by looking up each value.
+
     Parameters
     ----------
     partial_order:
@@ -76,38 +84,7 @@ class LabelEncoder(InvertibleTableTransformer):
         ValueError
             If the table contains 0 rows.
         """
-        if column_names is None:
-            column_names = [name for name in table.column_names if not table.get_column_type(name).is_numeric]
-        else:
-            _check_columns_exist(table, column_names)
-            _warn_if_columns_are_numeric(table, column_names)
-
-        if table.number_of_rows == 0:
-            raise ValueError("The LabelEncoder cannot be fitted because the table contains 0 rows")
-
-        # Learn the transformation
-        mapping = {}
-        reverse_mapping = {}
-
-        for name in column_names:
-            # Remember partial order
-            mapping[name] = {value: index for index, value in enumerate(self._partial_order)}
-            reverse_mapping[name] = {index: value for value, index in mapping[name].items()}
-
-            unique_values = table.get_column(name).get_distinct_values()
-            for value in unique_values:
-                if value not in mapping[name]:
-                    label = len(mapping[name])
-                    mapping[name][value] = label
-                    reverse_mapping[name][label] = value
-
-        # Create a copy with the learned transformation
-        result = LabelEncoder(partial_order=self._partial_order)
-        result._column_names = column_names
-        result._mapping = mapping
-        result._inverse_mapping = reverse_mapping
-
-        return result
+        return self._fit_with_aggregations(table, column_names)
 
     def transform(self, table: Table) -> Table:
         """
@@ -142,10 +119,15 @@ class LabelEncoder(InvertibleTableTransformer):
 
         _check_columns_exist(table, self._column_names)
 
-        columns = [
-            pl.col(name).replace(self._mapping[name], default=None, return_dtype=pl.UInt32)
-            for name in self._column_names
-        ]
+        schema = table._lazy_frame.schema
+        columns = []
+        for name in self._column_names:
+            categories = _get_categories(self._mapping[name])
+            if categories is not None and schema[name] in (pl.String, pl.Categorical, pl.Enum):
+                # Unknown values become missing values, like below
+                columns.append(pl.col(name).cast(pl.Enum(categories), strict=False).to_physical())
+            else:
+                columns.append(pl.col(name).replace(self._mapping[name], default=None, return_dtype=pl.UInt32))
 
         return Table._from_polars_lazy_frame(
             table._lazy_frame.with_columns(columns),
@@ -179,7 +161,7 @@ class LabelEncoder(InvertibleTableTransformer):
         import polars as pl
 
         # Used in favor of is_fitted, so the type checker is happy
-        if self._column_names is None or self._inverse_mapping is None:
+        if self._column_names is None or self._mapping is None or self._inverse_mapping is None:
             raise TransformerNotFittedError
 
         _check_columns_exist(transformed_table, self._column_names)
@@ -189,12 +171,88 @@ class LabelEncoder(InvertibleTableTransformer):
             operation="inverse-transform with a LabelEncoder",
         )
 
-        columns = [pl.col(name).replace(self._inverse_mapping[name], default=None) for name in self._column_names]
+        schema = transformed_table._lazy_frame.schema
+        columns = []
+        for name in self._column_names:
+            categories = _get_categories(self._mapping[name])
+            if categories is not None and schema[name].is_integer():
+                # Casting unknown labels to an enum fails, so they are replaced with missing values first
+                columns.append(
+                    pl.when(pl.col(name).is_between(0, len(categories) - 1))
+                    .then(pl.col(name))
+                    .cast(pl.UInt32)
+                    .cast(pl.Enum(categories))
+                    .cast(pl.String),
+                )
+            else:
+                columns.append(pl.col(name).replace(self._inverse_mapping[name], default=None))
 
         return Table._from_polars_lazy_frame(
             transformed_table._lazy_frame.with_columns(columns),
         )
 
+    # ------------------------------------------------------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _prepare_fit(self, table: Table, column_names: list[str] | None) -> tuple[list[str], dict[str, pl.Expr]]:
+        if column_names is None:
+            column_names = [name for name in table.column_names if not table.get_column_type(name).is_numeric]
+        else:
+            _check_columns_exist(table, column_names)
+            _warn_if_columns_are_numeric(table, column_names)
+
+        # Like `Column.get_distinct_values`, missing values are ignored and the values are sorted
+        aggregations = {
+            f"values_{index}": _get_non_missing_values(table, name).unique().sort().implode()
+            for index, name in enumerate(column_names)
+        }
+
+        return column_names, aggregations
+
+    def _fit_from_aggregations(
+        self,
+        table: Table,  # noqa: ARG002
+        column_names: list[str],
+        aggregations: pl.DataFrame,
+    ) -> LabelEncoder:
+        # Learn the transformation
+        mapping = {}
+        reverse_mapping = {}
+
+        for column_index, name in enumerate(column_names):
+            # Remember partial order
+            mapping[name] = {value: index for index, value in enumerate(self._partial_order)}
+            reverse_mapping[name] = {index: value for value, index in mapping[name].items()}
+
+            unique_values = aggregations.get_column(f"values_{column_index}").item().to_list()
+            for value in unique_values:
+                if value not in mapping[name]:
+                    label = len(mapping[name])
+                    mapping[name][value] = label
+                    reverse_mapping[name][label] = value
+
+        # Create a copy with the learned transformation
+        result = LabelEncoder(partial_order=self._partial_order)
+        result._column_names = column_names
+        result._mapping = mapping
+        result._inverse_mapping = reverse_mapping
+
+        return result
+
+
+def _get_categories(mapping: dict[Any, int]) -> list[str] | None:
+    """
+    Return the categories of an enum whose physical values are the labels of the mapping.
+
+    This is only possible if all values are strings and the labels are consecutive, starting at 0.
+    """
+    for expected_label, (value, label) in enumerate(mapping.items()):
+        if not isinstance(value, str) or label != expected_label:
+            return None
+
+    return list(mapping)
+
 
 def _warn_if_columns_are_numeric(table: Table, column_names: list[str]) -> None:
     numeric_columns = table.remove_columns_except(column_names).remove_non_numeric_columns().column_names
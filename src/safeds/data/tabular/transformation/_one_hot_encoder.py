@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import warnings
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from safeds._utils import _structural_hash
 from safeds._validation import _check_columns_exist
@@ -12,6 +12,14 @@ from safeds.exceptions import (
 )
 
 from ._invertible_table_transformer import InvertibleTableTransformer
+from ._table_transformer import _get_non_missing_values
+
+if TYPE_CHECKING:
+    import polars as pl
+
+# Above this number of new columns, columns are encoded by one vectorized function instead of one expression per new
+# column. Planning queries with tens of thousands of expressions takes much longer than executing them.
+_MAXIMUM_NUMBER_OF_EXPRESSIONS = 100
 
 
 class OneHotEncoder(InvertibleTableTransformer):
@@ -41,6 +49,9 @@ class OneHotEncoder(InvertibleTableTransformer):
     The name "one-hot" comes from the fact that each row has exactly one 1 in it, and the rest of the values are 0s.
     One-hot encoding is closely related to dummy variable / indicator variables, which are used in statistics.
 
+    Columns with many distinct values are encoded in a single vectorized pass, which scatters the indices of the values
+    into a matrix. The output is still dense, so its size grows with the number of distinct values.
+
     Parameters
     ----------
     separator:
@@ -128,44 +139,7 @@ class OneHotEncoder(InvertibleTableTransformer):
         ValueError
             If the table contains 0 rows.
         """
-        if column_names is None:
-            column_names = [name for name in table.column_names if not table.get_column_type(name).is_numeric]
-        else:
-            _check_columns_exist(table, column_names)
-            _warn_if_columns_are_numeric(table, column_names)
-
-        if table.number_of_rows == 0:
-            raise ValueError("The OneHotEncoder cannot be fitted because the table contains 0 rows")
-
-        # Learn the transformation
-        new_column_names: list[str] = []
-        mapping: dict[str, list[tuple[str, Any]]] = {}
-
-        known_names = set(table.column_names)
-
-        for name in column_names:
-            mapping[name] = []
-            for value in table.get_column(name).get_distinct_values():
-                base_name = f"{name}{self._separator}{value}"
-                new_name = base_name
-
-                # Ensure that the new column name is unique
-                counter = 2
-                while new_name in known_names:
-                    new_name = f"{base_name}#{counter}"
-                    counter += 1
-
-                known_names.add(new_name)
-                new_column_names.append(new_name)
-                mapping[name].append((new_name, value))
-
-        # Create a copy with the learned transformation
-        result = OneHotEncoder()
-        result._column_names = column_names
-        result._new_column_names = new_column_names
-        result._mapping = mapping
-
-        return result
+        return self._fit_with_aggregations(table, column_names)
 
     def transform(self, table: Table) -> Table:
         """
@@ -198,6 +172,9 @@ class OneHotEncoder(InvertibleTableTransformer):
 
         _check_columns_exist(table, self._column_names)
 
+        if len(self._new_column_names or []) > _MAXIMUM_NUMBER_OF_EXPRESSIONS:
+            return self._transform_vectorized(table)
+
         expressions = [
             # UInt8 can be used without conversion in scikit-learn
             pl.col(column_name).eq_missing(value).alias(new_name).cast(pl.UInt8)
@@ -247,6 +224,9 @@ class OneHotEncoder(InvertibleTableTransformer):
             operation="inverse-transform with a OneHotEncoder",
         )
 
+        if len(self._new_column_names) > _MAXIMUM_NUMBER_OF_EXPRESSIONS:
+            return self._inverse_transform_vectorized(transformed_table)
+
         expressions = [
             pl.coalesce(
                 [
@@ -268,6 +248,177 @@ class OneHotEncoder(InvertibleTableTransformer):
             raise TransformerNotFittedError
         return list(self._new_column_names)  # defensive copy
 
+    # ------------------------------------------------------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _prepare_fit(self, table: Table, column_names: list[str] | None) -> tuple[list[str], dict[str, pl.Expr]]:
+        if column_names is None:
+            column_names = [name for name in table.column_names if not table.get_column_type(name).is_numeric]
+        else:
+            _check_columns_exist(table, column_names)
+            _warn_if_columns_are_numeric(table, column_names)
+
+        # Like `Column.get_distinct_values`, missing values are ignored and the values are sorted
+        aggregations = {
+            f"values_{index}": _get_non_missing_values(table, name).unique().sort().implode()
+            for index, name in enumerate(column_names)
+        }
+
+        return column_names, aggregations
+
+    def _fit_from_aggregations(
+        self,
+        table: Table,
+        column_names: list[str],
+        aggregations: pl.DataFrame,
+    ) -> OneHotEncoder:
+        # Learn the transformation
+        new_column_names: list[str] = []
+        mapping: dict[str, list[tuple[str, Any]]] = {}
+
+        known_names = set(table.column_names)
+
+        for index, name in enumerate(column_names):
+            values = aggregations.get_column(f"values_{index}").item().to_list()
+            names = [f"{name}{self._separator}{value}" for value in values]
+
+            # Names only have to be changed if they clash, which is rare
+            if len(set(names)) != len(names) or not known_names.isdisjoint(names):
+                names = _make_names_unique(names, known_names)
+
+            known_names.update(names)
+            new_column_names.extend(names)
+            mapping[name] = list(zip(names, values, strict=True))
+
+        # Create a copy with the learned transformation
+        result = OneHotEncoder(separator=self._separator)
+        result._column_names = column_names
+        result._new_column_names = new_column_names
+        result._mapping = mapping
+
+        return result
+
+    def _transform_vectorized(self, table: Table) -> Table:
+        import polars as pl
+
+        # Used in favor of is_fitted, so the type checker is happy
+        if self._column_names is None or self._mapping is None:
+            raise TransformerNotFittedError  # pragma: no cover
+
+        # The values are replaced by their index among the known values, which is then scattered into a matrix
+        indices = {
+            column_name: (
+                pl.Series([value for _, value in new_columns]),
+                pl.Series(range(len(new_columns)), dtype=pl.UInt32),
+                [new_name for new_name, _ in new_columns],
+            )
+            for column_name, new_columns in self._mapping.items()
+        }
+
+        def encode(batch: pl.DataFrame) -> pl.DataFrame:
+            import numpy as np
+
+            encoded_columns = []
+            for column_name, (values, value_indices, new_names) in indices.items():
+                if not new_names:
+                    continue
+
+                batch_indices = batch.get_column(column_name).replace(
+                    values,
+                    value_indices,
+                    default=None,
+                    return_dtype=pl.UInt32,
+                )
+                matrix = np.zeros((len(new_names), batch.height), dtype=np.uint8)
+                matrix[
+                    batch_indices.drop_nulls().to_numpy(),
+                    np.flatnonzero(batch_indices.is_not_null().to_numpy()),
+                ] = 1
+                encoded_columns.append(pl.DataFrame(matrix, schema=new_names, orient="col"))
+
+            return pl.concat([batch.drop(self._column_names), *encoded_columns], how="horizontal")
+
+        schema = {name: dtype for name, dtype in table._lazy_frame.schema.items() if name not in self._column_names}
+        for _, _, new_names in indices.values():
+            schema.update((new_name, pl.UInt8) for new_name in new_names)
+
+        return Table._from_polars_lazy_frame(
+            table._lazy_frame.map_batches(
+                encode,
+                # The function reads columns that it removes, and writes columns that it does not read
+                predicate_pushdown=False,
+                projection_pushdown=False,
+                schema=schema,
+                streamable=True,
+            ),
+        )
+
+    def _inverse_transform_vectorized(self, transformed_table: Table) -> Table:
+        import polars as pl
+
+        # Used in favor of is_fitted, so the type checker is happy
+        if self._new_column_names is None or self._mapping is None:
+            raise TransformerNotFittedError  # pragma: no cover
+
+        # A missing value is appended, so rows without a 1 can be pointed to it
+        values_by_column_name = {
+            column_name: (
+                [new_name for new_name, _ in new_columns],
+                pl.Series(column_name, [value for _, value in new_columns]).extend_constant(None, 1),
+            )
+            for column_name, new_columns in self._mapping.items()
+        }
+
+        def decode(batch: pl.DataFrame) -> pl.DataFrame:
+            import numpy as np
+
+            decoded_columns = []
+            for new_names, values in values_by_column_name.values():
+                is_hot = (
+                    batch.select(new_names).to_numpy() == 1 if new_names else np.zeros((batch.height, 0), dtype=bool)
+                )
+                # Like `coalesce`, the first column that contains a 1 wins
+                value_indices = np.where(is_hot.any(axis=1), is_hot.argmax(axis=1), len(new_names))
+                decoded_columns.append(values.gather(value_indices))
+
+            return batch.with_columns(decoded_columns).drop(self._new_column_names)
+
+        schema = dict(transformed_table._lazy_frame.schema)
+        for column_name, (_, values) in values_by_column_name.items():
+            schema[column_name] = values.dtype
+        for new_name in self._new_column_names:
+            del schema[new_name]
+
+        return Table._from_polars_lazy_frame(
+            transformed_table._lazy_frame.map_batches(
+                decode,
+                # The function reads columns that it removes, and writes columns that it does not read
+                predicate_pushdown=False,
+                projection_pushdown=False,
+                schema=schema,
+                streamable=True,
+            ),
+        )
+
+
+def _make_names_unique(names: list[str], known_names: set[str]) -> list[str]:
+    known_names = set(known_names)
+    unique_names = []
+
+    for base_name in names:
+        new_name = base_name
+
+        counter = 2
+        while new_name in known_names:
+            new_name = f"{base_name}#{counter}"
+            counter += 1
+
+        known_names.add(new_name)
+        unique_names.append(new_name)
+
+    return unique_names
+
 
 def _warn_if_columns_are_numeric(table: Table, column_names: list[str]) -> None:
     numeric_columns = table.remove_columns_except(column_names).remove_non_numeric_columns().column_names
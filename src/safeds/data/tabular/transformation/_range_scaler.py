@@ -102,24 +102,55 @@ class RangeScaler(InvertibleTableTransformer):
         ValueError
             If the table contains 0 rows.
         """
-        if column_names is None:
-            column_names = [name for name in table.column_names if table.get_column_type(name).is_numeric]
-        else:
-            _check_columns_exist(table, column_names)
-            _check_columns_are_numeric(table, column_names, operation="fit a RangeScaler")
+        return self._fit_with_aggregations(table, column_names)
 
-        if table.number_of_rows == 0:
-            raise ValueError("The RangeScaler cannot be fitted because the table contains 0 rows")
+    def partial_fit(self, table: Table, column_names: list[str] | None) -> RangeScaler:
+        """
+        Learn a transformation for a set of columns in a table, continuing the fit of this transformer.
 
-        # Learn the transformation
-        _data_min = table._lazy_frame.select(column_names).min().collect()
-        _data_max = table._lazy_frame.select(column_names).max().collect()
+        If this transformer is not fitted yet, this is the same as `fit`. Otherwise, the minimum and maximum of the
+        table are merged with the ones learned so far. Fitting on the parts of a table one after the other thus learns
+        the same transformation as fitting on the whole table, but the table never has to fit into memory. The parts
+        could, for example, be the batches returned by `Table.iter_batches`.
 
-        # Create a copy with the learned transformation
+        This transformer is not modified.
+
+        Parameters
+        ----------
+        table:
+            The table used to fit the transformer.
+        column_names:
+            The list of columns from the table used to fit the transformer. If `None`, the columns this transformer was
+            fitted on are used, or all numeric columns if it is not fitted yet.
+
+        Returns
+        -------
+        fitted_transformer:
+            The fitted transformer.
+
+        Raises
+        ------
+        ColumnNotFoundError
+            If column_names contain a column name that is missing in the table.
+        ColumnTypeError
+            If at least one of the specified columns in the table is not numeric.
+        ValueError
+            If the table contains 0 rows, or if the transformer was fitted on other columns.
+        """
+        import polars as pl
+
+        # Used in favor of is_fitted, so the type checker is happy
+        if self._column_names is None or self._data_min is None or self._data_max is None:
+            return self.fit(table, column_names)
+
+        column_names = self._get_column_names_for_partial_fit(column_names)
+        increment = self.fit(table, column_names)
+
+        # Create a copy with the learned transformation. Missing values are ignored by `min` and `max`.
         result = RangeScaler(min_=self._min, max_=self._max)
         result._column_names = column_names
-        result._data_min = _data_min
-        result._data_max = _data_max
+        result._data_min = pl.concat([self._data_min, increment._data_min], how="vertical_relaxed").min()
+        result._data_max = pl.concat([self._data_max, increment._data_max], how="vertical_relaxed").max()
 
         return result
 
@@ -222,3 +253,43 @@ class RangeScaler(InvertibleTableTransformer):
         return Table._from_polars_lazy_frame(
             transformed_table._lazy_frame.with_columns(columns),
         )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _prepare_fit(self, table: Table, column_names: list[str] | None) -> tuple[list[str], dict[str, pl.Expr]]:
+        import polars as pl
+
+        if column_names is None:
+            column_names = [name for name in table.column_names if table.get_column_type(name).is_numeric]
+        else:
+            _check_columns_exist(table, column_names)
+            _check_columns_are_numeric(table, column_names, operation="fit a RangeScaler")
+
+        aggregations = {}
+        for index, name in enumerate(column_names):
+            aggregations[f"min_{index}"] = pl.col(name).min()
+            aggregations[f"max_{index}"] = pl.col(name).max()
+
+        return column_names, aggregations
+
+    def _fit_from_aggregations(
+        self,
+        table: Table,  # noqa: ARG002
+        column_names: list[str],
+        aggregations: pl.DataFrame,
+    ) -> RangeScaler:
+        import polars as pl
+
+        # Create a copy with the learned transformation
+        result = RangeScaler(min_=self._min, max_=self._max)
+        result._column_names = column_names
+        result._data_min = pl.DataFrame(
+            [aggregations.get_column(f"min_{index}").alias(name) for index, name in enumerate(column_names)],
+        )
+        result._data_max = pl.DataFrame(
+            [aggregations.get_column(f"max_{index}").alias(name) for index, name in enumerate(column_names)],
+        )
+
+        return result
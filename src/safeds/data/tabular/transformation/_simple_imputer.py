@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sys
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from safeds._utils import _structural_hash
 from safeds._validation import _check_columns_exist
@@ -10,7 +10,15 @@ from safeds._validation._check_columns_are_numeric import _check_columns_are_num
 from safeds.data.tabular.containers import Table
 from safeds.exceptions import TransformerNotFittedError
 
-from ._table_transformer import TableTransformer
+from ._table_transformer import TableTransformer, _compute_aggregations, _get_non_missing_values
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from safeds.data.tabular.plotting._quantile_sketch import _QuantileSketch
+
+# The partial median lies between the 49.9th and the 50.1st percentile. It is exact for up to 4000 values.
+_MEDIAN_RANK_ERROR = 0.001
 
 
 class SimpleImputer(TableTransformer):
@@ -56,8 +64,33 @@ class SimpleImputer(TableTransformer):
         def __str__(self) -> str: ...
 
         @abstractmethod
-        def _get_replacement(self, table: Table) -> dict[str, Any]:
-            """Return a polars expression to compute the replacement value for each column of a data frame."""
+        def _get_aggregation(self, table: Table, column_name: str) -> pl.Expr | None:
+            """Return a polars aggregation that computes the replacement value for a column, if data is needed."""
+
+        @abstractmethod
+        def _get_replacement(self, aggregation: pl.Series | None) -> Any:
+            """Return the replacement value for a column, given the result of its aggregation."""
+
+        @abstractmethod
+        def _get_partial_aggregation(self, table: Table, column_name: str) -> pl.Expr | None:
+            """Return a polars aggregation whose results for parts of a column can be merged, if data is needed."""
+
+        def _finish_partial_aggregations(
+            self,
+            table: Table,  # noqa: ARG002
+            column_names: list[str],  # noqa: ARG002
+            results: dict[str, pl.Series | None],
+        ) -> dict[str, Any]:
+            """Return the mergeable state of each column for a part of a table, given the partial aggregations."""
+            return results
+
+        @abstractmethod
+        def _merge_partial_aggregations(self, first: Any, second: Any) -> Any:
+            """Merge the results of the partial aggregation for two parts of a column."""
+
+        @abstractmethod
+        def _get_replacement_from_partial_aggregation(self, partial_aggregation: Any) -> Any:
+            """Return the replacement value for a column, given the merged results of its partial aggregation."""
 
         @staticmethod
         def constant(value: Any) -> SimpleImputer.Strategy:
@@ -99,6 +132,7 @@ class SimpleImputer(TableTransformer):
 
         # Internal state
         self._replacement: dict[str, Any] | None = None
+        self._partial_aggregations: dict[str, Any] | None = None
 
     def __hash__(self) -> int:
         return _structural_hash(
@@ -154,30 +188,71 @@ class SimpleImputer(TableTransformer):
             If the strategy is set to either Mean or Median and the specified columns of the table contain non-numerical
             data.
         """
-        if isinstance(self._strategy, _Mean | _Median):
-            if column_names is None:
-                column_names = [name for name in table.column_names if table.get_column_type(name).is_numeric]
-            else:
-                _check_columns_exist(table, column_names)
-                _check_columns_are_numeric(table, column_names, operation="fit a SimpleImputer")
-        else:  # noqa: PLR5501
-            if column_names is None:
-                column_names = table.column_names
-            else:
-                _check_columns_exist(table, column_names)
+        return self._fit_with_aggregations(table, column_names)
 
-        if table.number_of_rows == 0:
-            raise ValueError("The SimpleImputer cannot be fitted because the table contains 0 rows")
+    def partial_fit(self, table: Table, column_names: list[str] | None) -> SimpleImputer:
+        """
+        Learn a transformation for a set of columns in a table, continuing the fit of this transformer.
 
-        # Learn the transformation
-        replacement = self._strategy._get_replacement(table)
+        If this transformer is not fitted yet, this starts a new fit. Otherwise, the statistics of the table are merged
+        with the ones learned so far. Fitting on the parts of a table one after the other thus learns the same
+        transformation as fitting on the whole table, but the table never has to fit into memory. The parts could, for
+        example, be the batches returned by `Table.iter_batches`.
 
-        # Create a copy with the learned transformation
-        result = SimpleImputer(self._strategy, value_to_replace=self._value_to_replace)
-        result._column_names = column_names
-        result._replacement = replacement
+        The mean is merged from sums and counts, so it is exact. The median is merged from quantile sketches, so memory
+        stays small. It is exact for up to 4000 values per column. Beyond that, it lies between the 49.9th and the
+        50.1st percentile. The mode is merged from the counts of all distinct values, so it is exact, but memory grows
+        with the number of distinct values.
 
-        return result
+        This transformer is not modified.
+
+        Parameters
+        ----------
+        table:
+            The table used to fit the transformer.
+        column_names:
+            The list of columns from the table used to fit the transformer. If `None`, the columns this transformer was
+            fitted on are used, or all columns if it is not fitted yet.
+
+        Returns
+        -------
+        fitted_transformer:
+            The fitted transformer.
+
+        Raises
+        ------
+        ColumnNotFoundError
+            If column_names contain a column name that is missing in the table
+        ValueError
+            If the table contains 0 rows, if the transformer was fitted on other columns, or if it was fitted with `fit`
+            instead of `partial_fit`.
+        NonNumericColumnError
+            If the strategy is set to either Mean or Median and the specified columns of the table contain non-numerical
+            data.
+        """
+        if self._column_names is None or self._replacement is None:
+            return self._fit_partial_aggregations(table, column_names)
+
+        # `fit` computes the replacement directly, which cannot be merged
+        if self._partial_aggregations is None:
+            raise ValueError(
+                "The SimpleImputer was fitted with `fit`, so it cannot continue fitting. Use `partial_fit` for all parts "
+                "of the table instead.",
+            )
+
+        column_names = self._get_column_names_for_partial_fit(column_names)
+        increment = self._fit_partial_aggregations(table, column_names)
+
+        return self._create_from_partial_aggregations(
+            column_names,
+            {
+                name: self._strategy._merge_partial_aggregations(
+                    self._partial_aggregations[name],
+                    increment._partial_aggregations[name],  # type: ignore[index]
+                )
+                for name in column_names
+            },
+        )
 
     def transform(self, table: Table) -> Table:
         """
@@ -219,6 +294,95 @@ class SimpleImputer(TableTransformer):
             table._lazy_frame.with_columns(columns),
         )
 
+    # ------------------------------------------------------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _prepare_fit(self, table: Table, column_names: list[str] | None) -> tuple[list[str], dict[str, pl.Expr]]:
+        column_names = self._check_fit_columns(table, column_names)
+
+        aggregations = {}
+        for index, name in enumerate(column_names):
+            aggregation = self._strategy._get_aggregation(table, name)
+            if aggregation is not None:
+                aggregations[f"replacement_{index}"] = aggregation
+
+        return column_names, aggregations
+
+    def _fit_from_aggregations(
+        self,
+        table: Table,  # noqa: ARG002
+        column_names: list[str],
+        aggregations: pl.DataFrame,
+    ) -> SimpleImputer:
+        replacement = {}
+        for index, name in enumerate(column_names):
+            key = f"replacement_{index}"
+            replacement[name] = self._strategy._get_replacement(
+                aggregations.get_column(key) if key in aggregations.columns else None,
+            )
+
+        # Create a copy with the learned transformation
+        result = SimpleImputer(self._strategy, value_to_replace=self._value_to_replace)
+        result._column_names = column_names
+        result._replacement = replacement
+
+        return result
+
+    def _fit_partial_aggregations(self, table: Table, column_names: list[str] | None) -> SimpleImputer:
+        column_names = self._check_fit_columns(table, column_names)
+
+        aggregations = {}
+        for index, name in enumerate(column_names):
+            aggregation = self._strategy._get_partial_aggregation(table, name)
+            if aggregation is not None:
+                aggregations[f"partial_{index}"] = aggregation
+
+        results = _compute_aggregations(table, [(self, aggregations)])[0]
+
+        return self._create_from_partial_aggregations(
+            column_names,
+            self._strategy._finish_partial_aggregations(
+                table,
+                column_names,
+                {
+                    name: results.get_column(f"partial_{index}") if f"partial_{index}" in results.columns else None
+                    for index, name in enumerate(column_names)
+                },
+            ),
+        )
+
+    def _create_from_partial_aggregations(
+        self,
+        column_names: list[str],
+        partial_aggregations: dict[str, Any],
+    ) -> SimpleImputer:
+        # Create a copy with the learned transformation
+        result = SimpleImputer(self._strategy, value_to_replace=self._value_to_replace)
+        result._column_names = column_names
+        result._replacement = {
+            name: self._strategy._get_replacement_from_partial_aggregation(partial_aggregations[name])
+            for name in column_names
+        }
+        result._partial_aggregations = partial_aggregations
+
+        return result
+
+    def _check_fit_columns(self, table: Table, column_names: list[str] | None) -> list[str]:
+        if isinstance(self._strategy, _Mean | _Median):
+            if column_names is None:
+                column_names = [name for name in table.column_names if table.get_column_type(name).is_numeric]
+            else:
+                _check_columns_exist(table, column_names)
+                _check_columns_are_numeric(table, column_names, operation="fit a SimpleImputer")
+        else:  # noqa: PLR5501
+            if column_names is None:
+                column_names = table.column_names
+            else:
+                _check_columns_exist(table, column_names)
+
+        return column_names
+
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Imputation strategies
@@ -249,8 +413,24 @@ class _Constant(SimpleImputer.Strategy):
     def __str__(self) -> str:
         return f"Constant({self._value})"
 
-    def _get_replacement(self, table: Table) -> dict[str, Any]:
-        return {name: self._value for name in table.column_names}
+    def _get_aggregation(self, table: Table, column_name: str) -> pl.Expr | None:  # noqa: ARG002
+        return None
+
+    def _get_replacement(self, aggregation: pl.Series | None) -> Any:  # noqa: ARG002
+        return self._value
+
+    def _get_partial_aggregation(self, table: Table, column_name: str) -> pl.Expr | None:  # noqa: ARG002
+        return None
+
+    def _merge_partial_aggregations(
+        self,
+        first: pl.Series | None,  # noqa: ARG002
+        second: pl.Series | None,  # noqa: ARG002
+    ) -> pl.Series | None:
+        return None
+
+    def _get_replacement_from_partial_aggregation(self, partial_aggregation: pl.Series | None) -> Any:  # noqa: ARG002
+        return self._value
 
 
 class _Mean(SimpleImputer.Strategy):
@@ -265,8 +445,38 @@ class _Mean(SimpleImputer.Strategy):
     def __str__(self) -> str:
         return "Mean"
 
-    def _get_replacement(self, table: Table) -> dict[str, Any]:
-        return table._lazy_frame.mean().collect().to_dict()
+    def _get_aggregation(self, table: Table, column_name: str) -> pl.Expr | None:  # noqa: ARG002
+        import polars as pl
+
+        return pl.col(column_name).mean()
+
+    def _get_replacement(self, aggregation: pl.Series | None) -> Any:
+        return aggregation
+
+    def _get_partial_aggregation(self, table: Table, column_name: str) -> pl.Expr | None:  # noqa: ARG002
+        import polars as pl
+
+        return pl.struct(
+            pl.col(column_name).sum().cast(pl.Float64).alias("sum"),
+            pl.col(column_name).count().cast(pl.Int64).alias("count"),
+        )
+
+    def _merge_partial_aggregations(self, first: pl.Series | None, second: pl.Series | None) -> pl.Series | None:
+        if first is None or second is None:  # pragma: no cover
+            return first if second is None else second
+
+        import polars as pl
+
+        return pl.concat([first, second]).struct.unnest().sum().to_struct(first.name)
+
+    def _get_replacement_from_partial_aggregation(self, partial_aggregation: pl.Series | None) -> Any:
+        import polars as pl
+
+        if partial_aggregation is None:  # pragma: no cover
+            return None
+
+        sums = partial_aggregation.item()
+        return pl.Series([sums["sum"] / sums["count"] if sums["count"] > 0 else None], dtype=pl.Float64)
 
 
 class _Median(SimpleImputer.Strategy):
@@ -281,8 +491,40 @@ class _Median(SimpleImputer.Strategy):
     def __str__(self) -> str:
         return "Median"
 
-    def _get_replacement(self, table: Table) -> dict[str, Any]:
-        return table._lazy_frame.median().collect().to_dict()
+    def _get_aggregation(self, table: Table, column_name: str) -> pl.Expr | None:  # noqa: ARG002
+        import polars as pl
+
+        return pl.col(column_name).median()
+
+    def _get_replacement(self, aggregation: pl.Series | None) -> Any:
+        return aggregation
+
+    def _get_partial_aggregation(self, table: Table, column_name: str) -> pl.Expr | None:  # noqa: ARG002
+        # The sketches are built in a separate pass, see `_finish_partial_aggregations`
+        return None
+
+    def _finish_partial_aggregations(
+        self,
+        table: Table,
+        column_names: list[str],
+        results: dict[str, pl.Series | None],  # noqa: ARG002
+    ) -> dict[str, Any]:
+        # Sketches are cached by the table, so they must not be modified later
+        return table._get_quantile_sketches(column_names, _MEDIAN_RANK_ERROR)
+
+    def _merge_partial_aggregations(self, first: _QuantileSketch, second: _QuantileSketch) -> _QuantileSketch:
+        from safeds.data.tabular.plotting._quantile_sketch import _QuantileSketch
+
+        merged = _QuantileSketch(_MEDIAN_RANK_ERROR)
+        merged.merge(first)
+        merged.merge(second)
+        return merged
+
+    def _get_replacement_from_partial_aggregation(self, partial_aggregation: _QuantileSketch) -> Any:
+        import polars as pl
+
+        # Like `median`, this interpolates between the two middle values if the number of values is even
+        return pl.Series([partial_aggregation.quantile(0.5)], dtype=pl.Float64)
 
 
 class _Mode(SimpleImputer.Strategy):
@@ -297,8 +539,63 @@ class _Mode(SimpleImputer.Strategy):
     def __str__(self) -> str:
         return "Mode"
 
-    def _get_replacement(self, table: Table) -> dict[str, Any]:
-        return {name: table.get_column(name).mode()[0] for name in table.column_names}
+    def _get_aggregation(self, table: Table, column_name: str) -> pl.Expr | None:
+        # Like `Column.mode`, missing values are ignored and ties are broken by taking the smallest value
+        return _get_non_missing_values(table, column_name).mode().sort().first()
+
+    def _get_replacement(self, aggregation: pl.Series | None) -> Any:
+        return aggregation.item() if aggregation is not None else None
+
+    def _get_partial_aggregation(self, table: Table, column_name: str) -> pl.Expr | None:
+        return _get_value_counts(table, column_name)
+
+    def _merge_partial_aggregations(self, first: pl.Series | None, second: pl.Series | None) -> pl.Series | None:
+        return _merge_value_counts(first, second)
+
+    def _get_replacement_from_partial_aggregation(self, partial_aggregation: pl.Series | None) -> Any:
+        counts = _unnest_value_counts(partial_aggregation)
+        if counts.height == 0:
+            return None
+
+        # Ties are broken by taking the smallest value, like in `_get_aggregation`
+        return counts.sort(["count", "value"], descending=[True, False]).item(0, "value")
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Value counts
+# ----------------------------------------------------------------------------------------------------------------------
+
+# The mode cannot be merged, but the counts of the distinct values can. They are stored as a series with a single list
+# of structs with the fields "value" and "count".
+
+
+def _get_value_counts(table: Table, column_name: str) -> pl.Expr:
+    return _get_non_missing_values(table, column_name).alias("value").value_counts().implode()
+
+
+def _merge_value_counts(first: pl.Series | None, second: pl.Series | None) -> pl.Series | None:
+    if first is None or second is None:  # pragma: no cover
+        return first if second is None else second
+
+    import polars as pl
+
+    counts = pl.concat([_unnest_value_counts(first), _unnest_value_counts(second)], how="vertical_relaxed")
+    return (
+        counts.group_by("value")
+        .agg(pl.col("count").sum())
+        .select(pl.struct("value", "count").implode().alias(first.name))
+        .to_series()
+    )
+
+
+def _unnest_value_counts(value_counts: pl.Series | None) -> pl.DataFrame:
+    import polars as pl
+
+    if value_counts is None:  # pragma: no cover
+        return pl.DataFrame({"value": [], "count": []}, schema={"value": pl.Null, "count": pl.Int64})
+
+    # Missing values were dropped before counting. Exploding an empty list yields a single missing value, though.
+    return value_counts.explode().struct.unnest().drop_nulls("value").with_columns(pl.col("count").cast(pl.Int64))
 
 
 # Override the methods with classes, so they can be used in `isinstance` calls. Unlike methods, classes define a type.
@@ -26,6 +26,7 @@ class StandardScaler(InvertibleTableTransformer):
         # Internal state
         self._data_mean: pl.DataFrame | None = None
         self._data_standard_deviation: pl.DataFrame | None = None
+        self._data_count: pl.DataFrame | None = None
 
     def __hash__(self) -> int:
         # Leave out the internal state for faster hashing
@@ -62,24 +63,70 @@ class StandardScaler(InvertibleTableTransformer):
         ValueError
             If the table contains 0 rows.
         """
-        if column_names is None:
-            column_names = [name for name in table.column_names if table.get_column_type(name).is_numeric]
-        else:
-            _check_columns_exist(table, column_names)
-            _check_columns_are_numeric(table, column_names, operation="fit a StandardScaler")
+        return self._fit_with_aggregations(table, column_names)
+
+    def partial_fit(self, table: Table, column_names: list[str] | None) -> StandardScaler:
+        """
+        Learn a transformation for a set of columns in a table, continuing the fit of this transformer.
+
+        If this transformer is not fitted yet, this is the same as `fit`. Otherwise, the mean and standard deviation of
+        the table are merged with the ones learned so far. Fitting on the parts of a table one after the other thus
+        learns the same transformation as fitting on the whole table, but the table never has to fit into memory. The
+        parts could, for example, be the batches returned by `Table.iter_batches`.
 
-        if table.number_of_rows == 0:
-            raise ValueError("The StandardScaler cannot be fitted because the table contains 0 rows")
+        This transformer is not modified.
+
+        Parameters
+        ----------
+        table:
+            The table used to fit the transformer.
+        column_names:
+            The list of columns from the table used to fit the transformer. If `None`, the columns this transformer was
+            fitted on are used, or all numeric columns if it is not fitted yet.
+
+        Returns
+        -------
+        fitted_transformer:
+            The fitted transformer.
+
+        Raises
+        ------
+        ColumnNotFoundError
+            If column_names contain a column name that is missing in the table.
+        ColumnTypeError
+            If at least one of the specified columns in the table is not numeric.
+        ValueError
+            If the table contains 0 rows, or if the transformer was fitted on other columns.
+        """
+        import polars as pl
 
-        # Learn the transformation (ddof=0 is used to match the behavior of scikit-learn)
-        _data_mean = table._lazy_frame.select(column_names).mean().collect()
-        _data_standard_deviation = table._lazy_frame.select(column_names).std(ddof=0).collect()
+        # Used in favor of is_fitted, so the type checker is happy
+        if (
+            self._column_names is None
+            or self._data_mean is None
+            or self._data_standard_deviation is None
+            or self._data_count is None
+        ):
+            return self.fit(table, column_names)
+
+        column_names = self._get_column_names_for_partial_fit(column_names)
+        increment = self.fit(table, column_names)
+
+        means = []
+        standard_deviations = []
+        counts = []
+        for name in column_names:
+            count, mean, standard_deviation = _merge_moments(self._get_moments(name), increment._get_moments(name))
+            means.append(pl.Series(name, [mean], dtype=pl.Float64))
+            standard_deviations.append(pl.Series(name, [standard_deviation], dtype=pl.Float64))
+            counts.append(pl.Series(name, [count], dtype=pl.UInt32))
 
         # Create a copy with the learned transformation
         result = StandardScaler()
         result._column_names = column_names
-        result._data_mean = _data_mean
-        result._data_standard_deviation = _data_standard_deviation
+        result._data_mean = pl.DataFrame(means)
+        result._data_standard_deviation = pl.DataFrame(standard_deviations)
+        result._data_count = pl.DataFrame(counts)
 
         return result
 
@@ -172,3 +219,88 @@ class StandardScaler(InvertibleTableTransformer):
         return Table._from_polars_lazy_frame(
             transformed_table._lazy_frame.with_columns(columns),
         )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _prepare_fit(self, table: Table, column_names: list[str] | None) -> tuple[list[str], dict[str, pl.Expr]]:
+        import polars as pl
+
+        if column_names is None:
+            column_names = [name for name in table.column_names if table.get_column_type(name).is_numeric]
+        else:
+            _check_columns_exist(table, column_names)
+            _check_columns_are_numeric(table, column_names, operation="fit a StandardScaler")
+
+        # ddof=0 is used to match the behavior of scikit-learn
+        aggregations = {}
+        for index, name in enumerate(column_names):
+            aggregations[f"mean_{index}"] = pl.col(name).mean()
+            aggregations[f"std_{index}"] = pl.col(name).std(ddof=0)
+            aggregations[f"count_{index}"] = pl.col(name).count()
+
+        return column_names, aggregations
+
+    def _fit_from_aggregations(
+        self,
+        table: Table,  # noqa: ARG002
+        column_names: list[str],
+        aggregations: pl.DataFrame,
+    ) -> StandardScaler:
+        import polars as pl
+
+        # Create a copy with the learned transformation
+        result = StandardScaler()
+        result._column_names = column_names
+        result._data_mean = pl.DataFrame(
+            [aggregations.get_column(f"mean_{index}").alias(name) for index, name in enumerate(column_names)],
+        )
+        result._data_standard_deviation = pl.DataFrame(
+            [aggregations.get_column(f"std_{index}").alias(name) for index, name in enumerate(column_names)],
+        )
+        result._data_count = pl.DataFrame(
+            [aggregations.get_column(f"count_{index}").alias(name) for index, name in enumerate(column_names)],
+        )
+
+        return result
+
+    def _get_moments(self, column_name: str) -> tuple[int, float | None, float | None]:
+        # Used in favor of is_fitted, so the type checker is happy
+        if self._data_count is None or self._data_mean is None or self._data_standard_deviation is None:
+            raise TransformerNotFittedError  # pragma: no cover
+
+        return (
+            self._data_count.item(0, column_name),
+            self._data_mean.item(0, column_name),
+            self._data_standard_deviation.item(0, column_name),
+        )
+
+
+def _merge_moments(
+    first: tuple[int, float | None, float | None],
+    second: tuple[int, float | None, float | None],
+) -> tuple[int, float | None, float | None]:
+    """
+    Merge the count, mean, and standard deviation (ddof=0) of two parts of a column.
+
+    This uses the parallel algorithm of Chan et al., which avoids the cancellation of subtracting large sums.
+    """
+    first_count, first_mean, first_standard_deviation = first
+    second_count, second_mean, second_standard_deviation = second
+
+    if first_count == 0 or first_mean is None or first_standard_deviation is None:
+        return second
+    if second_count == 0 or second_mean is None or second_standard_deviation is None:
+        return first
+
+    count = first_count + second_count
+    delta = second_mean - first_mean
+    mean = first_mean + delta * second_count / count
+    sum_of_squares = (
+        first_standard_deviation**2 * first_count
+        + second_standard_deviation**2 * second_count
+        + delta**2 * first_count * second_count / count
+    )
+
+    return count, mean, (sum_of_squares / count) ** 0.5
@@ -4,8 +4,11 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Self
 
 from safeds._utils import _structural_hash
+from safeds.exceptions import TransformerNotFittedError
 
 if TYPE_CHECKING:
+    import polars as pl
+
     from safeds.data.tabular.containers import Table
 
 
@@ -112,3 +115,135 @@ class TableTransformer(ABC):
         fitted_transformer = self.fit(table, column_names)
         transformed_table = fitted_transformer.transform(table)
         return fitted_transformer, transformed_table
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _prepare_fit(
+        self,
+        table: Table,  # noqa: ARG002
+        column_names: list[str] | None,  # noqa: ARG002
+    ) -> tuple[list[str], dict[str, pl.Expr]] | None:
+        """
+        Check that the transformer can be fitted on a table, and return the aggregations that fitting needs.
+
+        Transformers that can be fitted from a few aggregations over the table implement this method together with
+        `_fit_from_aggregations`. A `TransformerPipeline` then computes the aggregations of several transformers in a
+        single query.
+
+        Parameters
+        ----------
+        table:
+            The table used to fit the transformer.
+        column_names:
+            The list of columns from the table used to fit the transformer. If `None`, the default columns are used.
+
+        Returns
+        -------
+        fit_plan:
+            The names of the columns to fit on and the aggregations by name, or None if fitting needs more than
+            aggregations.
+        """
+        return None
+
+    def _fit_from_aggregations(self, table: Table, column_names: list[str], aggregations: pl.DataFrame) -> Self:
+        """
+        Create a fitted transformer from the results of the aggregations that `_prepare_fit` returned.
+
+        Parameters
+        ----------
+        table:
+            The table used to fit the transformer. Only its schema may be used, since the data was already aggregated.
+        column_names:
+            The names of the columns to fit on that `_prepare_fit` returned.
+        aggregations:
+            A data frame with one row and a column for each aggregation, named like the aggregation.
+
+        Returns
+        -------
+        fitted_transformer:
+            The fitted transformer.
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def _fit_with_aggregations(self, table: Table, column_names: list[str] | None) -> Self:
+        # Used by transformers that implement `_prepare_fit` to implement `fit`
+        fit_plan = self._prepare_fit(table, column_names)
+        if fit_plan is None:  # pragma: no cover
+            raise NotImplementedError
+
+        column_names, aggregations = fit_plan
+        return self._fit_from_aggregations(
+            table,
+            column_names,
+            _compute_aggregations(table, [(self, aggregations)])[0],
+        )
+
+    def _get_column_names_for_partial_fit(self, column_names: list[str] | None) -> list[str]:
+        # Used by `partial_fit` of fitted transformers. Statistics can only be merged for the same columns.
+        if self._column_names is None:  # pragma: no cover
+            raise TransformerNotFittedError
+
+        if column_names is not None and column_names != self._column_names:
+            raise ValueError(
+                f"The {self.__class__.__name__} was fitted on the columns {self._column_names}, so it cannot continue "
+                f"fitting on the columns {column_names}.",
+            )
+
+        return self._column_names
+
+
+def _compute_aggregations(
+    table: Table,
+    aggregations_by_transformer: list[tuple[TableTransformer, dict[str, pl.Expr]]],
+) -> list[pl.DataFrame]:
+    """
+    Compute the aggregations of several transformers over a table in a single query.
+
+    Parameters
+    ----------
+    table:
+        The table to aggregate.
+    aggregations_by_transformer:
+        The aggregations of each transformer by name.
+
+    Returns
+    -------
+    results:
+        For each transformer, a data frame with one row and a column for each of its aggregations.
+
+    Raises
+    ------
+    ValueError
+        If the table contains 0 rows.
+    """
+    import polars as pl
+
+    # Names of aggregations only need to be unique per transformer
+    expressions = [pl.len().alias("len")]
+    for index, (_, aggregations) in enumerate(aggregations_by_transformer):
+        expressions.extend(expression.alias(f"{index}/{name}") for name, expression in aggregations.items())
+
+    row = table._lazy_frame.select(expressions).collect()
+    if row.item(0, "len") == 0:
+        transformer = aggregations_by_transformer[0][0]
+        raise ValueError(f"The {transformer.__class__.__name__} cannot be fitted because the table contains 0 rows")
+
+    return [
+        row.select(pl.col(f"{index}/{name}").alias(name) for name in aggregations)
+        for index, (_, aggregations) in enumerate(aggregations_by_transformer)
+    ]
+
+
+def _get_non_missing_values(table: Table, column_name: str) -> pl.Expr:
+    """Return the values of a column without missing values, so they can be sorted or counted."""
+    import polars as pl
+
+    column = pl.col(column_name)
+
+    # polars cannot sort or count values of the null type, but such columns only contain missing values anyway
+    if table._lazy_frame.schema[column_name] == pl.Null:
+        column = column.cast(pl.Boolean)
+
+    return column.drop_nulls()
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from safeds._utils import _structural_hash
+from safeds.exceptions import TransformerNotFittedError
+
+from ._invertible_table_transformer import InvertibleTableTransformer
+from ._table_transformer import _compute_aggregations
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from safeds.data.tabular.containers import Table
+
+    from ._table_transformer import TableTransformer
+
+
+class TransformerPipeline(InvertibleTableTransformer):
+    """
+    Apply several transformers one after the other.
+
+    Fitting a pipeline fits every step on the output of the steps before it, like fitting the transformers one by one.
+    However, consecutive steps that work on different columns and can be fitted from aggregations (`StandardScaler`,
+    `RangeScaler`, `SimpleImputer`, `LabelEncoder`, `OneHotEncoder`, and `Discretizer` with the uniform or quantile
+    strategy) are fitted together in a single query. If the steps do not depend on each other, the table is thus read
+    only once instead of once per step. Transforming a table with the pipeline builds a single lazy query as well.
+
+    Parameters
+    ----------
+    steps:
+        The transformers to apply, each together with the names of the columns to fit it on. If the names are None,
+        the columns passed to `fit` are used.
+
+    Examples
+    --------
+    >>> from safeds.data.tabular.containers import Table
+    >>> from safeds.data.tabular.transformation import LabelEncoder, RangeScaler, TransformerPipeline
+    >>> table = Table({"a": [1, 2, 3], "b": ["x", "y", "x"]})
+    >>> pipeline = TransformerPipeline([(RangeScaler(), ["a"]), (LabelEncoder(), ["b"])])
+    >>> pipeline.fit_and_transform(table)[1]
+    +---------+-----+
+    |       a |   b |
+    |     --- | --- |
+    |     f64 | u32 |
+    +===============+
+    | 0.00000 |   0 |
+    | 0.50000 |   1 |
+    | 1.00000 |   0 |
+    +---------+-----+
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Dunder methods
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, steps: list[tuple[TableTransformer, list[str] | None]]) -> None:
+        super().__init__()
+
+        # Parameters
+        self._steps: list[tuple[TableTransformer, list[str] | None]] = list(steps)
+
+        # Internal state
+        self._fitted_steps: list[TableTransformer] | None = None
+
+    def __hash__(self) -> int:
+        return _structural_hash(
+            super().__hash__(),
+            [(hash(transformer), column_names) for transformer, column_names in self._steps],
+            # Leave out the internal state for faster hashing
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Properties
+    # ------------------------------------------------------------------------------------------------------------------
+
+    @property
+    def steps(self) -> list[tuple[TableTransformer, list[str] | None]]:
+        """The transformers to apply, each together with the names of the columns to fit it on."""
+        return list(self._steps)  # defensive copy
+
+    @property
+    def fitted_steps(self) -> list[TableTransformer]:
+        """
+        The fitted transformers in the order they are applied.
+
+        Raises
+        ------
+        TransformerNotFittedError
+            If the pipeline has not been fitted yet.
+        """
+        if self._fitted_steps is None:
+            raise TransformerNotFittedError
+        return list(self._fitted_steps)  # defensive copy
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # Learning and transformation
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def fit(self, table: Table, column_names: list[str] | None) -> TransformerPipeline:
+        """
+        Learn a transformation for a set of columns in a table.
+
+        This transformer is not modified.
+
+        Parameters
+        ----------
+        table:
+            The table used to fit the transformer.
+        column_names:
+            The list of columns from the table used to fit the steps that do not specify their own columns. If `None`,
+            these steps use their default columns.
+
+        Returns
+        -------
+        fitted_transformer:
+            The fitted transformer.
+
+        Raises
+        ------
+        ColumnNotFoundError
+            If a step should be fitted on a column that is missing in its input.
+        ValueError
+            If the table contains 0 rows.
+        """
+        fitted_steps: list[TableTransformer] = []
+
+        # Steps that are fitted together. Their aggregations are computed over the input of the first of them.
+        group: list[tuple[TableTransformer, list[str], dict[str, pl.Expr]]] = []
+        group_input = table
+        current_table = table
+
+        def fit_group() -> None:
+            nonlocal current_table
+
+            if not group:
+                return
+
+            results = _compute_aggregations(
+                group_input,
+                [(transformer, aggregations) for transformer, _, aggregations in group],
+            )
+            for (transformer, step_column_names, _), result in zip(group, results, strict=True):
+                fitted_step = transformer._fit_from_aggregations(current_table, step_column_names, result)
+                current_table = fitted_step.transform(current_table)
+                fitted_steps.append(fitted_step)
+
+            group.clear()
+
+        for transformer, configured_column_names in self._steps:
+            step_column_names = configured_column_names if configured_column_names is not None else column_names
+
+            # Default columns depend on the output of all previous steps, and a step must not read columns that a
+            # previous step of the group writes
+            if step_column_names is None or not _can_join_group(step_column_names, group, group_input):
+                fit_group()
+                group_input = current_table
+
+            fit_plan = transformer._prepare_fit(group_input, step_column_names)
+            if fit_plan is None:
+                fit_group()
+                fitted_step = transformer.fit(current_table, step_column_names)
+                current_table = fitted_step.transform(current_table)
+                fitted_steps.append(fitted_step)
+                group_input = current_table
+            else:
+                group.append((transformer, *fit_plan))
+
+        fit_group()
+
+        used_column_names: list[str] = []
+        for fitted_step in fitted_steps:
+            used_column_names.extend(name for name in fitted_step._column_names or [] if name not in used_column_names)
+
+        # Create a copy with the learned transformation
+        result = TransformerPipeline(self._steps)
+        result._column_names = used_column_names
+        result._fitted_steps = fitted_steps
+
+        return result
+
+    def transform(self, table: Table) -> Table:
+        """
+        Apply the learned transformation to a table.
+
+        The table is not modified.
+
+        Parameters
+        ----------
+        table:
+            The table to which the learned transformation is applied.
+
+        Returns
+        -------
+        transformed_table:
+            The transformed table.
+
+        Raises
+        ------
+        TransformerNotFittedError
+            If the transformer has not been fitted yet.
+        ColumnNotFoundError
+            If the input of a step does not contain all columns used to fit it.
+        """
+        # Used in favor of is_fitted, so the type checker is happy
+        if self._fitted_steps is None:
+            raise TransformerNotFittedError
+
+        for fitted_step in self._fitted_steps:
+            table = fitted_step.transform(table)
+
+        return table
+
+    def inverse_transform(self, transformed_table: Table) -> Table:
+        """
+        Undo the learned transformation as well as possible.
+
+        The steps are undone in reverse order. Steps that cannot be undone, like the `SimpleImputer`, are skipped.
+
+        The table is not modified.
+
+        Parameters
+        ----------
+        transformed_table:
+            The table to be transformed back to the original version.
+
+        Returns
+        -------
+        original_table:
+            The original table.
+
+        Raises
+        ------
+        TransformerNotFittedError
+            If the transformer has not been fitted yet.
+        ColumnNotFoundError
+            If the input of a step does not contain all columns used to fit it.
+        """
+        # Used in favor of is_fitted, so the type checker is happy
+        if self._fitted_steps is None:
+            raise TransformerNotFittedError
+
+        for fitted_step in reversed(self._fitted_steps):
+            if isinstance(fitted_step, InvertibleTableTransformer):
+                transformed_table = fitted_step.inverse_transform(transformed_table)
+
+        return transformed_table
+
+
+def _can_join_group(
+    column_names: list[str],
+    group: list[tuple[TableTransformer, list[str], dict[str, pl.Expr]]],
+    group_input: Table,
+) -> bool:
+    # Columns that the group does not read are left unchanged by it, so the input of the group can be aggregated instead
+    # of its output. Columns that are not in the input might be created by the group.
+    available_names = set(group_input.column_names)
+    for _, step_column_names, _ in group:
+        available_names.difference_update(step_column_names)
+
+    return all(name in available_names for name in column_names)
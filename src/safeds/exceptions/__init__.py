@@ -46,12 +46,17 @@ class OutOfBoundsError(SafeDsError):
     """Exception raised when a value is outside its expected range."""
 
 
+class SchemaError(SafeDsError):
+    """Exception raised when tables have incompatible schemas."""
+
+
 __all__ = [
     "SafeDsError",
     "ColumnNotFoundError",
     "ColumnTypeError",
     "FileExtensionError",
     "OutOfBoundsError",
+    "SchemaError",
     # TODO
     # Data exceptions
     "ColumnLengthMismatchError",
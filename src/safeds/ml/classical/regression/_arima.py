@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import io
 import itertools
 from typing import TYPE_CHECKING
 
+from safeds._config import _get_plot_backend
 from safeds._utils import _structural_hash
-from safeds.data.image.containers import Image
 from safeds.data.tabular.containers import Column
 from safeds.exceptions import (
     DatasetMissesDataError,
@@ -17,6 +16,7 @@ from safeds.exceptions import (
 if TYPE_CHECKING:
     from statsmodels.tsa.arima.model import ARIMA
 
+    from safeds.data.image.containers import Image
     from safeds.data.labeled.containers import TimeSeriesDataset
 
 
@@ -175,27 +175,13 @@ class ArimaModelRegressor:
             If predicting with the given dataset failed.
 
         """
-        import matplotlib.pyplot as plt
-
         if not self.is_fitted or self._arima is None:
             raise ModelNotFittedError
         test_data = test_series.target._series.to_numpy()
         n_steps = len(test_data)
         forecast_results = self._arima.forecast(steps=n_steps)
 
-        fig = plt.figure()
-        plt.plot(
-            forecast_results,
-        )
-        plt.legend(["forecasted"])
-        plt.plot(test_data)
-        plt.tight_layout()
-
-        buffer = io.BytesIO()
-        fig.savefig(buffer, format="png")
-        plt.close()  # Prevents the figure from being displayed directly
-        buffer.seek(0)
-        return Image.from_bytes(buffer.read())
+        return _get_plot_backend().forecast_plot(forecast_results, test_data)
 
     @property
     def is_fitted(self) -> bool:
@@ -0,0 +1,36 @@
+from safeds._config import _get_plot_backend, _get_plot_cache, _set_plot_backend, _set_plot_cache
+from safeds.data.tabular.plotting._matplotlib_plot_backend import _MatplotlibPlotBackend
+from safeds.data.tabular.plotting._plot_cache import _PlotCache
+from safeds.data.tabular.plotting._raster_plot_backend import _RasterPlotBackend
+
+
+def test_should_use_matplotlib_by_default() -> None:
+    assert isinstance(_get_plot_backend(), _MatplotlibPlotBackend)
+
+
+def test_should_set_plot_backend() -> None:
+    backend = _RasterPlotBackend()
+    try:
+        _set_plot_backend(backend)
+        assert _get_plot_backend() is backend
+    finally:
+        _set_plot_backend(None)
+
+
+def test_should_restore_default_plot_backend() -> None:
+    _set_plot_backend(_RasterPlotBackend())
+    _set_plot_backend(None)
+    assert isinstance(_get_plot_backend(), _MatplotlibPlotBackend)
+
+
+def test_should_not_cache_plots_by_default() -> None:
+    assert _get_plot_cache() is None
+
+
+def test_should_set_plot_cache() -> None:
+    cache = _PlotCache()
+    try:
+        _set_plot_cache(cache)
+        assert _get_plot_cache() is cache
+    finally:
+        _set_plot_cache(None)
@@ -1,7 +1,8 @@
 from typing import Any
 
+import polars as pl
 import pytest
-from safeds._utils._hashing import _structural_hash, _value_to_bytes
+from safeds._utils._hashing import _content_hash, _structural_hash, _value_to_bytes
 from safeds.data.tabular.containers import Table
 
 
@@ -85,3 +86,30 @@ def test_structural_hash(value: Any, expected: int) -> None:
 )
 def test_value_to_bytes(value: Any, expected: bytes) -> None:
     assert _value_to_bytes(value) == expected
+
+
+def test_content_hash_should_be_equal_for_equal_data_frames() -> None:
+    assert _content_hash(pl.DataFrame({"a": [1, None], "b": ["x", "y"]})) == _content_hash(
+        pl.DataFrame({"a": [1, None], "b": ["x", "y"]}),
+    )
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        pl.DataFrame({"a": [1, 3], "b": ["x", "y"]}),
+        pl.DataFrame({"a": [1, None], "b": ["x", "z"]}),
+        pl.DataFrame({"c": [1, None], "b": ["x", "y"]}),
+        pl.DataFrame({"a": [1.0, None], "b": ["x", "y"]}),
+        pl.DataFrame({"a": [1, None, 3], "b": ["x", "y", "z"]}),
+    ],
+    ids=[
+        "different value",
+        "different string",
+        "different name",
+        "different type",
+        "different length",
+    ],
+)
+def test_content_hash_should_differ_for_different_data_frames(other: pl.DataFrame) -> None:
+    assert _content_hash(pl.DataFrame({"a": [1, None], "b": ["x", "y"]})) != _content_hash(other)
@@ -0,0 +1,20 @@
+import io
+
+import matplotlib.pyplot as plt
+from safeds._utils import _figure_to_image
+from safeds.data.image.containers import Image
+
+
+def test_should_have_same_pixels_as_png() -> None:
+    figure, axes = plt.subplots()
+    axes.plot([1, 3, 2])
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png")
+
+    assert _figure_to_image(figure) == Image.from_bytes(buffer.getvalue())
+
+
+def test_should_close_figure() -> None:
+    figure, _ = plt.subplots()
+    _figure_to_image(figure)
+    assert not plt.fignum_exists(figure.number)
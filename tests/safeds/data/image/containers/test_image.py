@@ -146,6 +146,11 @@ class TestReprJpeg:
         image = Image.from_file(resolve_resource_path(resource_path))
         assert image._repr_jpeg_() is None
 
+    def test_should_encode_only_once(self, device: Device) -> None:
+        configure_test_with_device(device)
+        image = Image.from_file(resolve_resource_path(plane_jpg_path))
+        assert image._repr_jpeg_() is image._repr_jpeg_()
+
 
 @pytest.mark.parametrize("device", get_devices(), ids=get_devices_ids())
 class TestReprPng:
@@ -159,6 +164,11 @@ class TestReprPng:
         image = Image.from_file(resolve_resource_path(resource_path))
         assert isinstance(image._repr_png_(), bytes)
 
+    def test_should_encode_only_once(self, device: Device) -> None:
+        configure_test_with_device(device)
+        image = Image.from_file(resolve_resource_path(plane_png_path))
+        assert image._repr_png_() is image._repr_png_()
+
 
 @pytest.mark.parametrize("device", get_devices(), ids=get_devices_ids())
 class TestToJpegFile:
@@ -219,6 +229,14 @@ class TestToPngFile:
                 image_r = Image.from_file(tmp_file.name)
         assert image == image_r
 
+    def test_should_save_same_bytes_as_repr(self, device: Device) -> None:
+        configure_test_with_device(device)
+        image = Image.from_file(resolve_resource_path(plane_png_path))
+        with NamedTemporaryFile(suffix=".png") as tmp_png_file:
+            tmp_png_file.close()
+            image.to_png_file(tmp_png_file.name)
+            assert Path(tmp_png_file.name).read_bytes() == image._repr_png_()
+
 
 @pytest.mark.parametrize("device", get_devices(), ids=get_devices_ids())
 class TestProperties:
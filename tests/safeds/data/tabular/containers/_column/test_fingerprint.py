@@ -0,0 +1,53 @@
+import pytest
+from safeds.data.tabular.containers import Column
+
+
+@pytest.mark.parametrize(
+    ("column1", "column2"),
+    [
+        (Column("a"), Column("a")),
+        (Column("a", [1, None]), Column("a", [1, None])),
+        (Column("a", [0.0, float("nan")]), Column("a", [-0.0, float("nan")])),
+    ],
+    ids=[
+        "empty",
+        "with values",
+        "signed zero and NaN",
+    ],
+)
+def test_should_be_equal_for_equal_columns(column1: Column, column2: Column) -> None:
+    assert column1.fingerprint() == column2.fingerprint()
+
+
+@pytest.mark.parametrize(
+    ("column1", "column2"),
+    [
+        (Column("a", [1, 2]), Column("a", [1, 3])),
+        (Column("a", [1, 2]), Column("b", [1, 2])),
+        (Column("a", [1, 2]), Column("a", ["1", "2"])),
+        (Column("a", [1, 2]), Column("a", [1, None])),
+    ],
+    ids=[
+        "different value",
+        "different name",
+        "different type",
+        "missing value",
+    ],
+)
+def test_should_differ_for_different_columns(column1: Column, column2: Column) -> None:
+    assert column1.fingerprint() != column2.fingerprint()
+
+
+def test_should_be_memoized() -> None:
+    column = Column("a", [1, 2])
+    column.fingerprint()
+    column._Column__fingerprint_cache = 42  # type: ignore[attr-defined]
+    assert column.fingerprint() == 42
+
+
+def test_should_let_eq_return_false_early_if_fingerprints_differ() -> None:
+    column1 = Column("a", [1, 2])
+    column2 = Column("a", [1, 2])
+    column1._Column__fingerprint_cache = 1  # type: ignore[attr-defined]
+    column2._Column__fingerprint_cache = 2  # type: ignore[attr-defined]
+    assert column1 != column2
@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 from safeds.data.tabular.containers import Column
-from safeds.exceptions import NonNumericColumnError
+from safeds.exceptions import NonNumericColumnError, OutOfBoundsError
 
 
 @pytest.mark.parametrize(
@@ -21,6 +22,38 @@ def test_should_return_median_value(values: list, expected: int) -> None:
     assert column.median() == expected
 
 
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        ([1, 2, 3], 2),
+        ([1, 2, 3, 4], 2.5),
+        ([1, 2, 3, None], 2),
+    ],
+    ids=[
+        "odd number of values",
+        "even number of values",
+        "some missing values",
+    ],
+)
+def test_should_return_exact_median_of_few_values_if_approximate(values: list, expected: int) -> None:
+    column = Column("A", values)
+    assert column.median(rank_error=0.01) == expected
+
+
+@pytest.mark.parametrize("rank_error", [0.05, 0.01, 0.001], ids=["5%", "1%", "0.1%"])
+def test_should_estimate_median_within_rank_error(rank_error: float) -> None:
+    values = np.random.default_rng(42).permutation(200_000)
+    column = Column("A", values.tolist())
+    assert column.median(rank_error=rank_error) == pytest.approx(100_000, abs=rank_error * 200_000)
+
+
+@pytest.mark.parametrize("rank_error", [0, 1], ids=["zero", "one"])
+def test_should_raise_if_rank_error_is_out_of_bounds(rank_error: float) -> None:
+    column = Column("A", [1, 2, 3])
+    with pytest.raises(OutOfBoundsError):
+        column.median(rank_error=rank_error)
+
+
 @pytest.mark.parametrize(
     "values",
     [
@@ -1,6 +1,6 @@
 import pytest
 from safeds.data.tabular.containers import Column
-from safeds.exceptions import NonNumericColumnError
+from safeds.exceptions import NonNumericColumnError, OutOfBoundsError
 from syrupy import SnapshotAssertion
 
 
@@ -22,6 +22,39 @@ def test_should_match_snapshot(column: Column, snapshot_png_image: SnapshotAsser
     assert box_plot == snapshot_png_image
 
 
+@pytest.mark.parametrize(
+    "column",
+    [
+        Column("a", [0]),
+        Column("a", [0, 1]),
+        Column("a", [0, 1, 2, 3, 4, 5, 100]),
+    ],
+    ids=[
+        "one row",
+        "multiple rows",
+        "outlier",
+    ],
+)
+def test_should_match_snapshot_if_approximate(column: Column, snapshot_png_image: SnapshotAssertion) -> None:
+    box_plot = column.plot.box_plot(rank_error=0.01)
+    assert box_plot == snapshot_png_image
+
+
+def test_should_reuse_quantile_sketch() -> None:
+    column = Column("a", [0, 1, 2])
+    column.plot.box_plot(rank_error=0.01)
+    sketch = column._get_quantile_sketch(0.01)
+    column.median(rank_error=0.01)
+    assert column._get_quantile_sketch(0.01) is sketch
+
+
+@pytest.mark.parametrize("rank_error", [0, 1], ids=["zero", "one"])
+def test_should_raise_if_rank_error_is_out_of_bounds(rank_error: float) -> None:
+    column = Column("a", [0, 1, 2])
+    with pytest.raises(OutOfBoundsError):
+        column.plot.box_plot(rank_error=rank_error)
+
+
 def test_should_raise_if_column_contains_non_numerical_values() -> None:
     column = Column("a", ["A", "B", "C"])
     with pytest.raises(NonNumericColumnError):
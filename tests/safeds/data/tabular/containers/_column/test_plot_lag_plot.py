@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 from safeds.data.tabular.containers import Column
-from safeds.exceptions import NonNumericColumnError
+from safeds.exceptions import NonNumericColumnError, OutOfBoundsError
 from syrupy import SnapshotAssertion
 
 
@@ -22,6 +23,18 @@ def test_should_match_snapshot(column: Column, snapshot_png_image: SnapshotAsser
     assert lag_plot == snapshot_png_image
 
 
+def test_should_match_snapshot_if_density_is_plotted(snapshot_png_image: SnapshotAssertion) -> None:
+    column = Column("a", np.random.default_rng(42).normal(size=10_000).cumsum().tolist())
+    lag_plot = column.plot.lag_plot(1, maximum_number_of_points=1000)
+    assert lag_plot == snapshot_png_image
+
+
+def test_should_raise_if_maximum_number_of_points_is_out_of_bounds() -> None:
+    column = Column("a", [0, 1, 2])
+    with pytest.raises(OutOfBoundsError):
+        column.plot.lag_plot(1, maximum_number_of_points=-1)
+
+
 def test_should_raise_if_column_contains_non_numerical_values() -> None:
     column = Column("a", ["A", "B", "C"])
     with pytest.raises(NonNumericColumnError):
@@ -1,5 +1,8 @@
+from pathlib import Path
+
 import pytest
 from safeds.data.tabular.containers import Column, Table
+from safeds.exceptions import ColumnLengthMismatchError, DuplicateColumnError
 
 
 @pytest.mark.parametrize(
@@ -53,6 +56,50 @@ def test_should_add_columns_from_table(table1: Table, table2: Table, expected: T
     assert table1 == expected
 
 
+@pytest.mark.parametrize(
+    "columns",
+    [
+        [Column("col1", [1, 2])],
+        [Column("col2", [1, 2]), Column("col2", [3, 4])],
+    ],
+    ids=["existing column", "duplicate new columns"],
+)
+def test_should_raise_error_if_column_name_exists(columns: list[Column]) -> None:
+    with pytest.raises(DuplicateColumnError):
+        Table({"col1": [1, 2]}).add_columns(columns)
+
+
+def test_should_not_load_table() -> None:
+    table = Table({"col1": [1, 2, 3]}).remove_rows_by_column("col1", lambda cell: cell > 1)
+    table = table.add_columns(Column("col2", [4]))
+    assert table._Table__data_frame_cache is None  # type: ignore[attr-defined]
+    assert table == Table({"col1": [1], "col2": [4]})
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        Table({"col2": [1, 2, 3, 4]}),
+        Table({"col2": [1]}),
+    ],
+    ids=["more rows", "single row"],
+)
+def test_should_raise_error_if_number_of_rows_differs(other: Table) -> None:
+    with pytest.raises(ColumnLengthMismatchError):
+        Table({"col1": [1, 2, 3]}).add_table_as_columns(other)
+
+
+def test_should_raise_error_if_number_of_rows_of_columns_differs() -> None:
+    with pytest.raises(ColumnLengthMismatchError):
+        Table({"col1": [1, 2, 3]}).add_columns(Column("col2", [1, 2]))
+
+
+def test_should_write_added_columns_to_file(tmp_path: Path) -> None:
+    table = Table({"col1": [1, 2]}).add_columns(Column("col2", [3, 4]))
+    table.to_csv_file(tmp_path / "table.csv")
+    assert Table.from_csv_file(tmp_path / "table.csv") == Table({"col1": [1, 2], "col2": [3, 4]})
+
+
 #  TODO - separate test for add_table_as_columns and a new one here
 # @pytest.mark.parametrize(
 #     ("table", "columns", "error_message_regex"),
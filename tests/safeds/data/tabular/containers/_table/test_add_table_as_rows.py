@@ -0,0 +1,47 @@
+import pytest
+from safeds.data.tabular.containers import Table
+from safeds.exceptions import SchemaError
+
+
+@pytest.mark.parametrize(
+    ("table1", "table2", "expected"),
+    [
+        (
+            Table({"col1": [1, 2], "col2": ["a", "b"]}),
+            Table({"col1": [3], "col2": ["c"]}),
+            Table({"col1": [1, 2, 3], "col2": ["a", "b", "c"]}),
+        ),
+        (
+            Table({"col1": [1, 2]}),
+            Table({"col1": [3]}).remove_rows_by_column("col1", lambda cell: cell > 0),
+            Table({"col1": [1, 2]}),
+        ),
+        (Table(), Table({"col1": [1]}), Table({"col1": [1]})),
+    ],
+    ids=["with rows", "no rows", "empty"],
+)
+def test_should_add_rows(table1: Table, table2: Table, expected: Table) -> None:
+    assert table1.add_table_as_rows(table2) == expected
+
+
+def test_should_not_load_tables() -> None:
+    table1 = Table({"col1": [1, 2, 3]}).remove_rows_by_column("col1", lambda cell: cell > 1)
+    table2 = Table({"col1": [4, 5]})
+    table = table1.add_table_as_rows(table2)
+    assert table._Table__data_frame_cache is None  # type: ignore[attr-defined]
+    assert table == Table({"col1": [1, 4, 5]})
+
+
+@pytest.mark.parametrize(
+    ("table", "other"),
+    [
+        (Table({"col1": [1, 2, 3]}), Table({"col2": [1]})),
+        (Table({"col1": [1, 2, 3]}), Table({"col1": ["a"]})),
+        (Table({"col1": [1, 2, 3]}), Table({"col1": [1], "col2": [2]})),
+        (Table({"col1": [1], "col2": [2]}), Table({"col2": [2], "col1": [1]})),
+    ],
+    ids=["different names", "different types", "additional column", "different order"],
+)
+def test_should_raise_error_if_schemas_differ(table: Table, other: Table) -> None:
+    with pytest.raises(SchemaError):
+        table.add_table_as_rows(other)
@@ -0,0 +1,34 @@
+import pyarrow as pa
+import pytest
+from safeds.data.tabular.containers import Column, Table
+
+
+@pytest.mark.parametrize(
+    "table",
+    [
+        Table(),
+        Table({"a": []}),
+        Table({"a": [1, 2], "b": ["c", "d"]}),
+        Table({"a": [1, 2, 3, 4]}).remove_rows_by_column("a", lambda cell: cell % 2 == 0),
+        Table({"a": [1, 2]}).add_columns(Column("b", [3, 4])),
+    ],
+    ids=[
+        "empty",
+        "no rows",
+        "non-empty",
+        "lazy",
+        "not streamable",
+    ],
+)
+def test_should_restore_table_from_stream(table: Table) -> None:
+    restored = Table.from_arrow(pa.RecordBatchReader.from_stream(table).read_all())
+
+    assert restored.schema == table.schema
+    assert restored == table
+
+
+def test_should_send_data_in_batches() -> None:
+    table = Table({"a": list(range(100_000))})
+    reader = pa.RecordBatchReader.from_stream(table)
+
+    assert [batch.num_rows for batch in reader] == [65_536, 34_464]
@@ -0,0 +1,81 @@
+import gc
+from pathlib import Path
+
+import pytest
+from safeds.data.tabular.containers import Column, Table, _table
+from safeds.exceptions import OutOfBoundsError
+
+
+@pytest.mark.parametrize(
+    "table",
+    [
+        Table(),
+        Table({"col1": []}),
+        Table({"col1": [1, 2, 3], "col2": ["a", "b", "c"]}),
+        Table({"col1": [1, 2, 3, 4]}).remove_rows_by_column("col1", lambda cell: cell % 2 == 0),
+        Table({"col1": [1, 2]}).add_columns(Column("col2", [3, 4])),
+    ],
+    ids=[
+        "empty",
+        "no rows",
+        "non-empty",
+        "lazy",
+        "not streamable",
+    ],
+)
+@pytest.mark.parametrize(
+    "memory_limit",
+    [None, 0, 1_000_000],
+    ids=["in memory", "on disk", "below memory limit"],
+)
+def test_should_keep_data(table: Table, memory_limit: int | None) -> None:
+    cached_table = table.cache(memory_limit=memory_limit)
+    assert cached_table.schema == table.schema
+    assert cached_table == table
+
+
+@pytest.mark.parametrize(
+    ("memory_limit", "expected_source"),
+    [
+        (None, "DF"),
+        (0, "DF"),
+        (1_000_000, "DF"),
+    ],
+    ids=["in memory", "on disk", "below memory limit"],
+)
+def test_should_not_read_file_again(tmp_path: Path, memory_limit: int | None, expected_source: str) -> None:
+    path = tmp_path / "table.csv"
+    Table({"col1": [1, 2, 3], "col2": [4, 5, 6]}).to_csv_file(path)
+
+    table = Table.from_csv_file(path).cache(memory_limit=memory_limit)
+    path.unlink()
+
+    derived_table = table.remove_rows_by_column("col1", lambda cell: cell == 2)
+    assert expected_source in derived_table.explain()
+    assert derived_table == Table({"col1": [1, 3], "col2": [4, 6]})
+
+
+def test_should_not_change_original_table(tmp_path: Path) -> None:
+    path = tmp_path / "table.csv"
+    Table({"col1": [1, 2, 3]}).to_csv_file(path)
+
+    table = Table.from_csv_file(path)
+    table.cache(memory_limit=0)
+    assert "Csv SCAN" in table.explain()
+
+
+def test_should_raise_if_memory_limit_is_negative() -> None:
+    with pytest.raises(OutOfBoundsError):
+        Table().cache(memory_limit=-1)
+
+
+def test_should_remove_spill_file_once_data_is_unused() -> None:
+    table = Table({"col1": list(range(1000))}).remove_rows_by_column("col1", lambda cell: cell % 2 == 0)
+    cached_table = table.cache(memory_limit=0)
+    derived_table = cached_table.remove_columns([])
+    del cached_table
+    gc.collect()
+
+    assert _table._spill_directory is not None
+    assert list(Path(_table._spill_directory.name).iterdir()) == []
+    assert derived_table == table
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+from safeds.data.tabular.containers import Table
+from safeds.exceptions import OutOfBoundsError
+
+
+@pytest.mark.parametrize(
+    "table",
+    [
+        Table(),
+        Table({"a": [1, 2, 3.5], "b": [0.2, 4, 77]}),
+        Table({"a": [1, 2, 3], "b": [3, 2, None], "c": ["x", "y", "z"]}),
+        Table({"a": [1, 2, 3], "b": [5, 5, 5]}),
+        Table({"a": [1e9 + 1, 1e9 + 2, 1e9 + 4], "b": [3, 2, 0]}),
+    ],
+    ids=[
+        "empty",
+        "numeric",
+        "missing values and non-numeric column",
+        "constant column",
+        "large mean",
+    ],
+)
+def test_should_match_polars(table: Table) -> None:
+    numeric_frame = table.remove_non_numeric_columns()._data_frame.fill_null(0)
+    expected = numeric_frame.corr() if numeric_frame.width > 0 else pl.DataFrame()
+    assert_frame_equal(table.compute_correlation_matrix()._data_frame, expected, atol=1e-12)
+
+
+def test_should_stream_files(tmp_path: Path) -> None:
+    rng = np.random.default_rng(42)
+    frame = pl.DataFrame({"a": rng.normal(size=100_000), "b": rng.normal(size=100_000), "c": ["x"] * 100_000})
+    frame = frame.with_columns(b=pl.col("a") + pl.col("b"))
+    path = tmp_path / "data.csv"
+    frame.write_csv(path)
+
+    actual = Table.from_csv_file(path).compute_correlation_matrix()
+    assert_frame_equal(actual._data_frame, frame.drop("c").corr(), atol=1e-12)
+
+
+def test_should_estimate_correlation_from_sample() -> None:
+    rng = np.random.default_rng(42)
+    a = rng.normal(size=100_000)
+    table = Table({"a": a.tolist(), "b": (a + rng.normal(size=100_000)).tolist()})
+
+    actual = table.compute_correlation_matrix(maximum_number_of_rows=10_000)
+    assert actual.get_column("b").get_value(0) == pytest.approx(np.sqrt(0.5), abs=0.02)
+
+
+def test_should_raise_if_maximum_number_of_rows_is_out_of_bounds() -> None:
+    with pytest.raises(OutOfBoundsError):
+        Table({"a": [1, 2]}).compute_correlation_matrix(maximum_number_of_rows=1)
@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import polars as pl
+import pytest
+from safeds.data.tabular.containers import Table
+from safeds.exceptions import OutOfBoundsError
+
+
+@pytest.mark.parametrize(
+    ("table", "maximum_number_of_bins", "expected"),
+    [
+        (
+            Table(),
+            10,
+            Table._from_polars_data_frame(
+                pl.DataFrame(
+                    schema={"column": pl.String, "bin_start": pl.Float64, "bin_end": pl.Float64, "count": pl.UInt32},
+                ),
+            ),
+        ),
+        (
+            Table({"a": [3, 1, 3, None]}),
+            10,
+            Table._from_polars_data_frame(
+                pl.DataFrame(
+                    {"column": ["a", "a"], "bin_start": [1.0, 3.0], "bin_end": [1.0, 3.0], "count": [1, 2]},
+                    schema_overrides={"count": pl.UInt32},
+                ),
+            ),
+        ),
+        (
+            Table({"a": [0, 1, 2, 3, 4, 4]}),
+            2,
+            Table._from_polars_data_frame(
+                pl.DataFrame(
+                    {
+                        "column": ["a", "a"],
+                        "bin_start": [-1e-6, (4 + 1e-6) / 2 - 1e-6],
+                        "bin_end": [(4 + 1e-6) / 2 - 1e-6, 4.0],
+                        "count": [2, 4],
+                    },
+                    schema_overrides={"count": pl.UInt32},
+                ),
+            ),
+        ),
+        (
+            Table({"a": [1, 2], "b": ["y", "x"]}),
+            1,
+            Table._from_polars_data_frame(
+                pl.DataFrame(
+                    {"column": ["a", "b"], "bin_start": ["0.999999", "x"], "bin_end": ["2.0", "x"], "count": [2, 1]},
+                    schema_overrides={"count": pl.UInt32},
+                ),
+            ),
+        ),
+    ],
+    ids=[
+        "empty",
+        "distinct values",
+        "equally wide bins",
+        "non-numeric column",
+    ],
+)
+def test_should_compute_histograms(table: Table, maximum_number_of_bins: int, expected: Table) -> None:
+    assert table.compute_histograms(maximum_number_of_bins=maximum_number_of_bins) == expected
+
+
+def test_should_count_every_non_missing_value_once() -> None:
+    table = Table({"a": [float(i) for i in range(100)] + [None]})
+    histograms = table.compute_histograms(maximum_number_of_bins=7)
+    assert histograms.number_of_rows == 7
+    assert histograms.get_column("count").to_list() == [15, 14, 14, 14, 14, 14, 15]
+
+
+def test_should_give_same_result_when_streaming_file(tmp_path: Path) -> None:
+    path = tmp_path / "data.csv"
+    data = {"a": [i % 1000 for i in range(300_000)], "b": [f"x{i % 7}" for i in range(300_000)]}
+    pl.DataFrame(data).write_csv(path)
+
+    histograms = Table.from_csv_file(path).compute_histograms()
+    assert histograms == Table(data).compute_histograms()
+
+
+def test_should_raise_if_maximum_number_of_bins_is_out_of_bounds() -> None:
+    with pytest.raises(OutOfBoundsError):
+        Table({"a": [1]}).compute_histograms(maximum_number_of_bins=0)
@@ -0,0 +1,18 @@
+from pathlib import Path
+
+from safeds.data.tabular.containers import Table
+
+from tests.helpers import resolve_resource_path
+
+
+def test_should_show_source_of_data() -> None:
+    table = Table.from_csv_file(resolve_resource_path("table.csv"))
+    assert "Csv SCAN" in table.explain()
+
+
+def test_should_show_optimized_query(tmp_path: Path) -> None:
+    path = tmp_path / "table.parquet"
+    Table({"col1": [1, 2, 3], "col2": [4, 5, 6]}).to_parquet_file(path)
+
+    table = Table.from_parquet_file(path).remove_columns("col2")
+    assert "PROJECT 1/2 COLUMNS" in table.explain()
@@ -0,0 +1,87 @@
+import polars as pl
+import pytest
+from safeds.data.tabular.containers import Table
+
+
+@pytest.mark.parametrize(
+    ("table1", "table2"),
+    [
+        (Table(), Table()),
+        (Table({"a": [], "b": []}), Table({"a": [], "b": []})),
+        (Table({"a": [1, None], "b": ["x", "y"]}), Table({"a": [1, None], "b": ["x", "y"]})),
+        (
+            Table({"a": [0, 1, 2, 3]}).slice_rows(1, 2),
+            Table({"a": [1, 2]}),
+        ),
+        (
+            Table._from_polars_data_frame(
+                pl.concat([pl.DataFrame({"a": [1]}), pl.DataFrame({"a": [2]})], rechunk=False)
+            ),
+            Table({"a": [1, 2]}),
+        ),
+        (
+            Table._from_polars_data_frame(pl.DataFrame({"a": ["x", "y"]}, schema={"a": pl.Categorical})),
+            Table._from_polars_data_frame(pl.DataFrame({"a": ["x", "y"]}, schema={"a": pl.Categorical})),
+        ),
+    ],
+    ids=[
+        "empty",
+        "no rows",
+        "with values",
+        "slice",
+        "several chunks",
+        "categorical",
+    ],
+)
+def test_should_be_equal_for_equal_tables(table1: Table, table2: Table) -> None:
+    assert table1.fingerprint() == table2.fingerprint()
+
+
+@pytest.mark.parametrize(
+    ("table1", "table2"),
+    [
+        (Table({"a": [1, 2]}), Table({"a": [1, 3]})),
+        (Table({"a": [1, 2]}), Table({"b": [1, 2]})),
+        (Table({"a": [1, 2]}), Table({"a": [1.0, 2.0]})),
+        (Table({"a": [1, 2]}), Table({"a": [2, 1]})),
+        (Table({"a": [1, 2]}), Table({"a": [1, None]})),
+        (Table({"a": [1, 2]}), Table({"a": [1, 2, 3]})),
+        (Table({"a": [1], "b": [2]}), Table({"b": [2], "a": [1]})),
+    ],
+    ids=[
+        "different value",
+        "different name",
+        "different type",
+        "different order",
+        "missing value",
+        "different length",
+        "different column order",
+    ],
+)
+def test_should_differ_for_different_tables(table1: Table, table2: Table) -> None:
+    assert table1.fingerprint() != table2.fingerprint()
+
+
+def test_should_be_memoized() -> None:
+    table = Table({"a": [1, 2]})
+    table.fingerprint()
+    # Equal content would still give an equal fingerprint, so replace it with a different one to detect recomputation
+    table._Table__fingerprint_cache = 42  # type: ignore[attr-defined]
+    assert table.fingerprint() == 42
+
+
+def test_should_let_eq_return_false_early_if_fingerprints_differ() -> None:
+    table1 = Table({"a": [1, 2]})
+    table2 = Table({"a": [1, 2]})
+    table1._Table__fingerprint_cache = 1  # type: ignore[attr-defined]
+    table2._Table__fingerprint_cache = 2  # type: ignore[attr-defined]
+    assert table1 != table2
+
+
+def test_should_not_let_eq_return_false_early_if_schemas_differ() -> None:
+    # DataFrame.equals ignores the types of columns, but the fingerprint does not
+    table1 = Table._from_polars_data_frame(pl.DataFrame({"a": [1, 2]}, schema={"a": pl.Int32}))
+    table2 = Table({"a": [1, 2]})
+    table1.fingerprint()
+    table2.fingerprint()
+    assert (table1 == table2) == table1._data_frame.equals(table2._data_frame)
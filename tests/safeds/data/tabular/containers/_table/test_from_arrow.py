@@ -0,0 +1,46 @@
+import pyarrow as pa
+import pytest
+from safeds.data.tabular.containers import Table
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (pa.table({}), Table()),
+        (pa.table({"a": pa.array([], pa.int64())}), Table({"a": [1]}).slice_rows(length=0)),
+        (pa.table({"a": [1, 2], "b": ["c", "d"]}), Table({"a": [1, 2], "b": ["c", "d"]})),
+        (pa.record_batch({"a": [1, 2], "b": ["c", "d"]}), Table({"a": [1, 2], "b": ["c", "d"]})),
+        (
+            pa.RecordBatchReader.from_batches(
+                pa.schema({"a": pa.int64()}),
+                [pa.record_batch({"a": [1, 2]}), pa.record_batch({"a": [3]})],
+            ),
+            Table({"a": [1, 2, 3]}),
+        ),
+        (Table({"a": [1, 2], "b": ["c", "d"]}), Table({"a": [1, 2], "b": ["c", "d"]})),
+    ],
+    ids=[
+        "empty",
+        "no rows",
+        "table",
+        "record batch",
+        "stream",
+        "safe-ds table",
+    ],
+)
+def test_should_create_table_from_arrow_data(data: object, expected: Table) -> None:
+    table = Table.from_arrow(data)
+    assert table.schema == expected.schema
+    assert table == expected
+
+
+def test_should_not_copy_numeric_data() -> None:
+    data = pa.table({"a": [1, 2, 3]})
+    table = Table.from_arrow(data)
+
+    assert table.to_arrow().column("a").chunk(0).buffers()[1].address == data.column("a").chunk(0).buffers()[1].address
+
+
+def test_should_raise_if_data_is_not_arrow_data() -> None:
+    with pytest.raises(TypeError):
+        Table.from_arrow(1)
@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import polars as pl
+import pytest
+from safeds.data.tabular.containers import Table
+from safeds.exceptions import FileExtensionError
+
+from tests.helpers import resolve_resource_path
+
+
+@pytest.mark.parametrize(
+    ("file_name", "expected"),
+    [
+        ("table.arrow", Table({"A": ["❔"], "B": [2]})),
+        ("table.feather", Table({"A": ["❔"], "B": [2]})),
+        ("table.ipc", Table({"A": ["❔"], "B": [2]})),
+        ("table.arrow", Table()),
+    ],
+    ids=["arrow", "feather", "ipc", "empty"],
+)
+def test_should_create_table_from_arrow_ipc_file(file_name: str, expected: Table, tmp_path: Path) -> None:
+    path = tmp_path / file_name
+    expected._data_frame.write_ipc(path)
+
+    table = Table.from_arrow_ipc_file(path)
+    assert table.schema == expected.schema
+    assert table == expected
+
+
+def test_should_read_compressed_file(tmp_path: Path) -> None:
+    path = tmp_path / "table.arrow"
+    pl.DataFrame({"A": ["a", "b"], "B": [1, 2]}).write_ipc(path, compression="zstd")
+
+    assert Table.from_arrow_ipc_file(path) == Table({"A": ["a", "b"], "B": [1, 2]})
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "test_table_from_arrow_ipc_file_invalid.arrow",
+        Path("test_table_from_arrow_ipc_file_invalid.arrow"),
+    ],
+    ids=["by String", "by path"],
+)
+def test_should_raise_error_if_file_not_found(path: str | Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        Table.from_arrow_ipc_file(resolve_resource_path(path))
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "invalid_file_extension.file_extension",
+        Path("invalid_file_extension.file_extension"),
+    ],
+    ids=["by String", "by path"],
+)
+def test_should_raise_error_if_wrong_file_extension(path: str | Path) -> None:
+    with pytest.raises(FileExtensionError):
+        Table.from_arrow_ipc_file(resolve_resource_path(path))
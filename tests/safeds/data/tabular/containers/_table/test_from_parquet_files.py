@@ -0,0 +1,117 @@
+from pathlib import Path
+
+import pytest
+from safeds.data.tabular.containers import Table
+from safeds.exceptions import FileExtensionError
+
+
+@pytest.fixture
+def partitioned_directory(tmp_path: Path) -> Path:
+    for year in [2020, 2021]:
+        for month in [1, 2]:
+            directory = tmp_path / f"year={year}" / f"month={month}"
+            directory.mkdir(parents=True)
+            Table({"value": [year * 100 + month]}).to_parquet_file(directory / "part-0.parquet")
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    ("paths", "hive_partitioning", "expected"),
+    [
+        (
+            ".",
+            True,
+            Table(
+                {
+                    "value": [202001, 202002, 202101, 202102],
+                    "year": [2020, 2020, 2021, 2021],
+                    "month": [1, 2, 1, 2],
+                },
+            ),
+        ),
+        (
+            "**/*.parquet",
+            True,
+            Table(
+                {
+                    "value": [202001, 202002, 202101, 202102],
+                    "year": [2020, 2020, 2021, 2021],
+                    "month": [1, 2, 1, 2],
+                },
+            ),
+        ),
+        (
+            ["year=2021/month=2/part-0.parquet", "year=2020"],
+            True,
+            Table(
+                {
+                    "value": [202102, 202001, 202002],
+                    "year": [2021, 2020, 2020],
+                    "month": [2, 1, 2],
+                },
+            ),
+        ),
+        (
+            ".",
+            False,
+            Table({"value": [202001, 202002, 202101, 202102]}),
+        ),
+    ],
+    ids=["directory", "glob pattern", "list", "without hive partitioning"],
+)
+def test_should_create_table_from_parquet_files(
+    partitioned_directory: Path,
+    paths: str | list[str],
+    hive_partitioning: bool,
+    expected: Table,
+) -> None:
+    if isinstance(paths, list):
+        paths = [str(partitioned_directory / path) for path in paths]
+    else:
+        paths = str(partitioned_directory / paths)
+
+    table = Table.from_parquet_files(paths, hive_partitioning=hive_partitioning)
+    assert table.schema == expected.schema
+    assert table == expected
+
+
+def test_should_apply_filters_and_selections(partitioned_directory: Path) -> None:
+    table = (
+        Table.from_parquet_files(partitioned_directory)
+        .remove_rows_by_column("year", lambda cell: cell == 2020)
+        .remove_columns_except(["value", "month"])
+    )
+    assert table.schema == Table({"value": [0], "month": [0]}).schema
+    assert table == Table({"value": [202101, 202102], "month": [1, 2]})
+
+
+def test_should_infer_type_of_partition_columns(tmp_path: Path) -> None:
+    for number, name in [("1", "1"), ("0.5", "a")]:
+        directory = tmp_path / "integer=1" / f"number={number}" / f"name={name}"
+        directory.mkdir(parents=True)
+        Table({"value": [1]}).to_parquet_file(directory / "part-0.parquet")
+
+    table = Table.from_parquet_files(tmp_path)
+    assert table.schema == Table({"value": [1, 1], "integer": [1, 1], "number": [0.5, 1.0], "name": ["a", "1"]}).schema
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "missing.parquet",
+        "missing_directory",
+        "*.parquet",
+    ],
+    ids=["file", "directory", "glob pattern"],
+)
+def test_should_raise_error_if_no_file_is_found(tmp_path: Path, path: str) -> None:
+    (tmp_path / "missing_directory").mkdir(exist_ok=True)
+    with pytest.raises(FileNotFoundError):
+        Table.from_parquet_files(str(tmp_path / path))
+
+
+def test_should_raise_error_if_wrong_file_extension(tmp_path: Path) -> None:
+    path = tmp_path / "table.csv"
+    path.touch()
+    with pytest.raises(FileExtensionError):
+        Table.from_parquet_files([path])
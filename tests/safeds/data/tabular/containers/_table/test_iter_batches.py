@@ -0,0 +1,70 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+from safeds.data.tabular.containers import Column, Table
+from safeds.exceptions import OutOfBoundsError
+
+
+@pytest.mark.parametrize(
+    ("table", "batch_size", "expected"),
+    [
+        (Table(), 1, []),
+        (Table({"col1": []}), 1, []),
+        (
+            Table({"col1": [1, 2, 3], "col2": ["a", "b", "c"]}),
+            2,
+            [Table({"col1": [1, 2], "col2": ["a", "b"]}), Table({"col1": [3], "col2": ["c"]})],
+        ),
+        (
+            Table({"col1": [1, 2, 3]}),
+            3,
+            [Table({"col1": [1, 2, 3]})],
+        ),
+        (
+            Table({"col1": [1, 2, 3, 4]}).remove_rows_by_column("col1", lambda cell: cell % 2 == 0),
+            1,
+            [Table({"col1": [1]}), Table({"col1": [3]})],
+        ),
+        (
+            Table({"col1": [1, 2]}).add_columns(Column("col2", [3, 4])),
+            1,
+            [Table({"col1": [1], "col2": [3]}), Table({"col1": [2], "col2": [4]})],
+        ),
+    ],
+    ids=[
+        "empty",
+        "no rows",
+        "last batch smaller",
+        "single batch",
+        "lazy",
+        "not streamable",
+    ],
+)
+def test_should_return_batches(table: Table, batch_size: int, expected: list[Table]) -> None:
+    assert list(table.iter_batches(batch_size)) == expected
+
+
+def test_should_keep_order_of_rows() -> None:
+    table = Table({"col1": list(range(100_000))}).remove_rows_by_column("col1", lambda cell: cell % 3 == 0)
+    values = [value for batch in table.iter_batches(1000) for value in batch.get_column("col1")]
+    assert values == table.get_column("col1").to_list()
+
+
+def test_should_raise_if_batch_size_is_out_of_bounds() -> None:
+    with pytest.raises(OutOfBoundsError):
+        Table().iter_batches(0)
+
+
+def test_should_keep_temporary_file_until_iteration_is_finished(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    table = Table({"col1": [1, 2, 3]}).remove_rows_by_column("col1", lambda cell: cell > 2)
+    batches = table.iter_batches(1)
+
+    assert next(batches) == Table({"col1": [1]})
+    assert list(tmp_path.glob("*/batches.arrow")) != []
+
+    assert list(batches) == [Table({"col1": [2]})]
+    assert list(tmp_path.iterdir()) == []
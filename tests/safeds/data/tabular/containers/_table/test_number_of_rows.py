@@ -1,3 +1,7 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import polars as pl
 import pytest
 from safeds.data.tabular.containers import Table
 
@@ -8,8 +12,23 @@ from safeds.data.tabular.containers import Table
         (Table(), 0),
         (Table({"col1": [1]}), 1),
         (Table({"col1": [1, 2]}), 2),
+        (Table({"col1": [1, 2, 3]}).remove_rows_by_column("col1", lambda cell: cell > 1), 1),
     ],
-    ids=["empty", "a row", "2 rows"],
+    ids=["empty", "a row", "2 rows", "lazy"],
 )
 def test_should_return_number_of_rows(table: Table, expected: int) -> None:
     assert table.number_of_rows == expected
+
+
+@pytest.mark.parametrize(
+    ("write", "read"),
+    [
+        (pl.DataFrame.write_csv, Table.from_csv_file),
+        (pl.DataFrame.write_parquet, Table.from_parquet_file),
+    ],
+    ids=["csv", "parquet"],
+)
+def test_should_count_rows_of_file(write: Callable, read: Callable, tmp_path: Path) -> None:
+    path = tmp_path / "table.csv" if read is Table.from_csv_file else tmp_path / "table.parquet"
+    write(pl.DataFrame({"col1": range(1000), "col2": ["a"] * 1000}), path)
+    assert read(path).number_of_rows == 1000
@@ -0,0 +1,45 @@
+import pytest
+from safeds.data.tabular.containers import Table
+from safeds.exceptions import NonNumericColumnError, OutOfBoundsError
+
+
+@pytest.mark.parametrize(
+    ("table", "columns_per_image", "expected_number_of_images"),
+    [
+        (Table({"A": [1, 2, 3]}), 1, 1),
+        (Table({"A": [1, 2], "B": ["a", "b"], "C": [1.5, None]}), 1, 2),
+        (Table({"A": [1, 2], "B": [3, 4], "C": [1.5, None]}), 2, 2),
+    ],
+    ids=["one column", "non-numeric column", "two columns per image"],
+)
+def test_should_plot_tiles_of_numeric_columns(
+    table: Table,
+    columns_per_image: int,
+    expected_number_of_images: int,
+) -> None:
+    images = table.plot.box_plot_list(columns_per_image=columns_per_image)
+    assert images.number_of_images == expected_number_of_images
+
+
+def test_should_match_box_plots_of_single_columns() -> None:
+    table = Table({"A": [1, 2, 2], "B": [3.5, 1.0, 2.0]})
+    images = table.plot.box_plot_list()
+    assert images.to_images() == [table.remove_columns_except(name).plot.box_plots() for name in table.column_names]
+
+
+def test_should_raise_if_table_contains_only_non_numeric_columns() -> None:
+    with pytest.raises(NonNumericColumnError):
+        Table({"A": ["a", "b"]}).plot.box_plot_list()
+
+
+@pytest.mark.parametrize(
+    ("columns_per_image", "number_of_workers"),
+    [
+        (0, 1),
+        (1, 0),
+    ],
+    ids=["columns per image", "number of workers"],
+)
+def test_should_raise_if_out_of_bounds(columns_per_image: int, number_of_workers: int) -> None:
+    with pytest.raises(OutOfBoundsError):
+        Table({"A": [1]}).plot.box_plot_list(columns_per_image=columns_per_image, number_of_workers=number_of_workers)
@@ -1,6 +1,6 @@
 import pytest
 from safeds.data.tabular.containers import Table
-from safeds.exceptions import NonNumericColumnError
+from safeds.exceptions import NonNumericColumnError, OutOfBoundsError
 from syrupy import SnapshotAssertion
 
 
@@ -18,6 +18,25 @@ def test_should_match_snapshot(table: Table, snapshot_png_image: SnapshotAsserti
     assert boxplots == snapshot_png_image
 
 
+@pytest.mark.parametrize(
+    "table",
+    [
+        Table({"A": [1, 2, 3, 50]}),
+        Table({"A": [1, 2, 3], "B": ["A", "A", "Bla"], "C": [True, True, False], "D": [1.0, 2.1, 4.5]}),
+        Table({"A": [1, 2, 3], "B": [1.0, 2.1, 4.5], "C": [1, 2, 3], "D": [1.0, 2.1, None]}),
+    ],
+    ids=["one column with outlier", "four columns (some non-numeric)", "four columns (all numeric)"],
+)
+def test_should_match_snapshot_when_streaming(table: Table, snapshot_png_image: SnapshotAssertion) -> None:
+    boxplots = table.plot.box_plots(streaming=True)
+    assert boxplots == snapshot_png_image
+
+
+def test_should_have_same_layout_when_streaming() -> None:
+    table = Table({name: [1, 2, 2, 3] for name in "ABCDE"})
+    assert table.plot.box_plots(streaming=True).size == table.plot.box_plots().size
+
+
 def test_should_raise_if_column_contains_non_numerical_values() -> None:
     table = Table.from_dict({"A": ["1", "2", "3.5"], "B": ["0.2", "4", "77"]})
     with pytest.raises(
@@ -33,3 +52,21 @@ def test_should_raise_if_column_contains_non_numerical_values() -> None:
 def test_should_fail_on_empty_table() -> None:
     with pytest.raises(NonNumericColumnError):
         Table().plot.box_plots()
+
+
+def test_should_have_same_layout_with_multiple_workers() -> None:
+    table = Table({name: [1, 2, 2, 3] for name in "ABCDE"})
+    boxplots = table.plot.box_plots(number_of_workers=2)
+    expected = table.plot.box_plots()
+    assert boxplots.size == expected.size
+
+
+def test_should_raise_if_number_of_workers_is_out_of_bounds() -> None:
+    with pytest.raises(OutOfBoundsError):
+        Table({"A": [1]}).plot.box_plots(number_of_workers=0)
+
+
+@pytest.mark.parametrize("rank_error", [0, 1], ids=["zero", "one"])
+def test_should_raise_if_rank_error_is_out_of_bounds(rank_error: float) -> None:
+    with pytest.raises(OutOfBoundsError):
+        Table({"A": [1]}).plot.box_plots(streaming=True, rank_error=rank_error)
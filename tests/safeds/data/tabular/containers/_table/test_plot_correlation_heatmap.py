@@ -1,5 +1,6 @@
 import pytest
 from safeds.data.tabular.containers import Table
+from safeds.exceptions import OutOfBoundsError
 from syrupy import SnapshotAssertion
 
 
@@ -15,6 +16,16 @@ def test_should_match_snapshot(table: Table, snapshot_png_image: SnapshotAsserti
     assert correlation_heatmap == snapshot_png_image
 
 
+def test_should_have_same_size_if_sampled() -> None:
+    table = Table({"A": [1, 2, 3.5, 4], "B": [0.2, 4, 77, 3]})
+    assert table.plot.correlation_heatmap(maximum_number_of_rows=3).size == table.plot.correlation_heatmap().size
+
+
+def test_should_raise_if_maximum_number_of_rows_is_out_of_bounds() -> None:
+    with pytest.raises(OutOfBoundsError):
+        Table({"A": [1, 2]}).plot.correlation_heatmap(maximum_number_of_rows=1)
+
+
 #  TODO
 # def test_should_warn_about_empty_table() -> None:
 #     with pytest.warns(
@@ -0,0 +1,45 @@
+import pytest
+from safeds.data.image.containers import ImageList
+from safeds.data.tabular.containers import Table
+from safeds.exceptions import OutOfBoundsError
+
+
+@pytest.mark.parametrize(
+    ("table", "columns_per_image", "expected_number_of_images"),
+    [
+        (Table(), 1, 0),
+        (Table({"A": [1, 2, 3]}), 1, 1),
+        (Table({"A": [1, 2], "B": ["a", "b"], "C": [1.5, None]}), 1, 3),
+        (Table({"A": [1, 2], "B": ["a", "b"], "C": [1.5, None]}), 2, 2),
+    ],
+    ids=["empty", "one column", "one column per image", "two columns per image"],
+)
+def test_should_plot_tiles_of_columns(table: Table, columns_per_image: int, expected_number_of_images: int) -> None:
+    images = table.plot.histogram_list(columns_per_image=columns_per_image)
+    assert images.number_of_images == expected_number_of_images
+
+
+def test_should_match_histograms_of_single_columns() -> None:
+    table = Table({"A": [1, 2, 2], "B": ["a", "b", "b"]})
+    images = table.plot.histogram_list()
+    assert images == ImageList.from_images(
+        [table.get_column(name).plot.histogram() for name in table.column_names],
+    )
+
+
+def test_should_match_with_multiple_workers() -> None:
+    table = Table({"A": [1, 2, 2], "B": ["a", "b", "b"], "C": [3.5, 1.0, None]})
+    assert table.plot.histogram_list(number_of_workers=2) == table.plot.histogram_list()
+
+
+@pytest.mark.parametrize(
+    ("columns_per_image", "number_of_workers"),
+    [
+        (0, 1),
+        (1, 0),
+    ],
+    ids=["columns per image", "number of workers"],
+)
+def test_should_raise_if_out_of_bounds(columns_per_image: int, number_of_workers: int) -> None:
+    with pytest.raises(OutOfBoundsError):
+        Table({"A": [1]}).plot.histogram_list(columns_per_image=columns_per_image, number_of_workers=number_of_workers)
@@ -1,5 +1,6 @@
 import pytest
 from safeds.data.tabular.containers import Table
+from safeds.exceptions import OutOfBoundsError
 from syrupy import SnapshotAssertion
 
 
@@ -74,3 +75,15 @@ def test_should_match_snapshot(table: Table, snapshot_png_image: SnapshotAsserti
 def test_should_fail_on_empty_table() -> None:
     with pytest.raises(ZeroDivisionError):
         Table().plot.histograms()
+
+
+def test_should_have_same_layout_with_multiple_workers() -> None:
+    table = Table({name: [1, 2, 2, 3] for name in "ABCDE"})
+    histograms = table.plot.histograms(number_of_workers=2)
+    expected = table.plot.histograms()
+    assert histograms.size == expected.size
+
+
+def test_should_raise_if_number_of_workers_is_out_of_bounds() -> None:
+    with pytest.raises(OutOfBoundsError):
+        Table({"A": [1]}).plot.histograms(number_of_workers=0)
@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 from safeds.data.tabular.containers import Table
-from safeds.exceptions import ColumnNotFoundError
+from safeds.exceptions import ColumnNotFoundError, OutOfBoundsError
 from syrupy import SnapshotAssertion
 
 
@@ -10,6 +11,19 @@ def test_should_match_snapshot(snapshot_png_image: SnapshotAssertion) -> None:
     assert scatterplot == snapshot_png_image
 
 
+def test_should_match_snapshot_if_density_is_plotted(snapshot_png_image: SnapshotAssertion) -> None:
+    rng = np.random.default_rng(42)
+    table = Table({"A": rng.normal(size=10_000).tolist(), "B": rng.normal(size=10_000).tolist()})
+    scatterplot = table.plot.scatter_plot("A", "B", maximum_number_of_points=1000)
+    assert scatterplot == snapshot_png_image
+
+
+def test_should_raise_if_maximum_number_of_points_is_out_of_bounds() -> None:
+    table = Table({"A": [1, 2, 3], "B": [2, 4, 7]})
+    with pytest.raises(OutOfBoundsError):
+        table.plot.scatter_plot("A", "B", maximum_number_of_points=-1)
+
+
 @pytest.mark.parametrize(
     ("table", "col1", "col2"),
     [
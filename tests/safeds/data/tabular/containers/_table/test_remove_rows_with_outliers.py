@@ -249,6 +249,13 @@ from safeds.data.tabular.containers import Table
             ),
         ),
         (Table(), Table()),
+        (
+            Table({"col1": [1, 2, 3, 4, 5, 6, 1000, 1000, None]}).remove_rows_by_column(
+                "col1",
+                lambda cell: cell == 1000,
+            ),
+            Table({"col1": [1, 2, 3, 4, 5, 6, None]}),
+        ),
     ],
     ids=[
         "no outliers",
@@ -257,8 +264,29 @@ from safeds.data.tabular.containers import Table
         "multiple outliers in one column",
         "no rows",
         "empty",
+        "lazy",
     ],
 )
 def test_should_remove_rows_with_outliers(table: Table, expected: Table) -> None:
     updated_table = table.remove_rows_with_outliers()
     assert updated_table == expected
+
+
+@pytest.mark.parametrize(
+    ("column_names", "expected"),
+    [
+        (["col1"], Table({"col1": [1, 2, 3, 4, 5, 6, 7], "col2": [1, 1, 1, 1, 1, 1, 1000]})),
+        (["col2"], Table({"col1": [1, 2, 3, 4, 5, 6, 1000], "col2": [1, 1, 1, 1, 1, 1, 1]})),
+        (["col3"], Table({"col1": [1, 2, 3, 4, 5, 6, 1000, 7], "col2": [1, 1, 1, 1, 1, 1, 1, 1000]})),
+    ],
+    ids=["first column", "second column", "non-numeric column"],
+)
+def test_should_only_consider_specified_columns(column_names: list[str], expected: Table) -> None:
+    table = Table(
+        {
+            "col1": [1, 2, 3, 4, 5, 6, 1000, 7],
+            "col2": [1, 1, 1, 1, 1, 1, 1, 1000],
+            "col3": ["a", "b", "c", "d", "e", "f", "g", "h"],
+        },
+    )
+    assert table.remove_rows_with_outliers(column_names, z_score_threshold=2).remove_columns("col3") == expected
@@ -8,11 +8,18 @@ from safeds.data.tabular.containers import Table
         (Table(), Table()),
         (Table({"col1": [1, 2, 3]}), Table({"col1": [3, 2, 1]})),
         (Table({"col1": [1, 2, 3], "col2": [4, 5, 6]}), Table({"col1": [3, 2, 1], "col2": [6, 5, 4]})),
+        (Table({"col1": []}), Table({"col1": []})),
+        (
+            Table({"col1": [0, 1, 2, 3], "col2": [4, 5, 6, 7]}).remove_rows_by_column("col1", lambda cell: cell == 0),
+            Table({"col1": [3, 2, 1], "col2": [7, 6, 5]}),
+        ),
     ],
     ids=[
         "empty",
         "one column",
         "multiple columns",
+        "no rows",
+        "lazy",
     ],
 )
 def test_should_shuffle_rows(table: Table, expected: Table) -> None:
@@ -56,3 +56,12 @@ def test_should_split_empty_table() -> None:
     t1, t2 = Table().split_rows(0.4)
     assert t1.number_of_rows == 0
     assert t2.number_of_rows == 0
+
+
+def test_should_split_into_disjoint_tables() -> None:
+    table = Table({"col1": list(range(100)), "col2": [str(i) for i in range(100)]})
+    first, second = table.remove_rows_by_column("col1", lambda cell: cell >= 90).split_rows(0.5)
+    assert first.number_of_rows == 45
+    assert second.number_of_rows == 45
+    assert sorted(first.get_column("col1").to_list() + second.get_column("col1").to_list()) == list(range(90))
+    assert first.get_column("col2").to_list() == [str(value) for value in first.get_column("col1").to_list()]
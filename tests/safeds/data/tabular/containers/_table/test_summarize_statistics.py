@@ -110,12 +110,33 @@ from safeds.data.tabular.containers import Table
                 },
             ),
         ),
+        (
+            Table({"len": [1.0, None], "0_min": ["a", "a"]}),
+            Table(
+                {
+                    "metric": [
+                        "min",
+                        "max",
+                        "mean",
+                        "median",
+                        "standard deviation",
+                        "distinct value count",
+                        "idness",
+                        "missing value ratio",
+                        "stability",
+                    ],
+                    "len": [1, 1, 1, 1, None, 1, 1, 0.5, 1],
+                    "0_min": ["a", "a", "-", "-", "-", "1", "0.5", "0.0", "1.0"],
+                },
+            ),
+        ),
     ],
     ids=[
         "Column of integers and Column of characters",
         "empty",
         "empty with columns",
         "Column of None",
+        "column names like internal names",
     ],
 )
 def test_should_summarize_statistics(table: Table, expected: Table) -> None:
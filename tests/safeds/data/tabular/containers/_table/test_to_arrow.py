@@ -0,0 +1,23 @@
+import pyarrow as pa
+import pytest
+from safeds.data.tabular.containers import Table
+
+
+@pytest.mark.parametrize(
+    ("table", "expected"),
+    [
+        (Table(), pa.table({})),
+        (Table({"a": [1, 2], "b": ["c", "d"]}), pa.table({"a": [1, 2], "b": pa.array(["c", "d"], pa.large_string())})),
+        (
+            Table({"a": [1, 2, 3]}).remove_rows_by_column("a", lambda cell: cell == 2),
+            pa.table({"a": [1, 3]}),
+        ),
+    ],
+    ids=[
+        "empty",
+        "non-empty",
+        "lazy",
+    ],
+)
+def test_should_return_arrow_table(table: Table, expected: pa.Table) -> None:
+    assert table.to_arrow().equals(expected)
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import pytest
+from safeds.data.tabular.containers import Table
+from safeds.exceptions import FileExtensionError
+
+
+@pytest.mark.parametrize(
+    "table",
+    [
+        Table({"col1": ["col1_1"], "col2": [1]}),
+        Table({"col1": [1, 2, 3]}).remove_rows_by_column("col1", lambda cell: cell > 1),
+        Table(),
+    ],
+    ids=["with data", "lazy", "empty"],
+)
+@pytest.mark.parametrize("path_type", [str, Path], ids=["by String", "by path"])
+def test_should_create_arrow_ipc_file_from_table(table: Table, path_type: type, tmp_path: Path) -> None:
+    path = path_type(tmp_path / "table.arrow")
+    table.to_arrow_ipc_file(path)
+    table_r = Table.from_arrow_ipc_file(path)
+
+    assert table.schema == table_r.schema
+    assert table == table_r
+
+
+def test_should_add_file_extension(tmp_path: Path) -> None:
+    Table({"col1": [1]}).to_arrow_ipc_file(tmp_path / "table")
+    assert (tmp_path / "table.arrow").is_file()
+
+
+def test_should_write_uncompressed_file(tmp_path: Path) -> None:
+    path = tmp_path / "table.arrow"
+    Table({"col1": list(range(10_000))}).to_arrow_ipc_file(path)
+
+    # Compression would shrink these values a lot
+    assert path.stat().st_size >= 10_000 * 8
+
+
+def test_should_raise_error_if_wrong_file_extension(tmp_path: Path) -> None:
+    with pytest.raises(FileExtensionError):
+        Table({"col1": [1]}).to_arrow_ipc_file(tmp_path / "table.invalid_file_extension")
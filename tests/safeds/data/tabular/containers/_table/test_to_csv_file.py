@@ -2,7 +2,7 @@ from pathlib import Path
 from tempfile import NamedTemporaryFile
 
 import pytest
-from safeds.data.tabular.containers import Table
+from safeds.data.tabular.containers import Column, Table
 from safeds.exceptions import FileExtensionError
 
 from tests.helpers import resolve_resource_path
@@ -57,3 +57,17 @@ def test_should_raise_error_if_wrong_file_extension() -> None:
         tmp_table_file.close()
         with Path(tmp_table_file.name).open("w", encoding="utf-8") as tmp_file, pytest.raises(FileExtensionError):
             table.to_csv_file(Path(tmp_file.name))
+
+
+@pytest.mark.parametrize(
+    "table",
+    [
+        Table({"col1": [1, 2, 3]}).remove_rows_by_column("col1", lambda cell: cell > 1),
+        Table({"col1": [1, 2]}).add_columns(Column("col2", [3, 4])),
+    ],
+    ids=["streamable", "not streamable"],
+)
+@pytest.mark.parametrize("streaming", [True, False], ids=["streaming", "in memory"])
+def test_should_write_lazy_table(table: Table, streaming: bool, tmp_path: Path) -> None:
+    table.to_csv_file(tmp_path / "table.csv", streaming=streaming)
+    assert Table.from_csv_file(tmp_path / "table.csv") == table
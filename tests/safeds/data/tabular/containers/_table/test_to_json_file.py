@@ -50,3 +50,23 @@ def test_should_raise_error_if_wrong_file_extension() -> None:
         tmp_table_file.close()
         with Path(tmp_table_file.name).open("w", encoding="utf-8") as tmp_file, pytest.raises(FileExtensionError):
             table.to_json_file(Path(tmp_file.name))
+
+
+@pytest.mark.parametrize(
+    "table",
+    [
+        Table({"col1": list(range(25_000)), "col2": ["a"] * 25_000}),
+        Table({"col1": [1, 2, 3]}).remove_rows_by_column("col1", lambda cell: cell > 1),
+        Table({"col1": [1]}).remove_rows_by_column("col1", lambda cell: cell > 0),
+    ],
+    ids=["several batches", "lazy", "no rows"],
+)
+def test_should_write_same_file_when_streaming(table: Table, tmp_path: Path) -> None:
+    table.to_json_file(tmp_path / "streaming.json", orientation="row", streaming=True)
+    table.to_json_file(tmp_path / "in_memory.json", orientation="row")
+    assert (tmp_path / "streaming.json").read_text() == (tmp_path / "in_memory.json").read_text()
+
+
+def test_should_raise_error_if_streaming_column_orientation(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match=r"row orientation"):
+        Table({"col1": [1]}).to_json_file(tmp_path / "table.json", streaming=True)
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+from safeds.data.tabular.containers import Table
+from safeds.data.tabular.plotting._box_plot_statistics import _compute_box_plot_statistics
+
+
+def test_should_compute_statistics_of_numeric_columns() -> None:
+    table = Table(
+        {
+            "a": [1, 2, 3, 4, 100, None],
+            "b": ["a", "b", "c", "d", "e", "f"],
+            "c": [None, 1.5, None, None, 1.5, None],
+        },
+    )
+    assert_frame_equal(
+        _compute_box_plot_statistics(table),
+        pl.DataFrame(
+            {
+                "column": ["a", "c"],
+                "lower_whisker": [1.0, 1.5],
+                "first_quartile": [2.0, 1.5],
+                "median": [3.0, 1.5],
+                "third_quartile": [4.0, 1.5],
+                "upper_whisker": [4.0, 1.5],
+                "outliers": [[100.0], []],
+            },
+        ),
+    )
+
+
+def test_should_return_null_statistics_for_column_without_values() -> None:
+    table = Table._from_polars_data_frame(pl.DataFrame({"a": [None, None]}, schema={"a": pl.Int64}))
+    statistics = _compute_box_plot_statistics(table)
+    assert statistics.get_column("median").to_list() == [None]
+
+
+def test_should_stream_files(tmp_path: Path) -> None:
+    path = tmp_path / "data.csv"
+    pl.DataFrame({"a": [*range(300_000), 10_000_000]}).write_csv(path)
+    statistics = _compute_box_plot_statistics(Table.from_csv_file(path)).row(0, named=True)
+
+    assert statistics["lower_whisker"] == 0
+    assert statistics["median"] == pytest.approx(150_000, abs=6000)
+    assert statistics["upper_whisker"] == 299_999
+    assert statistics["outliers"] == [10_000_000]
+
+
+def test_should_reuse_quantile_sketches_of_table() -> None:
+    table = Table({"a": [1, 2, 3], "b": [4, 5, 6]})
+    sketches = table._get_quantile_sketches(["a"], 0.01)
+    _compute_box_plot_statistics(table, rank_error=0.01)
+    assert table._get_quantile_sketches(["a", "b"], 0.01)["a"] is sketches["a"]
+
+
+@pytest.mark.parametrize("rank_error", [0.05, 0.01], ids=["5%", "1%"])
+def test_should_estimate_quartiles_within_rank_error(rank_error: float) -> None:
+    table = Table({"a": np.random.default_rng(42).permutation(200_000).tolist()})
+    statistics = _compute_box_plot_statistics(table, rank_error=rank_error).row(0, named=True)
+
+    assert statistics["first_quartile"] == pytest.approx(50_000, abs=rank_error * 200_000)
+    assert statistics["median"] == pytest.approx(100_000, abs=rank_error * 200_000)
+    assert statistics["third_quartile"] == pytest.approx(150_000, abs=rank_error * 200_000)
@@ -0,0 +1,19 @@
+import numpy as np
+import polars as pl
+import pytest
+from safeds.data.tabular.plotting._correlation import _sample_rows
+
+
+def test_should_keep_about_the_given_fraction_of_rows() -> None:
+    data_frame = pl.DataFrame({"a": np.arange(100_000, dtype=np.float64)})
+    assert data_frame.filter(_sample_rows(0.1)).height == pytest.approx(10_000, rel=0.05)
+
+
+def test_should_keep_the_same_rows_every_time() -> None:
+    data_frame = pl.DataFrame({"a": np.arange(1_000, dtype=np.float64)})
+    assert data_frame.filter(_sample_rows(0.5)).equals(data_frame.filter(_sample_rows(0.5)))
+
+
+def test_should_be_streamable() -> None:
+    lazy_frame = pl.LazyFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]}).filter(_sample_rows(0.5))
+    assert lazy_frame.explain(streaming=True).startswith("--- STREAMING")
@@ -0,0 +1,115 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from safeds._config import _set_plot_backend, _set_plot_cache
+from safeds._utils import _random
+from safeds.data.tabular.containers import Column, Table
+from safeds.data.tabular.plotting._plot_cache import _PlotCache
+from safeds.data.tabular.plotting._raster_plot_backend import _RasterPlotBackend
+
+
+@pytest.fixture
+def cache() -> Iterator[_PlotCache]:
+    cache = _PlotCache()
+    _set_plot_cache(cache)
+    yield cache
+    _set_plot_cache(None)
+
+
+@pytest.mark.usefixtures("cache")
+class TestShouldReturnCachedImage:
+    def test_for_equal_table(self) -> None:
+        image = Table({"a": [1, 2, 3]}).plot.histograms()
+        assert Table({"a": [1, 2, 3]}).plot.histograms() is image
+
+    def test_for_equal_column(self) -> None:
+        image = Column("a", [1, 2, 3]).plot.box_plot()
+        assert Column("a", [1, 2, 3]).plot.box_plot() is image
+
+    def test_for_equal_arguments_that_are_passed_differently(self) -> None:
+        table = Table({"a": [1, 2, 3], "b": [3, 1, 2]})
+        image = table.plot.scatter_plot("a", "b")
+        assert table.plot.scatter_plot(x_name="a", y_name="b", maximum_number_of_points=100_000) is image
+
+    def test_for_different_number_of_workers(self) -> None:
+        table = Table({"a": [1, 2, 3], "b": [3, 1, 2]})
+        image = table.plot.histograms()
+        assert table.plot.histograms(number_of_workers=2) is image
+
+    def test_for_derived_table(self) -> None:
+        table = Table({"a": [1, 2, 3], "b": [3, 1, 2]})
+        image = table.remove_columns("b").plot.histograms()
+        assert table.remove_columns("b").plot.histograms() is image
+
+
+@pytest.mark.usefixtures("cache")
+class TestShouldRenderAgain:
+    def test_for_different_values(self) -> None:
+        image = Table({"a": [1, 2, 3]}).plot.histograms()
+        assert Table({"a": [1, 2, 4]}).plot.histograms() is not image
+
+    def test_for_different_arguments(self) -> None:
+        table = Table({"a": [1, 2, 3]})
+        image = table.plot.histograms()
+        assert table.plot.histograms(maximum_number_of_bins=2) is not image
+
+    def test_for_different_methods(self) -> None:
+        table = Table({"a": [1, 2, 3], "b": [3, 1, 2]})
+        image = table.plot.scatter_plot("a", "b")
+        assert table.plot.line_plot("a", "b") is not image
+
+    def test_for_different_random_seeds(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        table = Table({"a": [1, 2, 3, 4], "b": [4, 1, 3, 2]})
+        image = table.plot.correlation_heatmap(maximum_number_of_rows=2)
+        monkeypatch.setattr(_random, "_get_random_seed", lambda: 0)
+        assert table.plot.correlation_heatmap(maximum_number_of_rows=2) is not image
+
+    def test_for_table_read_from_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "table.csv"
+        Table({"a": [1, 2, 3]}).to_csv_file(path)
+        image = Table.from_csv_file(path).plot.histograms()
+        assert Table.from_csv_file(path).plot.histograms() is not image
+
+    def test_for_different_backends(self) -> None:
+        table = Table({"a": [1, 2, 3]})
+        image = table.plot.histograms()
+        try:
+            _set_plot_backend(_RasterPlotBackend())
+            assert table.plot.histograms() is not image
+        finally:
+            _set_plot_backend(None)
+
+
+def test_should_evict_least_recently_used_image() -> None:
+    cache = _PlotCache(maximum_number_of_images=2)
+    images = [Column("a", [index]).plot.box_plot() for index in range(3)]
+    cache.put("a", images[0])
+    cache.put("b", images[1])
+    cache.get("a")
+    cache.put("c", images[2])
+
+    assert cache.get("a") is images[0]
+    assert cache.get("b") is None
+    assert cache.get("c") is images[2]
+
+
+def test_should_load_images_from_directory(tmp_path: Path) -> None:
+    table = Table({"a": [1, 2, 3]})
+    try:
+        _set_plot_cache(_PlotCache(directory=tmp_path))
+        image = table.plot.histograms()
+
+        _set_plot_cache(_PlotCache(directory=tmp_path))
+        assert table.plot.histograms() == image
+    finally:
+        _set_plot_cache(None)
+
+
+def test_should_clear_directory(tmp_path: Path) -> None:
+    cache = _PlotCache(directory=tmp_path)
+    cache.put("a", Column("a", [1]).plot.box_plot())
+    cache.clear()
+
+    assert cache.get("a") is None
+    assert list(tmp_path.iterdir()) == []
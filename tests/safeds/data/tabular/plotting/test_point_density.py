@@ -0,0 +1,45 @@
+import numpy as np
+import polars as pl
+import pytest
+from safeds.data.tabular.plotting._point_density import _compute_point_density
+
+
+def test_should_count_every_finite_point() -> None:
+    rng = np.random.default_rng(42)
+    x = pl.Series(rng.normal(size=1_000_000))
+    y = pl.Series(rng.normal(size=1_000_000))
+    counts, _, _ = _compute_point_density(x, y)
+    assert counts.sum() == 1_000_000
+
+
+@pytest.mark.parametrize(
+    ("x", "y", "expected_x_limits", "expected_y_limits"),
+    [
+        ([], [], (0, 1), (0, 1)),
+        ([1, 1], [2, 2], (0.5, 1.5), (1.5, 2.5)),
+        ([1, 3, None], [2, 5, 9], (1, 3), (2, 5)),
+        ([1, 3, float("inf")], [2, 5, 9], (1, 3), (2, 5)),
+    ],
+    ids=[
+        "empty",
+        "single value",
+        "missing value",
+        "infinite value",
+    ],
+)
+def test_should_cover_finite_points(
+    x: list,
+    y: list,
+    expected_x_limits: tuple[float, float],
+    expected_y_limits: tuple[float, float],
+) -> None:
+    counts, x_limits, y_limits = _compute_point_density(pl.Series(x, dtype=pl.Float64), pl.Series(y, dtype=pl.Float64))
+    assert x_limits == expected_x_limits
+    assert y_limits == expected_y_limits
+    assert counts.sum() == min(len(x), 2)
+
+
+def test_should_put_smallest_coordinates_into_first_row_and_column() -> None:
+    counts, _, _ = _compute_point_density(pl.Series([0.0, 0.0, 10.0]), pl.Series([0.0, 0.0, 10.0]))
+    assert counts[0, 0] == 2
+    assert counts[-1, -1] == 1
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from safeds.data.tabular.plotting._quantile_sketch import _QuantileSketch
+
+
+@pytest.mark.parametrize(
+    ("values", "quantile", "expected"),
+    [
+        ([3.0, 1.0, 2.0], 0, 1.0),
+        ([3.0, 1.0, 2.0], 0.5, 2.0),
+        ([3.0, 1.0, 2.0], 1, 3.0),
+        ([4.0, 1.0, 3.0, 2.0, 5.0], 0.25, 2.0),
+        ([1.0, 2.0, 3.0, 4.0], 0.5, 2.5),
+        ([1.0, np.nan, 2.0], 1, 2.0),
+    ],
+    ids=["minimum", "median", "maximum", "first quartile", "interpolated", "NaN"],
+)
+def test_should_match_numpy_if_capacity_is_not_exceeded(values: list[float], quantile: float, expected: float) -> None:
+    sketch = _QuantileSketch()
+    sketch.update(np.array(values))
+    assert sketch.quantile(quantile) == expected
+
+
+def test_should_return_none_if_empty() -> None:
+    assert _QuantileSketch().quantile(0.5) is None
+
+
+@pytest.mark.parametrize("quantile", [0.01, 0.25, 0.5, 0.75, 0.99])
+def test_should_estimate_quantile_of_many_values(quantile: float) -> None:
+    values = np.random.default_rng(42).permutation(100_000).astype(np.float64)
+    sketch = _QuantileSketch()
+    for chunk in np.array_split(values, 37):
+        sketch.update(chunk)
+
+    assert sketch.count == 100_000
+    assert sketch.quantile(quantile) == pytest.approx(quantile * 100_000, abs=0.02 * 100_000)
+
+
+def test_should_merge_sketches() -> None:
+    values = np.random.default_rng(42).normal(size=50_000)
+    left = _QuantileSketch()
+    left.update(values[:20_000])
+    right = _QuantileSketch()
+    right.update(values[20_000:])
+    left.merge(right)
+
+    assert left.count == 50_000
+    assert left.quantile(0.5) == pytest.approx(np.median(values), abs=0.05)
+
+
+@pytest.mark.parametrize("rank_error", [0.05, 0.01, 0.001], ids=["5%", "1%", "0.1%"])
+def test_should_estimate_quantiles_within_rank_error(rank_error: float) -> None:
+    values = np.random.default_rng(42).permutation(1_000_000).astype(np.float64)
+    sketch = _QuantileSketch(rank_error)
+    sketch.update(values)
+
+    for quantile in np.linspace(0.01, 0.99, 99):
+        assert sketch.quantile(quantile) == pytest.approx(quantile * 1_000_000, abs=rank_error * 1_000_000)
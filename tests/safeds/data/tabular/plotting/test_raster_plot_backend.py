@@ -0,0 +1,73 @@
+from collections.abc import Callable, Iterator
+from functools import partial
+
+import pytest
+from safeds._config import _set_plot_backend
+from safeds.data.image.containers import Image
+from safeds.data.tabular.containers import Column, Table
+from safeds.data.tabular.plotting._raster_plot_backend import _RasterPlotBackend
+
+
+@pytest.fixture(autouse=True)
+def _use_raster_backend() -> Iterator[None]:
+    _set_plot_backend(_RasterPlotBackend())
+    yield
+    _set_plot_backend(None)
+
+
+@pytest.mark.parametrize(
+    ("plot", "arguments", "width", "height"),
+    [
+        (Column("a", [1, 2, 3, None, 10]).plot.box_plot, (), 640, 480),
+        (partial(Column("a", [1, 2, 3, None, 10]).plot.box_plot, rank_error=0.01), (), 640, 480),
+        (Column("a", [1, 2, 3, 2]).plot.lag_plot, (1,), 640, 480),
+        (Table({"a": [1, 2], "b": [3, 42]}).plot.box_plots, (), 600, 300),
+        (partial(Table({"a": [1, 2], "b": [3, 42]}).plot.box_plots, streaming=True), (), 600, 300),
+        (Table({"a": [1, 2, 3], "b": [3, 1, 2]}).plot.correlation_heatmap, (), 640, 480),
+        (Table({"a": [1, 2, 3, 4]}).plot.histograms, (), 640, 480),
+        (Table({"a": [1, 2], "b": ["x", "y"], "c": [1.5, None], "d": [True, False]}).plot.histograms, (), 900, 600),
+        (Table({"a": [1, 2, 3, 1], "b": [2, 3, 4, 6]}).plot.line_plot, ("a", "b"), 640, 480),
+        (Table({"a": [1, 2, 3], "b": [2, None, 4]}).plot.scatter_plot, ("a", "b"), 640, 480),
+        (
+            partial(Table({"a": [1, 2, 3], "b": [2, None, 4]}).plot.scatter_plot, maximum_number_of_points=0),
+            ("a", "b"),
+            640,
+            480,
+        ),
+    ],
+    ids=[
+        "box plot",
+        "approximate box plot",
+        "lag plot",
+        "box plots",
+        "box plots from statistics",
+        "correlation heatmap",
+        "histogram",
+        "histograms in grid",
+        "line plot",
+        "scatter plot",
+        "density plot",
+    ],
+)
+def test_should_draw_plot(plot: Callable[..., Image], arguments: tuple, width: int, height: int) -> None:
+    image = plot(*arguments)
+    assert image.width == width
+    assert image.height == height
+    assert image.channel == 4
+
+
+def test_should_draw_bars_with_height_of_counts() -> None:
+    image = Table({"a": [1, 1, 1, 2]}).plot.histograms(maximum_number_of_bins=2)
+    pixels = image._image_tensor.cpu()
+    is_blue = (pixels[0] == 31) & (pixels[1] == 119) & (pixels[2] == 180)
+    heights = is_blue.sum(dim=0)
+    left_bar = heights[: image.width // 2].max().item()
+    right_bar = heights[image.width // 2 :].max().item()
+    assert left_bar == pytest.approx(3 * right_bar, abs=3)
+
+
+def test_should_draw_nothing_but_white_outside_of_panels() -> None:
+    image = Table({"a": [1, 2, 3]}).plot.histograms()
+    pixels = image._image_tensor.cpu()
+    assert (pixels[:, :10, :] == 255).all()
+    assert (pixels[:, :, :10] == 255).all()
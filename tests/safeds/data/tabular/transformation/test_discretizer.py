@@ -1,3 +1,5 @@
+from typing import Literal
+
 import pytest
 from safeds.data.tabular.containers import Table
 from safeds.data.tabular.transformation import Discretizer
@@ -9,6 +11,10 @@ class TestInit:
         with pytest.raises(OutOfBoundsError):
             _ = Discretizer(1)
 
+    def test_should_raise_if_strategy_is_unknown(self) -> None:
+        with pytest.raises(ValueError, match=r"Unknown strategy 'linear'"):
+            _ = Discretizer(strategy="linear")  # type: ignore[arg-type]
+
 
 class TestFit:
     @pytest.mark.parametrize(
@@ -71,7 +77,7 @@ class TestFit:
         transformer = Discretizer()
         transformer.fit(table, None)
 
-        assert transformer._wrapped_transformer is None
+        assert transformer._bin_edges is None
         assert transformer._column_names is None
 
 
@@ -265,3 +271,53 @@ class TestFitAndTransform:
         )
 
         assert table == expected
+
+
+class TestStrategy:
+    @pytest.mark.parametrize(
+        ("strategy", "expected"),
+        [
+            ("uniform", [0.0, 0.0, 0.0, 1.0, 1.0, 2.0, 2.0]),
+            ("quantile", [0.0, 0.0, 1.0, 1.0, 2.0, 2.0, 2.0]),
+            ("kmeans", [0.0, 0.0, 0.0, 1.0, 1.0, 2.0, 2.0]),
+        ],
+        ids=["uniform", "quantile", "kmeans"],
+    )
+    def test_should_compute_bins_with_strategy(
+        self,
+        strategy: Literal["uniform", "quantile", "kmeans"],
+        expected: list[float],
+    ) -> None:
+        table = Table({"col1": [0.0, 1.0, 2.0, 10.0, 11.0, 20.0, 30.0]})
+        transformed_table = Discretizer(3, strategy=strategy).fit_and_transform(table)[1]
+        assert transformed_table == Table({"col1": expected})
+
+    @pytest.mark.parametrize(
+        "strategy",
+        ["uniform", "quantile", "kmeans"],
+        ids=["uniform", "quantile", "kmeans"],
+    )
+    def test_should_keep_missing_values(self, strategy: Literal["uniform", "quantile", "kmeans"]) -> None:
+        table = Table({"col1": [0.0, None, 10.0]})
+        transformed_table = Discretizer(2, strategy=strategy).fit_and_transform(table)[1]
+        assert transformed_table == Table({"col1": [0.0, None, 1.0]})
+
+    @pytest.mark.parametrize(
+        "strategy",
+        ["uniform", "quantile", "kmeans"],
+        ids=["uniform", "quantile", "kmeans"],
+    )
+    def test_should_put_constant_columns_into_one_bin(self, strategy: Literal["uniform", "quantile", "kmeans"]) -> None:
+        table = Table({"col1": [1, 1, 1], "col2": [None, None, None]})
+        transformed_table = Discretizer(2, strategy=strategy).fit_and_transform(table, ["col1"])[1]
+        assert transformed_table == Table({"col1": [0.0, 0.0, 0.0], "col2": [None, None, None]})
+
+    def test_should_put_values_outside_fitted_range_into_outer_bins(self) -> None:
+        fitted_transformer = Discretizer(2, strategy="uniform").fit(Table({"col1": [0.0, 10.0]}), None)
+        transformed_table = fitted_transformer.transform(Table({"col1": [-5.0, 5.0, 15.0]}))
+        assert transformed_table == Table({"col1": [0.0, 1.0, 1.0]})
+
+    def test_should_transform_lazily(self) -> None:
+        table = Table({"col1": [0.0, 5.0, 10.0]})
+        transformed_table = Discretizer(2).fit_and_transform(table)[1]
+        assert "cut" in transformed_table.explain()
@@ -1,3 +1,5 @@
+import warnings
+
 import pytest
 from safeds.data.tabular.containers import Table
 from safeds.data.tabular.transformation import LabelEncoder
@@ -139,6 +141,43 @@ class TestFitAndTransform:
         assert fitted_transformer.is_fitted
         assert transformed_table == expected
 
+    @pytest.mark.parametrize(
+        ("partial_order", "table_to_transform", "expected"),
+        [
+            (
+                None,
+                Table({"col1": ["c", None, "d", "a"]}),
+                [2, None, None, 0],
+            ),
+            (
+                ["c", "x"],
+                Table({"col1": ["c", None, "d", "a"]}),
+                [0, None, None, 2],
+            ),
+        ],
+        ids=["unknown values", "partial order"],
+    )
+    def test_should_encode_values_of_string_columns(
+        self,
+        partial_order: list[str] | None,
+        table_to_transform: Table,
+        expected: list[int | None],
+    ) -> None:
+        table_to_fit = Table({"col1": ["a", "b", None, "c"]})
+        transformer = LabelEncoder(partial_order=partial_order).fit(table_to_fit, None)
+
+        transformed_table = transformer.transform(table_to_transform)
+        assert transformed_table.get_column("col1").to_list() == expected
+
+    def test_should_encode_values_of_non_string_columns(self) -> None:
+        table = Table({"col1": [3, 1, None, 3]})
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            transformed_table = LabelEncoder(partial_order=[3]).fit_and_transform(table, ["col1"])[1]
+
+        assert transformed_table.get_column("col1").to_list() == [0, 1, None, 0]
+
     def test_should_not_change_original_table(self) -> None:
         table = Table(
             {
@@ -174,6 +213,12 @@ class TestInverseTransform:
 
         assert transformer.inverse_transform(transformer.transform(table)) == table
 
+    def test_should_replace_unknown_labels_with_missing_values(self) -> None:
+        transformer = LabelEncoder(partial_order=["c"]).fit(Table({"col1": ["a", "c"]}), None)
+        original_table = transformer.inverse_transform(Table({"col1": [1, 0, 2, -1, None]}))
+
+        assert original_table == Table({"col1": ["a", "c", None, None, None]})
+
     def test_should_not_change_transformed_table(self) -> None:
         table = Table(
             {
@@ -4,7 +4,7 @@ import warnings
 import pytest
 from polars.testing import assert_frame_equal
 from safeds.data.tabular.containers import Table
-from safeds.data.tabular.transformation import OneHotEncoder
+from safeds.data.tabular.transformation import OneHotEncoder, _one_hot_encoder
 from safeds.exceptions import (
     ColumnNotFoundError,
     ColumnTypeError,
@@ -396,3 +396,54 @@ class TestInverseTransform:
             OneHotEncoder().fit(Table({"col1": ["one", "two"]}), ["col1"]).inverse_transform(
                 Table({"col1__one": ["1", "null"], "col1__two": ["2", "ok"]}),
             )
+
+
+class TestSeparator:
+    def test_should_keep_separator_after_fitting(self) -> None:
+        table = Table({"col1": ["a", "b"]})
+        fitted_transformer, transformed_table = OneHotEncoder(separator="_").fit_and_transform(table)
+
+        assert fitted_transformer == OneHotEncoder(separator="_").fit(table, None)
+        assert transformed_table.column_names == ["col1_a", "col1_b"]
+
+
+class TestManyDistinctValues:
+    @pytest.fixture
+    def table(self) -> Table:
+        return Table(
+            {
+                "id": list(range(300)),
+                "col1": [f"value{index % 150}" if index % 7 != 0 else None for index in range(300)],
+                "col2": [index % 3 for index in range(300)],
+            },
+        )
+
+    def test_should_transform_like_expressions(self, table: Table, monkeypatch: pytest.MonkeyPatch) -> None:
+        transformer = OneHotEncoder().fit(table, ["col1", "col2"])
+        transformed_table = transformer.transform(table)
+
+        # Encode the same table with one expression per new column
+        monkeypatch.setattr(_one_hot_encoder, "_MAXIMUM_NUMBER_OF_EXPRESSIONS", 1_000_000)
+        expected = transformer.transform(table)
+
+        assert transformed_table.schema == expected.schema
+        assert transformed_table == expected
+
+    def test_should_encode_unknown_values_as_zeros(self, table: Table) -> None:
+        transformer = OneHotEncoder().fit(table, ["col1"])
+        transformed_table = transformer.transform(Table({"id": [0], "col1": ["unknown"]}))
+
+        assert transformed_table.remove_columns("id")._data_frame.sum_horizontal().to_list() == [0]
+
+    def test_should_return_original_table(self, table: Table) -> None:
+        transformer, transformed_table = OneHotEncoder().fit_and_transform(table, ["col1", "col2"])
+        original_table = transformer.inverse_transform(transformed_table)
+
+        assert original_table.schema == table.schema
+        assert original_table == table
+
+    def test_should_filter_after_transform(self, table: Table) -> None:
+        transformer = OneHotEncoder().fit(table, ["col1"])
+        transformed_table = transformer.transform(table).remove_rows(lambda row: row.get_value("col1__value1") == 0)
+
+        assert transformed_table.get_column("id").to_list() == [1, 151]
@@ -44,6 +44,43 @@ class TestFit:
         assert transformer._data_max is None
 
 
+class TestPartialFit:
+    @pytest.mark.parametrize(
+        "batch_size",
+        [1, 2, 5],
+        ids=["1", "2", "5"],
+    )
+    def test_should_learn_same_transformation_as_fit(self, batch_size: int) -> None:
+        table = Table(
+            {
+                "col1": [None, 2.0, 0.0, 1.0, 3.0],
+                "col2": [5, 2, 3, 4, 1],
+            },
+        )
+
+        transformer = RangeScaler()
+        for batch in table.iter_batches(batch_size):
+            transformer = transformer.partial_fit(batch, None)
+
+        expected = RangeScaler().fit(table, None)
+        assert transformer.transform(table) == expected.transform(table)
+
+    def test_should_continue_fit(self) -> None:
+        table = Table({"col1": [0.0, 1.0, 2.0, 3.0]})
+
+        transformer = RangeScaler().fit(table.slice_rows(length=2), None)
+        transformer = transformer.partial_fit(table.slice_rows(start=2), None)
+
+        assert transformer.transform(table) == Table({"col1": [0.0, 1 / 3, 2 / 3, 1.0]})
+
+    def test_should_raise_if_column_names_differ(self) -> None:
+        table = Table({"col1": [0.0, 1.0], "col2": [0.0, 1.0]})
+        transformer = RangeScaler().fit(table, ["col1"])
+
+        with pytest.raises(ValueError, match=r"was fitted on the columns \['col1'\]"):
+            transformer.partial_fit(table, ["col2"])
+
+
 class TestTransform:
     def test_should_raise_if_column_not_found(self) -> None:
         table_to_fit = Table(
@@ -213,6 +213,76 @@ class TestFit:
         assert transformer._replacement is None
 
 
+class TestPartialFit:
+    @pytest.mark.parametrize("strategy", strategies(), ids=lambda x: x.__class__.__name__)
+    @pytest.mark.parametrize(
+        "batch_size",
+        [1, 3, 8],
+        ids=["1", "3", "8"],
+    )
+    def test_should_learn_same_transformation_as_fit(self, strategy: SimpleImputer.Strategy, batch_size: int) -> None:
+        table = Table(
+            {
+                "a": [3, 1, None, 7, 2, 2, None, 8],
+                "b": [None, None, None, 1.5, 0.5, 0.5, 2.0, None],
+                "count": [1, 1, 2, 2, 2, None, 3, 3],
+            },
+        )
+
+        transformer = SimpleImputer(strategy)
+        for batch in table.iter_batches(batch_size):
+            transformer = transformer.partial_fit(batch, None)
+
+        expected = SimpleImputer(strategy).fit(table, None)
+        assert transformer.transform(table) == expected.transform(table)
+
+    def test_should_merge_value_counts_of_non_numeric_columns(self) -> None:
+        table = Table({"a": ["x", "y", None, "y", "x", "x"]})
+
+        transformer = SimpleImputer(SimpleImputer.Strategy.mode()).partial_fit(table.slice_rows(length=3), None)
+        transformer = transformer.partial_fit(table.slice_rows(start=3), None)
+
+        assert transformer._replacement == {"a": "x"}
+
+    def test_should_estimate_median_of_many_values(self) -> None:
+        table = Table({"a": [float(value) for value in range(100_000)] + [None]})
+
+        transformer = SimpleImputer(SimpleImputer.Strategy.median())
+        for batch in table.iter_batches(30_000):
+            transformer = transformer.partial_fit(batch, None)
+
+        # The median lies between the 49.9th and the 50.1st percentile
+        assert transformer._replacement["a"].item() == pytest.approx(50_000, abs=100)
+
+    def test_should_not_change_previous_median(self) -> None:
+        first = Table({"a": [1, 2, None]})
+        transformer = SimpleImputer(SimpleImputer.Strategy.median()).partial_fit(first, None)
+
+        transformer.partial_fit(Table({"a": [10, 20, 30]}), None)
+
+        assert transformer._replacement["a"].item() == 1.5
+        assert SimpleImputer(SimpleImputer.Strategy.median()).partial_fit(first, None)._replacement["a"].item() == 1.5
+
+    def test_should_raise_if_fitted_with_fit(self) -> None:
+        table = Table({"a": [1, None]})
+        transformer = SimpleImputer(SimpleImputer.Strategy.mean()).fit(table, None)
+
+        with pytest.raises(ValueError, match=r"fitted with `fit`"):
+            transformer.partial_fit(table, None)
+
+    def test_should_raise_if_column_names_differ(self) -> None:
+        table = Table({"a": [1, None], "b": [1, None]})
+        transformer = SimpleImputer(SimpleImputer.Strategy.mean()).partial_fit(table, ["a"])
+
+        with pytest.raises(ValueError, match=r"was fitted on the columns \['a'\]"):
+            transformer.partial_fit(table, ["b"])
+
+    @pytest.mark.parametrize("strategy", strategies(), ids=lambda x: x.__class__.__name__)
+    def test_should_raise_if_table_contains_no_rows(self, strategy: SimpleImputer.Strategy) -> None:
+        with pytest.raises(ValueError, match=r"The SimpleImputer cannot be fitted because the table contains 0 rows"):
+            SimpleImputer(strategy).partial_fit(Table({"col1": []}), None)
+
+
 class TestTransform:
     @pytest.mark.parametrize("strategy", strategies(), ids=lambda x: x.__class__.__name__)
     def test_should_raise_if_column_not_found(self, strategy: SimpleImputer.Strategy) -> None:
@@ -43,6 +43,53 @@ class TestFit:
         assert transformer._data_standard_deviation is None
 
 
+class TestPartialFit:
+    @pytest.mark.parametrize(
+        "batch_size",
+        [1, 2, 5],
+        ids=["1", "2", "5"],
+    )
+    def test_should_learn_same_transformation_as_fit(self, batch_size: int) -> None:
+        table = Table(
+            {
+                "col1": [1_000_000.0, 1_000_002.0, None, 1_000_001.0, 999_999.0],
+                "col2": [1, 2, 3, 4, 5],
+            },
+        )
+
+        transformer = StandardScaler()
+        for batch in table.iter_batches(batch_size):
+            transformer = transformer.partial_fit(batch, None)
+
+        expected = StandardScaler().fit(table, None)
+        assert_tables_equal(transformer.transform(table), expected.transform(table))
+
+    def test_should_continue_fit(self) -> None:
+        table = Table({"col1": [0.0, 1.0, 2.0, 3.0]})
+
+        transformer = StandardScaler().fit(table.slice_rows(length=2), None)
+        transformer = transformer.partial_fit(table.slice_rows(start=2), None)
+
+        expected = StandardScaler().fit(table, None)
+        assert_tables_equal(transformer.transform(table), expected.transform(table))
+
+    def test_should_raise_if_column_names_differ(self) -> None:
+        table = Table({"col1": [0.0, 1.0], "col2": [0.0, 1.0]})
+        transformer = StandardScaler().fit(table, ["col1"])
+
+        with pytest.raises(ValueError, match=r"was fitted on the columns \['col1'\]"):
+            transformer.partial_fit(table, ["col2"])
+
+    def test_should_not_change_original_transformer(self) -> None:
+        table = Table({"col1": [0.0, 1.0]})
+        transformer = StandardScaler().fit(table, None)
+
+        transformer.partial_fit(Table({"col1": [10.0]}), None)
+
+        assert transformer._data_mean is not None
+        assert transformer._data_mean.item(0, "col1") == 0.5
+
+
 class TestTransform:
     def test_should_raise_if_column_not_found(self) -> None:
         table_to_fit = Table(
@@ -10,6 +10,7 @@ from safeds.data.tabular.transformation import (
     SimpleImputer,
     StandardScaler,
     TableTransformer,
+    TransformerPipeline,
 )
 
 
@@ -29,6 +30,7 @@ def transformers_numeric() -> list[TableTransformer]:
         StandardScaler(),
         RangeScaler(),
         Discretizer(),
+        TransformerPipeline([(StandardScaler(), None)]),
     ]
 
 
@@ -0,0 +1,200 @@
+from typing import Any
+
+import pytest
+from safeds.data.tabular.containers import Table
+from safeds.data.tabular.transformation import (
+    Discretizer,
+    LabelEncoder,
+    OneHotEncoder,
+    RangeScaler,
+    SimpleImputer,
+    StandardScaler,
+    TableTransformer,
+    TransformerPipeline,
+)
+from safeds.data.tabular.transformation import _transformer_pipeline
+from safeds.exceptions import ColumnNotFoundError, TransformerNotFittedError
+
+
+@pytest.fixture
+def table() -> Table:
+    return Table(
+        {
+            "a": [1.0, None, 3.0, 10.0],
+            "b": [4, 5, 6, 7],
+            "c": ["x", "y", None, "x"],
+            "d": ["u", "u", "v", "w"],
+        },
+    )
+
+
+@pytest.fixture
+def number_of_aggregation_queries(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    counter = [0]
+    compute_aggregations = _transformer_pipeline._compute_aggregations
+
+    def counting_compute_aggregations(*args: Any, **kwargs: Any) -> Any:
+        counter[0] += 1
+        return compute_aggregations(*args, **kwargs)
+
+    monkeypatch.setattr(_transformer_pipeline, "_compute_aggregations", counting_compute_aggregations)
+    return counter
+
+
+def fit_and_transform_one_by_one(
+    steps: list[tuple[TableTransformer, list[str] | None]],
+    table: Table,
+) -> Table:
+    for transformer, column_names in steps:
+        table = transformer.fit_and_transform(table, column_names)[1]
+    return table
+
+
+class TestFit:
+    @pytest.mark.parametrize(
+        ("steps", "expected_number_of_queries"),
+        [
+            ([], 0),
+            (
+                [
+                    (SimpleImputer(SimpleImputer.Strategy.mean()), ["a"]),
+                    (StandardScaler(), ["b"]),
+                    (LabelEncoder(), ["c"]),
+                    (OneHotEncoder(), ["d"]),
+                ],
+                1,
+            ),
+            (
+                [
+                    (SimpleImputer(SimpleImputer.Strategy.median()), ["a"]),
+                    (RangeScaler(), ["a", "b"]),
+                    (SimpleImputer(SimpleImputer.Strategy.mode()), ["c"]),
+                    (OneHotEncoder(), ["c"]),
+                ],
+                3,
+            ),
+            (
+                [
+                    (OneHotEncoder(), ["d"]),
+                    (StandardScaler(), ["d__u", "b"]),
+                ],
+                2,
+            ),
+            (
+                [
+                    (SimpleImputer(SimpleImputer.Strategy.constant(0)), None),
+                    (StandardScaler(), None),
+                    (LabelEncoder(), None),
+                ],
+                3,
+            ),
+            (
+                [
+                    (SimpleImputer(SimpleImputer.Strategy.mean()), ["a"]),
+                    (Discretizer(2, strategy="kmeans"), ["a", "b"]),
+                    (LabelEncoder(), ["c"]),
+                ],
+                2,
+            ),
+        ],
+        ids=[
+            "no steps",
+            "independent steps",
+            "dependent steps",
+            "new columns",
+            "default columns",
+            "step that needs data",
+        ],
+    )
+    def test_should_fit_like_steps_one_by_one(
+        self,
+        table: Table,
+        steps: list[tuple[TableTransformer, list[str] | None]],
+        expected_number_of_queries: int,
+        number_of_aggregation_queries: list[int],
+    ) -> None:
+        actual = TransformerPipeline(steps).fit_and_transform(table)[1]
+        expected = fit_and_transform_one_by_one(steps, table)
+
+        assert actual.schema == expected.schema
+        assert actual == expected
+        assert number_of_aggregation_queries[0] == expected_number_of_queries
+
+    def test_should_use_column_names_for_steps_without_their_own(self, table: Table) -> None:
+        pipeline = TransformerPipeline([(RangeScaler(), None), (StandardScaler(), ["b"])])
+        fitted_pipeline = pipeline.fit(table, ["a"])
+
+        assert fitted_pipeline._column_names == ["a", "b"]
+
+    def test_should_raise_if_column_not_found(self, table: Table) -> None:
+        with pytest.raises(ColumnNotFoundError):
+            TransformerPipeline([(StandardScaler(), ["b"]), (RangeScaler(), ["e"])]).fit(table, None)
+
+    def test_should_raise_if_table_contains_no_rows(self) -> None:
+        with pytest.raises(ValueError, match=r"The StandardScaler cannot be fitted because the table contains 0 rows"):
+            TransformerPipeline([(StandardScaler(), None)]).fit(Table({"col1": []}), None)
+
+    def test_should_not_change_original_transformer(self, table: Table) -> None:
+        pipeline = TransformerPipeline([(StandardScaler(), ["b"])])
+        pipeline.fit(table, None)
+
+        assert not pipeline.is_fitted
+        assert pipeline._fitted_steps is None
+
+
+class TestTransform:
+    def test_should_raise_if_not_fitted(self, table: Table) -> None:
+        with pytest.raises(TransformerNotFittedError):
+            TransformerPipeline([]).transform(table)
+
+    def test_should_raise_if_column_not_found(self, table: Table) -> None:
+        pipeline = TransformerPipeline([(StandardScaler(), ["b"])]).fit(table, None)
+
+        with pytest.raises(ColumnNotFoundError):
+            pipeline.transform(table.remove_columns("b"))
+
+
+class TestInverseTransform:
+    def test_should_restore_original_table(self, table: Table) -> None:
+        pipeline = TransformerPipeline(
+            [
+                (RangeScaler(), ["b"]),
+                (StandardScaler(), ["b"]),
+                (LabelEncoder(), ["c"]),
+                (OneHotEncoder(), ["d"]),
+            ],
+        )
+        fitted_pipeline, transformed_table = pipeline.fit_and_transform(table)
+        restored_table = fitted_pipeline.inverse_transform(transformed_table)
+
+        assert restored_table.remove_columns_except(table.column_names) == table.remove_columns("d").add_columns(
+            table.get_column("d"),
+        )
+
+    def test_should_skip_steps_that_cannot_be_inverted(self, table: Table) -> None:
+        pipeline = TransformerPipeline(
+            [
+                (SimpleImputer(SimpleImputer.Strategy.constant(0.0)), ["a"]),
+                (StandardScaler(), ["a"]),
+            ],
+        )
+        fitted_pipeline, transformed_table = pipeline.fit_and_transform(table)
+        restored_table = fitted_pipeline.inverse_transform(transformed_table)
+
+        assert restored_table.get_column("a").to_list() == pytest.approx([1.0, 0.0, 3.0, 10.0])
+
+    def test_should_raise_if_not_fitted(self, table: Table) -> None:
+        with pytest.raises(TransformerNotFittedError):
+            TransformerPipeline([]).inverse_transform(table)
+
+
+class TestFittedSteps:
+    def test_should_return_fitted_steps(self, table: Table) -> None:
+        fitted_pipeline = TransformerPipeline([(StandardScaler(), ["b"]), (LabelEncoder(), ["c"])]).fit(table, None)
+
+        assert [step.__class__ for step in fitted_pipeline.fitted_steps] == [StandardScaler, LabelEncoder]
+        assert all(step.is_fitted for step in fitted_pipeline.fitted_steps)
+
+    def test_should_raise_if_not_fitted(self) -> None:
+        with pytest.raises(TransformerNotFittedError):
+            _ = TransformerPipeline([]).fitted_steps